@@ -0,0 +1,348 @@
+"""Benchmarks for the path launcher's hot paths at 1k, 10k and 100k paths
+
+Builds synthetic catalogs in a temporary directory and times loading,
+searching, saving, module import and command line start-up without a
+display. When a display is available, or Xvfb can be started, it also
+times rendering the tree in the real window, time to first paint with
+and without a startup snapshot, and how long a key pressed while the
+window is being built waits to be handled. Results go to a JSON file so
+runs can be compared:
+
+    python benchmarks/run_benchmarks.py
+    python benchmarks/run_benchmarks.py --sizes 1000 10000 --compare benchmarks/results/old.json
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import shutil
+import string
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from path_store import SEARCH_LIMIT, PathStore, make_record  # noqa: E402
+from startup_snapshot import SNAPSHOT_FILE, read_snapshot, write_snapshot  # noqa: E402
+from storage import JsonStorage, SqliteStorage  # noqa: E402
+
+DEFAULT_SIZES = (1000, 10000, 100000)
+RESULTS_DIR = os.path.join(ROOT, 'benchmarks', 'results')
+
+
+def synthetic_records(size, seed=1):
+    rng = random.Random(seed)
+    words = [''.join(rng.choices(string.ascii_lowercase, k=rng.randint(3, 9))) for _ in range(2000)]
+    records = []
+    for i in range(size):
+        parts = rng.choices(words, k=rng.randint(2, 5))
+        path = 'C:\\Projects\\' + '\\'.join(parts) + f"_{i}"
+        records.append(make_record(path, category=f"Project {rng.randint(1, 20)}"))
+    return records, words
+
+
+def write_catalog(directory, backend, records):
+    cwd = os.getcwd()
+    os.chdir(directory)
+    try:
+        storage = SqliteStorage() if backend == 'sqlite' else JsonStorage()
+        with storage.transaction():
+            for record in records:
+                storage.add(record)
+        storage.close()
+    finally:
+        os.chdir(cwd)
+
+
+def percentile(samples, fraction):
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def measure(fn, runs, setup=None, memory=True):
+    """Time runs calls of fn, then one more under tracemalloc for peak memory"""
+    samples = []
+    for _ in range(runs):
+        state = setup() if setup else None
+        start = time.perf_counter()
+        fn(state)
+        samples.append((time.perf_counter() - start) * 1000)
+
+    peak = None
+    if memory:
+        state = setup() if setup else None
+        tracemalloc.start()
+        fn(state)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return summarize(samples, peak)
+
+
+def summarize(samples, peak=None):
+    """Percentiles of samples in milliseconds, as measure() reports them"""
+    return {
+        'runs': len(samples),
+        'p50_ms': round(percentile(samples, 0.50), 3),
+        'p90_ms': round(percentile(samples, 0.90), 3),
+        'p99_ms': round(percentile(samples, 0.99), 3),
+        'max_ms': round(max(samples), 3),
+        'peak_kb': round(peak / 1024, 1) if peak is not None else None,
+    }
+
+
+def headless_benchmarks(directory, backend, size, words, runs):
+    results = {}
+    rng = random.Random(size)
+
+    def open_store(_=None):
+        store = PathStore(SqliteStorage() if backend == 'sqlite' else JsonStorage())
+        store.load()
+        return store
+
+    results['load'] = measure(lambda state: open_store().close(), runs)
+
+    store = open_store()
+    write_snapshot(*store.snapshot(), statuses={})
+
+    def load_snapshot(state):
+        snapshot = read_snapshot()
+        snapshot.statuses()
+        snapshot.groups()
+
+    # What the window paints from before load() has finished
+    results['load_snapshot'] = measure(load_snapshot, runs)
+    snapshot = read_snapshot()
+    results['snapshot_search'] = measure(lambda state: snapshot.search(state, SEARCH_LIMIT), runs,
+                                         setup=lambda: rng.choice(words)[:3])
+    os.remove(SNAPSHOT_FILE)
+    queries = [rng.choice(words) for _ in range(runs)]
+
+    def type_query(state):
+        # One search per keystroke, the way the search box drives it
+        store.index.last_query = None
+        for end in range(1, len(state) + 1):
+            store.search_top(state[:end])
+
+    results['filter_typing'] = measure(type_query, runs, setup=lambda: queries[rng.randrange(len(queries))])
+    results['filter_fresh'] = measure(lambda state: store.search(state), runs,
+                                      setup=lambda: (setattr(store.index, 'last_query', None), rng.choice(words)[:3])[1])
+
+    # The first keystroke: one letter matches much of the catalog, so the window lists only the first matches
+    results['filter_first_key'] = measure(lambda state: store.search_top(state), runs,
+                                          setup=lambda: (setattr(store.index, 'last_query', None),
+                                                         rng.choice(string.ascii_lowercase))[1])
+
+    # The same searches once a few hundred paths have frecency scores to sort by
+    for path_info in rng.sample(store.paths, min(300, len(store))):
+        store.record_open(path_info.path)
+    results['filter_ranked'] = measure(lambda state: store.search(state), runs,
+                                       setup=lambda: (setattr(store.index, 'last_query', None), rng.choice(words)[:3])[1])
+
+    counter = iter(range(10 ** 9))
+
+    def add_and_remove(state):
+        record = make_record(f"C:\\Bench\\added_{next(counter)}")
+        store.add(record)
+        store.remove(record.path)
+
+    results['save'] = measure(add_and_remove, runs)
+    store.close()
+
+    def cli_list(state):
+        subprocess.run([sys.executable, os.path.join(ROOT, 'open_path_tool.py'), '--no-daemon', 'list'],
+                       stdout=subprocess.DEVNULL, check=True)
+
+    # A child process: tracemalloc cannot see its memory
+    results['cli_list'] = measure(cli_list, max(3, runs // 4), memory=False)
+
+    # Timed inside a fresh interpreter, so start-up of Python itself is left out
+    for module, name in (('launcher_gui', 'import_gui'), ('cli', 'import_cli')):
+        results[name] = summarize([import_time(module) for _ in range(max(3, runs // 4))])
+    return results
+
+
+def import_time(module):
+    """Milliseconds a fresh interpreter takes to import module"""
+    code = f"import time; t = time.perf_counter(); import {module}; print(time.perf_counter() - t)"
+    output = subprocess.run([sys.executable, '-c', code], cwd=ROOT, capture_output=True, text=True,
+                            check=True).stdout
+    return float(output) * 1000
+
+
+def gui_benchmarks(size, words, runs):
+    from launcher_gui import ModernPathLauncher
+
+    rng = random.Random(size)
+    app = ModernPathLauncher()
+
+    def drain(_=None):
+        # Chunked renders continue in after() callbacks; run them to the end
+        while app.search_scheduler.after_id is not None:
+            app.root.update()
+
+    results = {}
+    drain()
+    results['update_listbox'] = measure(lambda state: (app.update_listbox(), drain()), runs)
+
+    def filter_query(state):
+        app.search_var.set(state)
+        app.search_scheduler.cancel()
+        app.filter_paths()
+        drain()
+
+    results['filter_render'] = measure(filter_query, runs, setup=lambda: rng.choice(words)[:2])
+    app.search_var.set('')
+    app.save_snapshot()
+    app.root.destroy()
+
+    def first_paint(state):
+        window = ModernPathLauncher()
+        window.root.update()
+        window.root.destroy()
+
+    def without_snapshot():
+        if os.path.exists(SNAPSHOT_FILE):
+            os.remove(SNAPSHOT_FILE)
+
+    # Window creation to painted rows, with and without last run's snapshot
+    results['first_paint_snapshot'] = measure(first_paint, max(3, runs // 4), memory=False)
+    results['first_paint_cold'] = measure(first_paint, max(3, runs // 4), setup=without_snapshot, memory=False)
+
+    def first_input():
+        # A key pressed as the window is created, timed until the search box handles it
+        handled = []
+        started = time.perf_counter()
+        window = ModernPathLauncher()
+        window.search_entry.bind('<KeyPress>', lambda e: handled.append(time.perf_counter()), add='+')
+        window.search_entry.focus_force()
+        window.search_entry.event_generate('<KeyPress>', keysym='a', when='tail')
+        deadline = started + 10
+        while not handled and time.perf_counter() < deadline:
+            window.root.update()
+        window.root.destroy()
+        return (handled[0] - started) * 1000 if handled else None
+
+    samples = [first_input() for _ in range(max(3, runs // 4))]
+    if None not in samples:
+        results['first_input'] = summarize(samples)
+    return results
+
+
+def start_virtual_display():
+    """Return an Xvfb process when there is no display, or None"""
+    if os.environ.get('DISPLAY') or sys.platform == 'win32':
+        return None
+    xvfb = shutil.which('Xvfb')
+    if not xvfb:
+        return None
+    display = ':97'
+    process = subprocess.Popen([xvfb, display, '-screen', '0', '1280x1024x24'],
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    time.sleep(0.5)
+    os.environ['DISPLAY'] = display
+    return process
+
+
+def gui_available():
+    if sys.platform == 'win32' or os.environ.get('DISPLAY'):
+        try:
+            import tkinter
+            tkinter.Tk().destroy()
+            return True
+        except Exception:
+            return False
+    return False
+
+
+def git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(previous_file, report):
+    with open(previous_file, encoding='utf-8') as f:
+        previous = json.load(f)
+    old = {(r['name'], r['mode'], r['backend'], r['size']): r for r in previous['results']}
+    print(f"\nCompared with {previous_file} ({previous.get('commit')}):")
+    for result in report['results']:
+        key = (result['name'], result['mode'], result['backend'], result['size'])
+        if key in old and old[key]['p50_ms']:
+            ratio = result['p50_ms'] / old[key]['p50_ms']
+            print(f"  {result['name']:<16} {result['mode']:<8} {result['backend']:<7} {result['size']:>7}  "
+                  f"p50 {old[key]['p50_ms']:>9.3f} -> {result['p50_ms']:>9.3f} ms  ({ratio:.2f}x)")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark load, filter, render and save at scale.")
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES)
+    parser.add_argument('--runs', type=int, default=20, help="timed runs per benchmark")
+    parser.add_argument('--backends', nargs='+', default=['sqlite', 'json'], choices=['sqlite', 'json'])
+    parser.add_argument('--no-gui', action='store_true', help="skip the benchmarks that need a display")
+    parser.add_argument('--output', help="result file (default: benchmarks/results/<time>.json)")
+    parser.add_argument('--compare', metavar='FILE', help="print p50 changes against an earlier result file")
+    args = parser.parse_args(argv)
+
+    # Never let a running daemon answer for the catalog under test
+    os.environ['OPEN_PATH_TOOL_SOCKET'] = os.path.join(tempfile.gettempdir(), f"bench-{os.getpid()}.sock")
+    xvfb = None if args.no_gui else start_virtual_display()
+    run_gui = not args.no_gui and gui_available()
+
+    report = {
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'commit': git_commit(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'results': [],
+        'skipped': [] if run_gui or args.no_gui else ['gui: no display and no Xvfb'],
+    }
+    cwd = os.getcwd()
+    try:
+        for size in args.sizes:
+            records, words = synthetic_records(size)
+            for backend in args.backends:
+                directory = tempfile.mkdtemp(prefix='path-bench-')
+                try:
+                    write_catalog(directory, backend, records)
+                    os.chdir(directory)
+                    os.environ['OPEN_PATH_TOOL_STORAGE'] = backend
+                    runs = args.runs if size < 100000 else max(5, args.runs // 4)
+                    timings = [('headless', headless_benchmarks(directory, backend, size, words, runs))]
+                    if run_gui:
+                        timings.append(('gui', gui_benchmarks(size, words, runs)))
+                    for mode, results in timings:
+                        for name, result in results.items():
+                            report['results'].append(dict(name=name, mode=mode, backend=backend, size=size, **result))
+                            peak = '-' if result['peak_kb'] is None else f"{result['peak_kb']:.1f} KiB"
+                            print(f"{name:<16} {mode:<8} {backend:<7} {size:>7}  p50 {result['p50_ms']:>9.3f} ms  "
+                                  f"p90 {result['p90_ms']:>9.3f} ms  peak {peak:>14}")
+                finally:
+                    os.chdir(cwd)
+                    shutil.rmtree(directory, ignore_errors=True)
+    finally:
+        if xvfb:
+            xvfb.terminate()
+
+    output = args.output
+    if not output:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        output = os.path.join(RESULTS_DIR, time.strftime('%Y%m%d-%H%M%S') + '.json')
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    print(f"\nResults written to {output}")
+
+    if args.compare:
+        compare(args.compare, report)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,157 @@
+"""Stress test for several processes saving the catalog at once
+
+Starts worker processes that add and remove paths through their own
+PathStore as fast as they can, on the same store file, while this process
+keeps a PathStore current with sync(). The workers sync between their
+own writes too, so changes found while saving are exercised as well. At
+the end the file must hold exactly what the workers meant to leave
+behind, with no lost or duplicated writes, and every synced store,
+the workers' included, must agree with it:
+
+    python benchmarks/stress_sync.py
+    python benchmarks/stress_sync.py --backends json --workers 8 --ops 300
+"""
+import argparse
+import multiprocessing
+import os
+import queue
+import shutil
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from path_store import PathStore, make_record  # noqa: E402
+from storage import JsonStorage, SqliteStorage  # noqa: E402
+
+SYNC_INTERVAL_S = 0.05
+SHARED_PATHS = 20  # paths every worker adds, to check duplicates are dropped
+
+
+def open_backend(directory, backend):
+    if backend == 'sqlite':
+        return SqliteStorage(os.path.join(directory, 'saved_paths.db'),
+                             legacy_file=os.path.join(directory, 'no_legacy.json'))
+    return JsonStorage(os.path.join(directory, 'saved_paths.json'))
+
+
+def worker_paths(worker, ops):
+    """The paths worker adds, and which of them it removes again"""
+    added = [f"/stress/w{worker}/p{n}" for n in range(ops)]
+    removed = {added[n - 1] for n in range(1, ops, 3)}
+    return added, removed
+
+
+def run_worker(directory, backend, worker, ops, start, finished, results):
+    store = PathStore(open_backend(directory, backend))
+    store.load()
+    start.wait()
+    added, removed = worker_paths(worker, ops)
+    for n, path in enumerate(added):
+        if n % 10 == 0:
+            # Bulk saves go through one transaction
+            batch = [make_record(path)] + [make_record(f"/stress/shared/s{k}") for k in range(SHARED_PATHS)]
+            store.add_many(batch)
+        else:
+            store.add(make_record(path))
+        if n % 3 == 1:
+            store.remove(added[n - 1])
+        if n % 5 == 0:
+            store.sync()
+    # Once everyone has finished, one more sync must bring this store up to date
+    finished.wait()
+    store.sync()
+    results.put((worker, sorted(record.path for record in store.paths)))
+    store.close()
+
+
+def expected_paths(workers, ops):
+    expected = {f"/stress/shared/s{k}" for k in range(SHARED_PATHS)}
+    for worker in range(workers):
+        added, removed = worker_paths(worker, ops)
+        expected.update(path for path in added if path not in removed)
+    return expected
+
+
+def stress(backend, workers, ops):
+    directory = tempfile.mkdtemp(prefix='stress_sync_')
+    try:
+        observer = PathStore(open_backend(directory, backend))
+        observer.load()
+        defaults = {record.path for record in observer.paths}
+
+        start = multiprocessing.Event()
+        finished = multiprocessing.Barrier(workers)
+        results = multiprocessing.Queue()
+        processes = [multiprocessing.Process(target=run_worker,
+                                             args=(directory, backend, i, ops, start, finished, results))
+                     for i in range(workers)]
+        for process in processes:
+            process.start()
+        started = time.perf_counter()
+        start.set()
+        syncs = reloads = 0
+        worker_views = {}
+        while any(process.is_alive() for process in processes) or not results.empty():
+            if observer.sync() is None:
+                reloads += 1
+            syncs += 1
+            # Drained as they come: a worker cannot exit with its result still queued
+            try:
+                while True:
+                    worker, paths = results.get_nowait()
+                    worker_views[worker] = set(paths) - defaults
+            except queue.Empty:
+                pass
+            time.sleep(SYNC_INTERVAL_S)
+        elapsed = time.perf_counter() - started
+        for process in processes:
+            process.join()
+        failed = [process.exitcode for process in processes if process.exitcode]
+        if observer.sync() is None:
+            reloads += 1
+
+        expected = expected_paths(workers, ops)
+        storage = open_backend(directory, backend)
+        stored = [record.path for record in storage.load()]
+        storage.close()
+        synced = {record.path for record in observer.paths} - defaults
+        observer.close()
+
+        problems = []
+        if failed:
+            problems.append(f"workers exited with {failed}")
+        if len(stored) != len(set(stored)):
+            problems.append(f"{len(stored) - len(set(stored))} duplicate rows")
+        if set(stored) != expected:
+            problems.append(f"store lost {len(expected - set(stored))} and kept {len(set(stored) - expected)} "
+                            f"paths it should not have")
+        if synced != set(stored):
+            problems.append(f"synced store differs by {len(synced ^ set(stored))} paths")
+        if len(worker_views) != workers:
+            problems.append(f"only {len(worker_views)} of {workers} workers reported")
+        stale = [worker for worker, paths in sorted(worker_views.items()) if paths != set(stored)]
+        if stale:
+            problems.append(f"workers {stale} missed other workers' changes")
+        writes = workers * (ops + ops // 3)
+        print(f"{backend:6} {workers} workers, {writes} writes in {elapsed:.2f}s, "
+              f"{syncs} syncs ({reloads} full reloads): " + ("; ".join(problems) or "ok"))
+        return not problems
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--backends', nargs='+', default=['sqlite', 'json'], choices=['sqlite', 'json'])
+    parser.add_argument('--workers', type=int, default=4)
+    parser.add_argument('--ops', type=int, default=200, help="paths added by each worker")
+    args = parser.parse_args()
+    ok = all([stress(backend, args.workers, args.ops) for backend in args.backends])
+    return 0 if ok else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,95 @@
+import os
+from fnmatch import fnmatch
+
+from path_store import make_record
+
+DEFAULT_EXCLUDE = ('.*', '__pycache__', 'node_modules')
+
+
+def list_subfolders(folder):
+    """Return (path, name) for each folder directly inside folder"""
+    with os.scandir(folder) as entries:
+        found = [(entry.path, entry.name) for entry in entries if entry.is_dir(follow_symlinks=False)]
+    found.sort(key=lambda item: item[1].lower())
+    return found
+
+
+def matches_any(name, relative, patterns):
+    return any(fnmatch(name, pattern) or fnmatch(relative, pattern) for pattern in patterns)
+
+
+class BulkImporter:
+    """Discover folders under one or more roots with a pool of scandir workers
+
+    Folders up to max_depth levels below each root are turned into records
+    and yielded in batches as soon as they are found. Exclude patterns also
+    stop the walk from descending; include patterns only decide which
+    folders become records. Patterns match the folder name or its path
+    relative to the root, with forward slashes.
+    """
+
+    def __init__(self, roots, max_depth=2, include=(), exclude=DEFAULT_EXCLUDE,
+                 category=None, workers=8, batch_size=200):
+        self.roots = [os.path.abspath(root) for root in roots]
+        self.max_depth = max_depth
+        self.include = tuple(include)
+        self.exclude = tuple(exclude)
+        self.category = category
+        self.workers = workers
+        self.batch_size = batch_size
+        self.cancelled = False
+        self.scanned = 0
+        self.found = 0
+        self.errors = 0
+
+    def category_for(self, root):
+        if self.category:
+            return self.category
+        return f"Imported: {os.path.basename(root) or root}"
+
+    def cancel(self):
+        self.cancelled = True
+
+    def batches(self):
+        """Yield lists of new records until the walk is done or cancelled"""
+        # Imported here: concurrent.futures pulls in logging, which nothing else needs
+        from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+        batch = []
+        pool = ThreadPoolExecutor(max_workers=self.workers)
+        pending = {}
+        try:
+            for root in self.roots:
+                pending[pool.submit(list_subfolders, root)] = (root, 1)
+
+            while pending and not self.cancelled:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    root, depth = pending.pop(future)
+                    self.scanned += 1
+                    try:
+                        subfolders = future.result()
+                    except OSError:
+                        self.errors += 1
+                        continue
+
+                    for path, name in subfolders:
+                        relative = os.path.relpath(path, root).replace(os.sep, '/')
+                        if matches_any(name, relative, self.exclude):
+                            continue
+                        if not self.include or matches_any(name, relative, self.include):
+                            batch.append(make_record(path, name=f"📁 {relative}", category=self.category_for(root)))
+                            self.found += 1
+                        if depth < self.max_depth:
+                            pending[pool.submit(list_subfolders, path)] = (root, depth + 1)
+
+                if len(batch) >= self.batch_size:
+                    yield batch
+                    batch = []
+
+            if batch and not self.cancelled:
+                yield batch
+        finally:
+            for future in pending:
+                future.cancel()
+            pool.shutdown(wait=False)
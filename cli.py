@@ -0,0 +1,334 @@
+import argparse
+import contextlib
+import os
+import sys
+
+import daemon
+import perf
+from bulk_import import DEFAULT_EXCLUDE, BulkImporter
+from path_record import PathRecord
+from path_store import PathStore, make_record
+from record_io import FORMATS, batched, detect_format, read_records, write_records
+from storage import JsonStorage, StorageError, open_storage
+
+# Nothing in here may import tkinter: the command line has to start fast
+
+LAUNCH_WAIT_S = 5.0  # how long `open` waits to hear whether the opener failed
+IMPORT_BATCH_SIZE = 1000  # records per commit in import-file
+MAX_REPORTED_ERRORS = 10  # invalid records spelled out by import-file
+
+
+def print_paths(paths):
+    for path_info in paths:
+        print(f"{path_info.category}\t{path_info.name}\t{path_info.path}")
+
+
+def report_launch(path, error, seconds):
+    if error:
+        print(f"Failed to open {path}: {error}", file=sys.stderr)
+
+
+def cmd_list(store, args):
+    paths = store.in_category(args.category) if args.category else store.paths
+    print_paths(paths)
+    return 0
+
+
+def cmd_search(store, args):
+    print_paths(store.search(args.query))
+    return 0
+
+
+def cmd_open(store, args):
+    matches = store.resolve(args.query)
+    if not matches:
+        print(f"No path matches: {args.query}", file=sys.stderr)
+        return 1
+    if len(matches) > 1:
+        print(f"{len(matches)} paths match {args.query!r}, be more specific:", file=sys.stderr)
+        print_paths(matches[:20])
+        return 1
+    path = matches[0].path
+    if not os.path.exists(path):
+        print(f"Path does not exist: {path}", file=sys.stderr)
+        return 1
+    from opener import Launcher
+
+    launcher = Launcher()
+    launcher.launch(path)
+    store.record_open(path)
+    # An opener that is still running after the wait has most likely succeeded
+    launcher.wait(LAUNCH_WAIT_S)
+    for _, error, _ in launcher.poll():
+        if error:
+            print(f"Failed to open {path}: {error}", file=sys.stderr)
+            return 1
+    return 0
+
+
+def cmd_add(store, args):
+    folder = os.path.abspath(args.path)
+    if not store.add(make_record(folder, name=args.name)):
+        print(f"This path already exists in the list: {folder}", file=sys.stderr)
+        return 1
+    print(f"Added: {folder}")
+    return 0
+
+
+def cmd_remove(store, args):
+    path = args.path if store.find(args.path) else os.path.abspath(args.path)
+    if not store.remove(path):
+        print(f"Only custom paths can be removed: {path}", file=sys.stderr)
+        return 1
+    print(f"Removed: {path}")
+    return 0
+
+
+def cmd_import(store, args):
+    importer = BulkImporter(
+        args.roots,
+        max_depth=args.depth,
+        include=args.include,
+        exclude=args.exclude if args.exclude is not None else DEFAULT_EXCLUDE,
+        category=args.category
+    )
+    added = 0
+    for batch in importer.batches():
+        added += len(store.add_many(batch))
+        print(f"\r{importer.scanned} folders scanned, {importer.found} found, {added} added",
+              end='', file=sys.stderr, flush=True)
+    print(file=sys.stderr)
+    print(f"Imported {added} new paths ({importer.found - added} already listed, {importer.errors} unreadable)")
+    return 0
+
+
+def cmd_export(storage, args):
+    """Stream saved paths out a page at a time, without loading the catalog"""
+    fmt = args.format or detect_format(args.file)
+    records = storage.iter_records(args.category)
+    if args.file == '-':
+        count = write_records(records, sys.stdout, fmt)
+    else:
+        # Written aside first, so a failed export never leaves half a file
+        temp_file = f"{args.file}.tmp"
+        try:
+            with open(temp_file, "w", encoding='utf-8', newline='') as f:
+                count = write_records(records, f, fmt)
+            os.replace(temp_file, args.file)
+        except BaseException:
+            try:
+                os.remove(temp_file)
+            except OSError:
+                pass
+            raise
+    print(f"Exported {count} paths", file=sys.stderr)
+    return 0
+
+
+def cmd_import_file(storage, args):
+    """Stream records in, validating each and committing a batch at a time"""
+    fmt = args.format or detect_format(args.file)
+    # Defaults, team paths and other spellings of a saved path count as listed too
+    store = PathStore(storage)
+    store.load()
+    if store.load_error:
+        print(f"Could not load saved paths: {store.load_error}", file=sys.stderr)
+        return 1
+    read = added = invalid = 0
+    # The JSON document is rewritten whole on every commit, so it gets one at the end
+    bulk = storage.transaction() if isinstance(storage, JsonStorage) else contextlib.nullcontext()
+    f = sys.stdin if args.file == '-' else open(args.file, "r", encoding='utf-8-sig', newline='')
+    try:
+        with bulk:
+            for batch in batched(read_records(f, fmt), args.batch_size):
+                records = []
+                for line, entry in batch:
+                    if isinstance(entry, ValueError):
+                        invalid += 1
+                        if invalid <= MAX_REPORTED_ERRORS:
+                            print(f"\r{args.file}:{line}: {entry}", file=sys.stderr)
+                    else:
+                        records.append(entry)
+                read += len(batch)
+                added += len(store.add_many(records))
+                print(f"\r{read} read, {added} added, {invalid} invalid", end='', file=sys.stderr, flush=True)
+    finally:
+        if f is not sys.stdin:
+            f.close()
+    print(file=sys.stderr)
+    if invalid > MAX_REPORTED_ERRORS:
+        print(f"... and {invalid - MAX_REPORTED_ERRORS} more invalid records", file=sys.stderr)
+    print(f"Imported {added} new paths ({read - added - invalid} already listed, {invalid} invalid)")
+    return 0
+
+
+STORAGE_COMMANDS = ('export', 'import-file')  # commands that stream from the storage directly
+
+
+def run_storage_command(args):
+    try:
+        storage = open_storage()
+    except StorageError as e:
+        print(f"Cannot open saved paths: {e}", file=sys.stderr)
+        return 1
+    try:
+        return args.func(storage, args)
+    except OSError as e:
+        print(f"{args.file}: {e.strerror or e}", file=sys.stderr)
+        return 1
+    except StorageError as e:
+        print(f"Failed to save paths: {e}", file=sys.stderr)
+        return 1
+    finally:
+        storage.close()
+
+
+def cmd_daemon(args):
+    if args.gui:
+        # The window is built but stays hidden until a show-window request
+        from launcher_gui import ModernPathLauncher
+        app = ModernPathLauncher()
+        if not app.start_daemon():
+            print("A daemon is already running or sockets are not supported here", file=sys.stderr)
+            return 1
+        app.run()
+        return 0
+
+    store = load_store()
+    if store is None:
+        return 1
+    from opener import Launcher
+
+    launcher = Launcher(report=report_launch)
+    try:
+        if not daemon.LauncherDaemon(store, launcher.launch).serve_forever():
+            print("A daemon is already running or sockets are not supported here", file=sys.stderr)
+            return 1
+    finally:
+        store.close()
+    return 0
+
+
+def forward(args):
+    """Answer open/search from a running daemon; None to run standalone"""
+    if args.command == 'search':
+        response = daemon.request({'cmd': 'search', 'query': args.query})
+        if response is None or not response.get('ok'):
+            return None
+        print_paths([PathRecord.from_dict(info) for info in response['results']])
+        return 0
+
+    response = daemon.request({'cmd': 'open', 'query': args.query})
+    if response is None:
+        return None
+    if response.get('ok'):
+        return 0
+    print(response.get('error', "Failed to open path"), file=sys.stderr)
+    print_paths([PathRecord.from_dict(info) for info in response.get('matches', [])])
+    return 1
+
+
+def load_store():
+    try:
+        with perf.span('load_paths'):
+            store = PathStore()
+            store.load()
+    except StorageError as e:
+        print(f"Cannot open saved paths: {e}", file=sys.stderr)
+        return None
+    if store.load_error:
+        print(f"Could not load saved paths: {store.load_error}", file=sys.stderr)
+    return store
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog='open_path_tool', description="Query and open saved paths.")
+    parser.add_argument('--no-daemon', action='store_true', help="never forward to a running daemon")
+    commands = parser.add_subparsers(dest='command', metavar='command')
+    commands.required = True
+
+    list_parser = commands.add_parser('list', help="list all paths")
+    list_parser.add_argument('--category', help="only list this category")
+    list_parser.set_defaults(func=cmd_list)
+
+    search_parser = commands.add_parser('search', help="list paths whose name or path contains QUERY")
+    search_parser.add_argument('query')
+    search_parser.set_defaults(func=cmd_search)
+
+    open_parser = commands.add_parser('open', help="open the path matching QUERY")
+    open_parser.add_argument('query', help="a path, a name or a unique search term")
+    open_parser.set_defaults(func=cmd_open)
+
+    add_parser = commands.add_parser('add', help="add a custom path")
+    add_parser.add_argument('path')
+    add_parser.add_argument('--name', help="display name (default: folder name)")
+    add_parser.set_defaults(func=cmd_add)
+
+    remove_parser = commands.add_parser('remove', help="remove a custom path")
+    remove_parser.add_argument('path')
+    remove_parser.set_defaults(func=cmd_remove)
+
+    import_parser = commands.add_parser('import', help="add every folder found under one or more roots")
+    import_parser.add_argument('roots', nargs='+')
+    import_parser.add_argument('--depth', type=int, default=2, help="levels below each root (default: 2)")
+    import_parser.add_argument('--include', action='append', default=[], metavar='GLOB',
+                               help="only add folders matching GLOB (repeatable)")
+    import_parser.add_argument('--exclude', action='append', metavar='GLOB',
+                               help=f"skip folders matching GLOB (repeatable, default: {' '.join(DEFAULT_EXCLUDE)})")
+    import_parser.add_argument('--category', help="category for imported paths (default: one per root)")
+    import_parser.set_defaults(func=cmd_import)
+
+    export_parser = commands.add_parser('export', help="write saved paths to an NDJSON or CSV file")
+    export_parser.add_argument('file', help="output file, or - for standard output")
+    export_parser.add_argument('--format', choices=FORMATS, help="default: csv for *.csv, else ndjson")
+    export_parser.add_argument('--category', help="only export this category")
+    export_parser.set_defaults(func=cmd_export)
+
+    import_file_parser = commands.add_parser('import-file', help="add paths from an NDJSON or CSV file")
+    import_file_parser.add_argument('file', help="input file, or - for standard input")
+    import_file_parser.add_argument('--format', choices=FORMATS, help="default: csv for *.csv, else ndjson")
+    import_file_parser.add_argument('--batch-size', type=int, default=IMPORT_BATCH_SIZE,
+                                    help=f"records per commit (default: {IMPORT_BATCH_SIZE})")
+    import_file_parser.set_defaults(func=cmd_import_file)
+
+    daemon_parser = commands.add_parser('daemon', help="keep the catalog warm and serve requests over a socket")
+    daemon_parser.add_argument('--gui', action='store_true', help="also host the window, shown on request")
+    daemon_parser.set_defaults(func=None)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    if hasattr(sys.stdout, 'reconfigure'):
+        # Names carry emoji that a legacy console code page cannot encode
+        sys.stdout.reconfigure(errors='replace')
+
+    if args.command == 'daemon':
+        return cmd_daemon(args)
+    if args.command in STORAGE_COMMANDS:
+        result = run_storage_command(args)
+        if args.command == 'import-file' and result == 0 and not args.no_daemon:
+            daemon.request({'cmd': 'reload'})
+        return result
+    if args.command in ('open', 'search') and not args.no_daemon:
+        result = forward(args)
+        if result is not None:
+            return result
+
+    store = load_store()
+    if store is None:
+        return 1
+    try:
+        result = args.func(store, args)
+        if args.command in ('add', 'remove', 'import') and result == 0 and not args.no_daemon:
+            daemon.request({'cmd': 'reload'})
+        return result
+    except StorageError as e:
+        print(f"Failed to save paths: {e}", file=sys.stderr)
+        return 1
+    finally:
+        store.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
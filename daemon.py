@@ -0,0 +1,258 @@
+import json
+import os
+import signal
+import socket
+import socketserver
+import stat
+import tempfile
+import sys
+import threading
+import time
+
+from path_watcher import PathWatcher
+from status_probe import StatusProber
+from storage import StorageError
+
+REQUEST_TIMEOUT = 2.0
+STATUS_REFRESH_S = 60  # how often the daemon re-probes every catalog path
+
+
+def daemon_supported():
+    return hasattr(socket, 'AF_UNIX')
+
+
+def owned_by_user(path, mode_mask=0):
+    """Whether path (not followed if a link) belongs to this user and has no bits in mode_mask"""
+    try:
+        st = os.lstat(path)
+    except OSError:
+        return False
+    if hasattr(os, 'getuid') and st.st_uid != os.getuid():
+        return False
+    return not st.st_mode & mode_mask
+
+
+def socket_dir():
+    """A directory only this user can write to, or None
+
+    $XDG_RUNTIME_DIR when there is one; otherwise a 0700 directory of our
+    own in the shared temp directory. Anyone can create names there, so
+    one that exists but is not ours (or is open to others) is refused.
+    """
+    runtime = os.environ.get('XDG_RUNTIME_DIR')
+    if runtime and os.path.isdir(runtime) and owned_by_user(runtime, stat.S_IWGRP | stat.S_IWOTH):
+        return runtime
+    user = os.getuid() if hasattr(os, 'getuid') else os.environ.get('USERNAME', 'user')
+    directory = os.path.join(tempfile.gettempdir(), f"open_path_tool-{user}")
+    try:
+        os.mkdir(directory, 0o700)
+    except FileExistsError:
+        pass
+    except OSError:
+        return None
+    if not os.path.isdir(directory) or not owned_by_user(directory, stat.S_IRWXG | stat.S_IRWXO):
+        return None
+    return directory
+
+
+def socket_path():
+    """Per-user socket path, or None without a safe place for one; OPEN_PATH_TOOL_SOCKET overrides it"""
+    if 'OPEN_PATH_TOOL_SOCKET' in os.environ:
+        return os.environ['OPEN_PATH_TOOL_SOCKET']
+    directory = socket_dir()
+    return os.path.join(directory, "open_path_tool.sock") if directory else None
+
+
+def request(message, timeout=REQUEST_TIMEOUT):
+    """Send one request to a running daemon; None when no daemon answers"""
+    if not daemon_supported():
+        return None
+    path = socket_path()
+    # Never talk to a socket some other user put there
+    if path is None or not owned_by_user(path):
+        return None
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(timeout)
+            sock.connect(path)
+            sock.sendall(json.dumps(message).encode('utf-8') + b"\n")
+            with sock.makefile('rb') as f:
+                line = f.readline()
+        return json.loads(line.decode('utf-8')) if line else None
+    except (OSError, ValueError):
+        return None
+
+
+def record_info(path_info, status=None):
+    info = path_info.to_dict()
+    if status:
+        info['status'] = status
+    return info
+
+
+class RequestHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        for line in self.rfile:
+            try:
+                message = json.loads(line.decode('utf-8'))
+                response = self.server.launcher.handle(message)
+            except Exception as e:
+                response = {'ok': False, 'error': str(e)}
+            self.wfile.write(json.dumps(response, ensure_ascii=False).encode('utf-8') + b"\n")
+            self.wfile.flush()
+
+
+if daemon_supported():
+    class DaemonServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+        daemon_threads = True
+
+
+class LauncherDaemon:
+    """Keep the catalog, search index and status cache warm behind a socket
+
+    Answers ping, search, open, show-window and reload requests, one JSON
+    object per line. show_window is only available when the daemon runs
+    inside the Tk launcher, which also passes reload so the catalog is
+    reloaded on its own thread and the window redrawn.
+    """
+
+    def __init__(self, store, launch, show_window=None, reload=None):
+        self.store = store
+        self.launch = launch
+        self.show_window = show_window
+        self.reload = reload
+        self.watcher = PathWatcher()
+        self.prober = StatusProber(watcher=self.watcher)
+        self.path = socket_path()
+        self.server = None
+        self.stopped = threading.Event()
+        self.refresh_requested = threading.Event()
+        self.background = False
+
+    def handle(self, message):
+        command = message.get('cmd')
+        if command == 'ping':
+            return {'ok': True, 'pid': os.getpid(), 'paths': len(self.store)}
+
+        if command == 'search':
+            results = self.store.search(message.get('query', ''))
+            return {'ok': True, 'results': [record_info(p, self.prober.status(p.path)) for p in results]}
+
+        if command == 'open':
+            matches = self.store.resolve(message.get('query', ''))
+            if len(matches) != 1:
+                error = "No path matches" if not matches else "More than one path matches"
+                return {'ok': False, 'error': error, 'matches': [record_info(p) for p in matches[:20]]}
+            path = matches[0].path
+            if not os.path.exists(path):
+                return {'ok': False, 'error': f"Path does not exist: {path}"}
+            self.launch(path)
+            self.store.record_open(path)
+            return {'ok': True, 'path': path}
+
+        if command == 'show-window':
+            if self.show_window is None:
+                return {'ok': False, 'error': "This daemon has no window"}
+            self.show_window()
+            return {'ok': True}
+
+        if command == 'reload':
+            if self.reload is not None:
+                self.reload()
+            else:
+                self.store.load()
+            self.refresh_requested.set()
+            return {'ok': True, 'paths': len(self.store)}
+
+        return {'ok': False, 'error': f"Unknown command: {command}"}
+
+    def refresh_status(self):
+        self.prober.cancel_all()
+        for path_info in list(self.store.paths):
+            self.prober.probe(path_info.path)
+
+    def sync_store(self):
+        """Pick up paths other processes saved or removed, probing the new ones"""
+        try:
+            changes = self.store.sync()
+        except StorageError:
+            return  # Storage busy or unreadable; the next pass tries again
+        self.store.sync_usage()
+        if changes is None:
+            self.refresh_requested.set()
+            return
+        for path_info in changes[0]:
+            self.prober.probe(path_info.path)
+
+    def status_loop(self):
+        """Keep the prober's cache current; only this thread drives the prober"""
+        self.refresh_status()
+        last_refresh = time.monotonic()
+        while not self.stopped.wait(0.5):
+            for path in self.watcher.poll():
+                self.prober.invalidate(path)
+                self.prober.probe(path)
+            if not self.background:
+                # Inside the Tk launcher the window merges changes itself
+                self.sync_store()
+            self.prober.poll()
+            if self.refresh_requested.is_set() or time.monotonic() - last_refresh > STATUS_REFRESH_S:
+                self.refresh_requested.clear()
+                self.refresh_status()
+                last_refresh = time.monotonic()
+
+    def bind(self):
+        """Take over the socket; returns False if another daemon owns it"""
+        if not daemon_supported() or self.path is None:
+            return False
+        if request({'cmd': 'ping'}, timeout=0.5) is not None:
+            return False
+        try:
+            if os.path.lexists(self.path):
+                if not owned_by_user(self.path):
+                    return False  # Someone else's; leave it alone
+                os.unlink(self.path)  # Left behind by a daemon that died
+            self.server = DaemonServer(self.path, RequestHandler)
+            os.chmod(self.path, 0o600)
+        except OSError:
+            if self.server is not None:
+                self.server.server_close()
+                self.server = None
+            return False
+        self.server.launcher = self
+        return True
+
+    def start(self):
+        """Serve from background threads, for use inside the Tk launcher"""
+        if not self.bind():
+            return False
+        self.background = True
+        threading.Thread(target=self.status_loop, name="daemon-status", daemon=True).start()
+        threading.Thread(target=self.server.serve_forever, name="daemon-server", daemon=True).start()
+        return True
+
+    def serve_forever(self):
+        if not self.bind():
+            return False
+        # Let `kill` stop the daemon through the same cleanup as Ctrl+C
+        signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+        self.store.start_team_sync()
+        threading.Thread(target=self.status_loop, name="daemon-status", daemon=True).start()
+        try:
+            self.server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.shutdown()
+        return True
+
+    def shutdown(self):
+        """Stop serving and remove the socket file"""
+        self.stopped.set()
+        server, self.server = self.server, None
+        if server is not None:
+            if self.background:
+                server.shutdown()
+            server.server_close()
+            if os.path.exists(self.path):
+                os.unlink(self.path)
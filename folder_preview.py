@@ -0,0 +1,245 @@
+import os
+import queue
+import threading
+import tkinter as tk
+from collections import OrderedDict
+
+PAGE_SIZE = 500        # entries per streamed page
+PREVIEW_LIMIT = 5000   # entries kept per listing; the rest are only counted
+CACHE_LISTINGS = 64
+POLL_MS = 50
+
+
+class FolderLister:
+    """List folders with os.scandir on background threads, a page at a time
+
+    Results are (generation, kind, payload) tuples for the Tk thread to
+    poll: 'start', 'page' (entries), 'done' (total count), 'cached'
+    ((entries, total)) or 'error' (message). Only the newest request is
+    reported; older scans stop at their next page. Complete listings are
+    kept in an LRU cache keyed by (path, mtime), so an unchanged folder is
+    never scanned twice.
+    """
+
+    def __init__(self, workers=2, page_size=PAGE_SIZE, limit=PREVIEW_LIMIT, cache_size=CACHE_LISTINGS):
+        self.page_size = page_size
+        self.limit = limit
+        self.cache_size = cache_size
+        self.generation = 0
+        self.cache = OrderedDict()  # (path, mtime) -> (entries, total)
+        self.mtimes = {}            # path -> mtime of its cached listing
+        self.lock = threading.Lock()
+        self.jobs = queue.Queue()
+        self.results = queue.Queue()
+
+        for i in range(workers):
+            worker = threading.Thread(target=self._worker, name=f"folder-lister-{i}", daemon=True)
+            worker.start()
+
+    def peek(self, path):
+        """Return the last cached listing of path without touching the disk, or None"""
+        with self.lock:
+            mtime = self.mtimes.get(path)
+            if mtime is None:
+                return None
+            listing = self.cache.get((path, mtime))
+            if listing is not None:
+                self.cache.move_to_end((path, mtime))
+            return listing
+
+    def request(self, path):
+        """List path in the background; returns the generation its results carry"""
+        self.generation += 1
+        self.jobs.put((self.generation, path))
+        return self.generation
+
+    def cancel(self):
+        self.generation += 1
+
+    def poll(self):
+        results = []
+        while True:
+            try:
+                generation, kind, payload = self.results.get_nowait()
+            except queue.Empty:
+                return results
+            if generation == self.generation:
+                results.append((kind, payload))
+
+    def _worker(self):
+        while True:
+            generation, path = self.jobs.get()
+            if generation != self.generation:
+                continue
+            try:
+                self._list(generation, path)
+            except OSError as e:
+                self.results.put((generation, 'error', e.strerror or str(e)))
+
+    def _list(self, generation, path):
+        mtime = os.stat(path).st_mtime_ns
+        with self.lock:
+            listing = self.cache.get((path, mtime))
+            if listing is not None:
+                self.cache.move_to_end((path, mtime))
+        if listing is not None:
+            self.results.put((generation, 'cached', listing))
+            return
+
+        self.results.put((generation, 'start', None))
+        entries = []
+        page = []
+        total = 0
+        with os.scandir(path) as it:
+            for entry in it:
+                total += 1
+                if len(entries) < self.limit:
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        is_dir = False
+                    item = (entry.name, is_dir)
+                    entries.append(item)
+                    page.append(item)
+                if total % self.page_size == 0:
+                    if generation != self.generation:
+                        return  # Superseded; leave the rest of the folder alone
+                    if page:
+                        self.results.put((generation, 'page', page))
+                        page = []
+        if page:
+            self.results.put((generation, 'page', page))
+        self.results.put((generation, 'done', total))
+        self.store(path, mtime, (tuple(entries), total))
+
+    def store(self, path, mtime, listing):
+        with self.lock:
+            old_mtime = self.mtimes.get(path)
+            if old_mtime is not None and old_mtime != mtime:
+                self.cache.pop((path, old_mtime), None)
+            self.cache[(path, mtime)] = listing
+            self.mtimes[path] = mtime
+            while len(self.cache) > self.cache_size:
+                (evicted, evicted_mtime), _ = self.cache.popitem(last=False)
+                if self.mtimes.get(evicted) == evicted_mtime:
+                    del self.mtimes[evicted]
+
+
+def entry_text(entry):
+    name, is_dir = entry
+    return f"📁 {name}" if is_dir else f"📄 {name}"
+
+
+class PreviewPane:
+    """A listbox showing the contents of the selected folder
+
+    A cached listing is shown at once and then revalidated in the
+    background; uncached folders fill in page by page as they are scanned.
+    """
+
+    def __init__(self, parent, colors, lister=None):
+        self.colors = colors
+        self.lister = lister or FolderLister()
+        self.path = None
+        self.listing = None  # the cached listing on display, if any
+        self.shown = 0
+        self.poll_id = None
+
+        self.frame = tk.Frame(parent, bg=colors['bg_secondary'])
+        self.header = tk.Label(
+            self.frame,
+            text="👁 Preview",
+            font=('Segoe UI', 9, 'bold'),
+            fg=colors['text_primary'],
+            bg=colors['bg_secondary'],
+            anchor=tk.W
+        )
+        self.header.pack(fill=tk.X)
+
+        list_frame = tk.Frame(self.frame, bg=colors['bg_secondary'])
+        list_frame.pack(fill=tk.BOTH, expand=True)
+        scrollbar = tk.Scrollbar(list_frame, orient=tk.VERTICAL)
+        self.listbox = tk.Listbox(
+            list_frame,
+            font=('Segoe UI', 9),
+            bg=colors['bg_card'],
+            fg=colors['text_primary'],
+            selectbackground=colors['accent'],
+            relief=tk.FLAT,
+            highlightthickness=0,
+            activestyle='none',
+            yscrollcommand=scrollbar.set
+        )
+        scrollbar.config(command=self.listbox.yview)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+
+    def show(self, path):
+        """Preview path; cached contents appear immediately"""
+        if path == self.path:
+            return
+        self.path = path
+        listing = self.lister.peek(path)
+        self.listing = listing
+        if listing is not None:
+            self.fill(*listing)
+        else:
+            self.clear(f"👁 {os.path.basename(path) or path}: loading...")
+        self.lister.request(path)
+        self.schedule_poll()
+
+    def clear(self, text="👁 Preview"):
+        self.listbox.delete(0, tk.END)
+        self.shown = 0
+        self.header.config(text=text)
+
+    def reset(self):
+        """Show nothing, e.g. when the selection is not a single path"""
+        self.path = None
+        self.listing = None
+        self.lister.cancel()
+        self.clear()
+
+    def fill(self, entries, total):
+        self.clear()
+        self.append(entries)
+        self.finish(total)
+
+    def append(self, entries):
+        self.listbox.insert(tk.END, *[entry_text(entry) for entry in entries])
+        self.shown += len(entries)
+
+    def finish(self, total):
+        name = os.path.basename(self.path) or self.path
+        if total > self.shown:
+            self.listbox.insert(tk.END, f"... and {total - self.shown:,} more")
+        self.header.config(text=f"👁 {name}: {total:,} items")
+
+    def schedule_poll(self):
+        if self.poll_id is None:
+            self.poll_id = self.frame.after(POLL_MS, self.poll)
+
+    def poll(self):
+        self.poll_id = None
+        finished = False
+        for kind, payload in self.lister.poll():
+            if kind == 'cached':
+                # peek() may have shown an older listing; this one is current
+                if payload is not self.listing:
+                    self.fill(*payload)
+                    self.listing = payload
+                finished = True
+            elif kind == 'start':
+                self.clear(f"👁 {os.path.basename(self.path) or self.path}: loading...")
+            elif kind == 'page':
+                self.append(payload)
+                self.header.config(text=f"👁 {os.path.basename(self.path) or self.path}: "
+                                        f"{self.shown:,} items so far...")
+            elif kind == 'done':
+                self.finish(payload)
+                finished = True
+            elif kind == 'error':
+                self.clear(f"👁 Cannot list folder: {payload}")
+                finished = True
+        if not finished and self.path is not None:
+            self.schedule_poll()
@@ -0,0 +1,203 @@
+import os
+import queue
+import sqlite3
+import threading
+import time
+
+STATS_FILE = "folder_stats.db"
+DUTY_CYCLE = 0.25      # fraction of wall time the walker may spend working
+WORK_SLICE_S = 0.05    # work between budget sleeps
+PARTIAL_EVERY = 500    # directories between partial totals
+FLUSH_EVERY = 2000     # directories between cache writes
+SUBDIR_SEPARATOR = "\x00"
+
+
+class FolderStats:
+    """Total size, file count and newest mtime of folder trees, computed in the background
+
+    One worker thread walks the requested folders a directory at a time,
+    reporting partial totals as it goes and sleeping between slices so it
+    uses at most DUTY_CYCLE of a core and of the disk. Each directory's own
+    totals are cached in SQLite with its mtime, so after a restart an
+    unchanged directory costs one stat instead of a listing. Changing a
+    file in place does not touch its directory's mtime, so such edits show
+    up only once something in that directory is added, removed or renamed.
+    """
+
+    def __init__(self, cache_file=STATS_FILE, duty=DUTY_CYCLE):
+        self.cache_file = cache_file
+        self.duty = duty
+        self.generation = 0
+        self.wanted = set()
+        self.totals = {}        # path -> (size, files, newest mtime, complete)
+        self.jobs = queue.Queue()
+        self.results = queue.Queue()
+        self.conn = None
+        self.pending = []       # dirty directory rows not yet written
+        self.worker = None
+
+    def request(self, paths):
+        """Compute totals for paths, in order, dropping any earlier request"""
+        paths = [path for path in paths if not (path in self.totals and self.totals[path][3])]
+        self.generation += 1
+        self.wanted = set(paths)
+        if not paths:
+            return
+        self.jobs.put((self.generation, paths))
+        if self.worker is None:
+            self.worker = threading.Thread(target=self._worker, name="folder-stats", daemon=True)
+            self.worker.start()
+
+    def cancel(self):
+        self.generation += 1
+        self.wanted = set()
+
+    def get(self, path):
+        return self.totals.get(path)
+
+    def poll(self):
+        """Return (path, (size, files, newest mtime, complete)) updates"""
+        updates = []
+        while True:
+            try:
+                updates.append(self.results.get_nowait())
+            except queue.Empty:
+                return updates
+
+    def _worker(self):
+        try:
+            self.conn = sqlite3.connect(self.cache_file)
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS dirs (
+                    path TEXT PRIMARY KEY,
+                    mtime INTEGER NOT NULL,
+                    size INTEGER NOT NULL,
+                    files INTEGER NOT NULL,
+                    newest INTEGER NOT NULL,
+                    subdirs TEXT NOT NULL
+                )
+            """)
+        except sqlite3.Error:
+            self.conn = None  # Still works, just without a cache across restarts
+
+        self.slice_started = time.perf_counter()
+        while True:
+            generation, paths = self.jobs.get()
+            for path in paths:
+                if generation != self.generation and path not in self.wanted:
+                    break
+                totals = self.totals.get(path)
+                if totals and totals[3]:
+                    continue  # Finished while an earlier request walked it
+                self.walk(path, generation)
+            self.flush()
+
+    def walk(self, root, generation):
+        size = files = newest = 0
+        stack = [root]
+        walked = 0
+        while stack:
+            if generation != self.generation and root not in self.wanted:
+                return  # No longer shown; what was walked stays cached
+            directory = stack.pop()
+            own = self.directory_totals(directory)
+            if own is None:
+                continue
+            dir_size, dir_files, dir_newest, subdirs = own
+            size += dir_size
+            files += dir_files
+            newest = max(newest, dir_newest)
+            stack.extend(os.path.join(directory, name) for name in subdirs)
+
+            walked += 1
+            if walked % PARTIAL_EVERY == 0:
+                self.report(root, (size, files, newest, False))
+            if len(self.pending) >= FLUSH_EVERY:
+                self.flush()
+            self.throttle()
+        self.report(root, (size, files, newest, True))
+
+    def report(self, path, totals):
+        self.totals[path] = totals
+        self.results.put((path, totals))
+
+    def throttle(self):
+        """Sleep so work takes at most duty of the time"""
+        worked = time.perf_counter() - self.slice_started
+        if worked >= WORK_SLICE_S:
+            time.sleep(worked * (1 - self.duty) / self.duty)
+            self.slice_started = time.perf_counter()
+
+    def directory_totals(self, directory):
+        """(size, files, newest mtime, subdirectory names) of one directory's own entries"""
+        try:
+            mtime = os.stat(directory).st_mtime_ns
+        except OSError:
+            return None
+        cached = self.cached(directory)
+        if cached and cached[0] == mtime:
+            return cached[1:]
+
+        size = files = 0
+        newest = mtime
+        subdirs = []
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            subdirs.append(entry.name)
+                            continue
+                        stat = entry.stat(follow_symlinks=False)
+                    except OSError:
+                        continue
+                    size += stat.st_size
+                    files += 1
+                    newest = max(newest, stat.st_mtime_ns)
+        except OSError:
+            return None
+        self.pending.append((directory, mtime, size, files, newest, SUBDIR_SEPARATOR.join(subdirs)))
+        return size, files, newest, subdirs
+
+    def cached(self, directory):
+        if self.conn is None:
+            return None
+        try:
+            row = self.conn.execute(
+                "SELECT mtime, size, files, newest, subdirs FROM dirs WHERE path = ?", (directory,)
+            ).fetchone()
+        except sqlite3.Error:
+            return None
+        if row is None:
+            return None
+        mtime, size, files, newest, subdirs = row
+        return mtime, size, files, newest, subdirs.split(SUBDIR_SEPARATOR) if subdirs else []
+
+    def flush(self):
+        rows, self.pending = self.pending, []
+        if not rows or self.conn is None:
+            return
+        try:
+            with self.conn:
+                self.conn.executemany("INSERT OR REPLACE INTO dirs VALUES (?, ?, ?, ?, ?, ?)", rows)
+        except sqlite3.Error:
+            pass
+
+
+def format_size(size):
+    for unit in ("B", "KB", "MB", "GB"):
+        if size < 1024:
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} TB"
+
+
+def format_totals(totals):
+    """Text for the size, files and modified columns; partial totals end in '…'"""
+    if totals is None:
+        return ('', '', '')
+    size, files, newest, complete = totals
+    mark = '' if complete else '…'
+    modified = time.strftime('%Y-%m-%d %H:%M', time.localtime(newest / 1e9)) if newest else ''
+    return (format_size(size) + mark, f"{files:,}{mark}", modified)
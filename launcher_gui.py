@@ -0,0 +1,1032 @@
+import tkinter as tk
+from tkinter import ttk
+import os
+import queue
+import threading
+import time
+
+import perf
+from folder_preview import PreviewPane
+from folder_stats import FolderStats, format_totals
+from path_store import SEARCH_LIMIT, PathStore, make_record
+from search_scheduler import SearchScheduler
+from startup_snapshot import read_snapshot, write_snapshot
+from status_probe import STATUS_CHECKING
+from storage import JsonStorage, StorageError, open_storage
+from tree_diff import TreeReconciler
+from virtual_list import VirtualList
+
+STATUS_POLL_MS = 50
+WATCH_POLL_MS = 250
+VIRTUAL_LIST_THRESHOLD = 5000  # rows above which only the viewport is materialized
+SEARCH_DELAY_MS = 150  # debounce between keystrokes and filtering
+RENDER_CHUNK_SIZE = 300  # tree operations per after() callback
+IMPORT_POLL_MS = 200
+IMPORT_REFRESH_S = 1.0  # how often a running import refreshes the tree
+LAUNCH_POLL_MS = 100
+STATS_POLL_MS = 250
+STATS_COLUMNS = ('size', 'files', 'modified')
+MAX_LISTED_FAILURES = 10  # failed paths spelled out in a batch report
+PERF_OVERLAY_MS = 1000
+SYNC_POLL_MS = 1000  # how often other processes' saved changes are merged in
+VALIDATE_POLL_MS = 50
+PERF_OVERLAY_SPANS = ('filter_paths', 'update_listbox', 'render', 'save', 'open_selected')
+
+class ModernPathLauncher:
+    def __init__(self, started=None):
+        self.started = time.perf_counter() if started is None else started
+        self.root = tk.Tk()
+        self.setup_window()
+        self.setup_styles()
+        self.store = PathStore(self.open_storage())
+        # Paint what the last run showed, straight from its columns; the real catalog is loaded behind it
+        self.snapshot = read_snapshot()  # shown until poll_validation installs the catalog
+        if not self.snapshot:
+            self.load_paths()
+        # Probing starts in finish_startup; until then rows show the snapshot's statuses
+        self.watcher = None
+        self.status_prober = None
+        self.seed_statuses = self.snapshot.statuses() if self.snapshot else {}
+        self.status_poll_id = None
+        self.row_keys = {}  # path -> tree keys of the rows showing it
+        self.daemon = None
+        self.window_requests = queue.Queue()
+        self.importer = None
+        self.import_batches = queue.Queue()
+        self.launcher = None  # started by the first open; see get_launcher
+        self.launch_poll_id = None
+        self.open_batch = None
+        self.selected_paths = []
+        self.preview = None  # built by finish_startup, after the first paint
+        self.folder_stats = None  # created when the columns are first shown; see toggle_stats
+        self.show_stats = tk.BooleanVar(value=False)
+        self.stats_poll_id = None
+        self.selected_path = tk.StringVar()
+        self.search_var = tk.StringVar()
+        self.search_scheduler = SearchScheduler(self.root, self.filter_paths, SEARCH_DELAY_MS)
+        self.search_var.trace('w', lambda *args: self.search_scheduler.schedule())
+        self.create_widgets()
+        self.update_listbox()
+        self.root.bind_all('<Key>', self.record_first_input)
+        self.root.bind_all('<Button>', self.record_first_input)
+        self.store.start_team_sync()
+        if self.snapshot:
+            self.validate_snapshot()
+        else:
+            self.root.after(SYNC_POLL_MS, self.poll_sync)
+        
+    def setup_window(self):
+        self.root.title("🚀 Modern Path Launcher")
+        self.root.geometry("980x650")
+        self.root.configure(bg="#1a1a1a")
+        self.root.resizable(True, True)
+        
+        # Center window on screen; the size is fixed, so no layout pass is needed first
+        x = (self.root.winfo_screenwidth() // 2) - (980 // 2)
+        y = (self.root.winfo_screenheight() // 2) - (650 // 2)
+        self.root.geometry(f"980x650+{x}+{y}")
+        
+        # Set minimum size
+        self.root.minsize(600, 500)
+        
+    def setup_styles(self):
+        self.colors = {
+            'bg_primary': '#1a1a1a',
+            'bg_secondary': '#2d2d2d',
+            'bg_card': '#3d3d3d',
+            'accent': '#0078d7',
+            'accent_hover': '#106ebe',
+            'success': '#28a745',
+            'success_hover': '#218838',
+            'danger': '#dc3545',
+            'danger_hover': '#c82333',
+            'text_primary': '#ffffff',
+            'text_secondary': '#b3b3b3',
+            'border': '#4a4a4a',
+            'open_glow': '#4dabf7'  # Special glow effect for open button
+        }
+        
+        # Configure ttk styles
+        style = ttk.Style()
+        style.theme_use('clam')
+        
+        # Configure treeview style
+        style.configure("Custom.Treeview",
+                       background=self.colors['bg_card'],
+                       foreground=self.colors['text_primary'],
+                       fieldbackground=self.colors['bg_card'],
+                       borderwidth=0,
+                       font=('Segoe UI', 10))
+        
+        style.configure("Custom.Treeview.Heading",
+                       background=self.colors['bg_secondary'],
+                       foreground=self.colors['text_primary'],
+                       font=('Segoe UI', 10, 'bold'))
+        
+        style.map("Custom.Treeview",
+                 background=[('selected', self.colors['accent'])])
+        
+    def open_storage(self):
+        from tkinter import messagebox
+        try:
+            return open_storage()
+        except StorageError as e:
+            messagebox.showwarning("Saved Paths", f"Falling back to saved_paths.json:\n{str(e)}")
+            return JsonStorage()
+            
+    def load_paths(self):
+        """Load paths from the store, reporting unreadable saved paths"""
+        from tkinter import messagebox
+        with perf.span('load_paths'):
+            self.store.load()
+        if self.store.load_error:
+            messagebox.showwarning("Saved Paths", f"Could not load saved paths:\n{str(self.store.load_error)}")
+    
+    def validate_snapshot(self):
+        """Build the real catalog and its index on a worker thread while the snapshot stays on screen"""
+        done = queue.Queue()
+        
+        def load():
+            with perf.span('load_paths'):
+                self.store.load()
+            done.put(True)
+            
+        threading.Thread(target=load, name="catalog-load", daemon=True).start()
+        self.poll_validation(done)
+        
+    def poll_validation(self, done):
+        if done.empty():
+            self.root.after(VALIDATE_POLL_MS, self.poll_validation, done)
+            return
+        if self.store.load_error:
+            from tkinter import messagebox
+            messagebox.showwarning("Saved Paths", f"Could not load saved paths:\n{str(self.store.load_error)}")
+        # Rows keep their keys, so swapping the snapshot for the catalog only touches what changed
+        self.snapshot = None
+        self.refresh_catalog()
+        # Only now, so syncing never races the load for the storage
+        self.root.after(SYNC_POLL_MS, self.poll_sync)
+        
+    def save_snapshot(self):
+        if self.snapshot:
+            return  # Closed before the catalog loaded; the snapshot on disk is still the newest
+        records, saved = self.store.snapshot()
+        statuses = self.status_prober.cache if self.status_prober else self.seed_statuses
+        write_snapshot(records, saved, statuses)
+        
+    def record_first_paint(self):
+        # Flush pending redraws so the time covers the window actually painted
+        self.root.update_idletasks()
+        perf.record('first_paint', time.perf_counter() - self.started)
+        # Idle work queued from here runs after input already waiting
+        self.root.after_idle(self.finish_startup)
+        
+    def finish_startup(self):
+        """Build what the first keystroke does not need"""
+        self.preview = PreviewPane(self.preview_frame, self.colors)
+        self.preview.frame.pack(fill=tk.BOTH, expand=True)
+        if len(self.selected_paths) == 1:
+            self.preview.show(self.selected_paths[0])
+        self.bind_hover_effects()
+        # The watcher and probe threads touch the disk, so they wait for the first paint too
+        from path_watcher import PathWatcher
+        from status_probe import StatusProber
+        self.watcher = PathWatcher()
+        self.status_prober = StatusProber(watcher=self.watcher)
+        self.status_prober.seed(self.seed_statuses)
+        for path in self.row_keys:
+            self.status_prober.probe(path)
+        self.schedule_status_poll()
+        self.poll_watcher()
+        
+    def record_first_input(self, event):
+        # Typed or clicked before startup finished, this also covers the wait
+        self.root.unbind_all('<Key>')
+        self.root.unbind_all('<Button>')
+        perf.record('first_input', time.perf_counter() - self.started)
+        
+    def create_widgets(self):
+        # Main container
+        main_frame = tk.Frame(self.root, bg=self.colors['bg_primary'])
+        main_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
+        
+        # Header
+        self.create_header(main_frame)
+        
+        # Search section
+        self.create_search_section(main_frame)
+        
+        # Path list section
+        self.create_path_list_section(main_frame)
+        
+        # Selected path section
+        self.create_selected_path_section(main_frame)
+        
+        # Button section
+        self.create_button_section(main_frame)
+        
+        # Status bar
+        self.create_status_bar(main_frame)
+        
+    def create_header(self, parent):
+        header_frame = tk.Frame(parent, bg=self.colors['bg_primary'])
+        header_frame.pack(fill=tk.X, pady=(0, 20))
+        
+        title_label = tk.Label(
+            header_frame,
+            text="🚀 Modern Path Launcher",
+            font=('Segoe UI', 24, 'bold'),
+            fg=self.colors['text_primary'],
+            bg=self.colors['bg_primary']
+        )
+        title_label.pack()
+        
+        subtitle_label = tk.Label(
+            header_frame,
+            text="Quick access to your favorite Windows locations",
+            font=('Segoe UI', 11),
+            fg=self.colors['text_secondary'],
+            bg=self.colors['bg_primary']
+        )
+        subtitle_label.pack()
+        
+    def create_search_section(self, parent):
+        search_frame = tk.Frame(parent, bg=self.colors['bg_secondary'])
+        search_frame.pack(fill=tk.X, pady=(0, 15))
+        search_frame.configure(relief=tk.RAISED, bd=1)
+        
+        tk.Label(
+            search_frame,
+            text="🔍 Search Paths:",
+            font=('Segoe UI', 10, 'bold'),
+            fg=self.colors['text_primary'],
+            bg=self.colors['bg_secondary']
+        ).pack(anchor=tk.W, padx=15, pady=(10, 5))
+        
+        self.search_entry = tk.Entry(
+            search_frame,
+            textvariable=self.search_var,
+            font=('Segoe UI', 11),
+            bg=self.colors['bg_card'],
+            fg=self.colors['text_primary'],
+            insertbackground=self.colors['text_primary'],
+            relief=tk.FLAT,
+            bd=5
+        )
+        self.search_entry.pack(fill=tk.X, padx=15, pady=(0, 10))
+        
+    def create_path_list_section(self, parent):
+        list_frame = tk.Frame(parent, bg=self.colors['bg_secondary'])
+        list_frame.pack(fill=tk.BOTH, expand=True, pady=(0, 15))
+        list_frame.configure(relief=tk.RAISED, bd=1)
+        
+        list_header = tk.Frame(list_frame, bg=self.colors['bg_secondary'])
+        list_header.pack(fill=tk.X, padx=15, pady=(10, 5))
+        
+        tk.Label(
+            list_header,
+            text="📂 Available Paths:",
+            font=('Segoe UI', 10, 'bold'),
+            fg=self.colors['text_primary'],
+            bg=self.colors['bg_secondary']
+        ).pack(side=tk.LEFT)
+        
+        # Folder sizes are optional: computing them walks whole trees
+        tk.Checkbutton(
+            list_header,
+            text="📏 Folder sizes",
+            variable=self.show_stats,
+            command=self.toggle_stats,
+            font=('Segoe UI', 9),
+            fg=self.colors['text_secondary'],
+            bg=self.colors['bg_secondary'],
+            selectcolor=self.colors['bg_card'],
+            activebackground=self.colors['bg_secondary'],
+            activeforeground=self.colors['text_primary'],
+            bd=0,
+            highlightthickness=0
+        ).pack(side=tk.RIGHT)
+        
+        # Tree on the left, preview of the selected folder on the right
+        panes = tk.PanedWindow(list_frame, orient=tk.HORIZONTAL, bg=self.colors['bg_secondary'],
+                               sashwidth=6, bd=0)
+        panes.pack(fill=tk.BOTH, expand=True, padx=15, pady=(0, 10))
+        
+        # Create treeview for better organization
+        tree_frame = tk.Frame(panes, bg=self.colors['bg_secondary'])
+        panes.add(tree_frame, stretch='always', minsize=300)
+        
+        # The preview fills this in once the window is up; the space is kept so nothing moves
+        self.preview_frame = tk.Frame(panes, bg=self.colors['bg_secondary'])
+        panes.add(self.preview_frame, width=240, minsize=150)
+        
+        # Treeview with scrollbar
+        self.tree = ttk.Treeview(tree_frame, style="Custom.Treeview", height=12, selectmode='extended')
+        self.tree['columns'] = ('path', 'status') + STATS_COLUMNS
+        self.tree['displaycolumns'] = ('path', 'status')
+        self.tree['show'] = 'tree headings'
+        
+        self.tree.heading('#0', text='Name', anchor=tk.W)
+        self.tree.heading('path', text='Path', anchor=tk.W)
+        self.tree.heading('status', text='Status', anchor=tk.CENTER)
+        self.tree.heading('size', text='Size', anchor=tk.E)
+        self.tree.heading('files', text='Files', anchor=tk.E)
+        self.tree.heading('modified', text='Modified', anchor=tk.W)
+        
+        self.tree.column('#0', width=200, minwidth=150)
+        self.tree.column('path', width=300, minwidth=200)
+        self.tree.column('status', width=80, minwidth=80)
+        self.tree.column('size', width=80, minwidth=60, anchor=tk.E)
+        self.tree.column('files', width=70, minwidth=50, anchor=tk.E)
+        self.tree.column('modified', width=120, minwidth=90)
+        self.tree_sync = TreeReconciler(self.tree)
+        
+        # Scrollbars
+        v_scrollbar = ttk.Scrollbar(tree_frame, orient=tk.VERTICAL, command=self.tree.yview)
+        h_scrollbar = ttk.Scrollbar(tree_frame, orient=tk.HORIZONTAL, command=self.tree.xview)
+        self.tree.configure(yscrollcommand=v_scrollbar.set, xscrollcommand=h_scrollbar.set)
+        
+        # Pack treeview and scrollbars
+        self.tree.grid(row=0, column=0, sticky='nsew')
+        v_scrollbar.grid(row=0, column=1, sticky='ns')
+        h_scrollbar.grid(row=1, column=0, sticky='ew')
+        
+        tree_frame.grid_rowconfigure(0, weight=1)
+        tree_frame.grid_columnconfigure(0, weight=1)
+        
+        self.virtual_list = VirtualList(self.tree, v_scrollbar, self.tree_sync, self.show_rows,
+                                        threshold=VIRTUAL_LIST_THRESHOLD)
+        
+        # Bind selection event; after the virtual list so it has seen the selection first
+        self.tree.bind('<<TreeviewSelect>>', self.on_tree_select, add='+')
+        self.tree.bind('<Double-1>', lambda e: self.open_selected())
+        
+    def create_selected_path_section(self, parent):
+        selected_frame = tk.Frame(parent, bg=self.colors['bg_secondary'])
+        selected_frame.pack(fill=tk.X, pady=(0, 15))
+        selected_frame.configure(relief=tk.RAISED, bd=1)
+        
+        tk.Label(
+            selected_frame,
+            text="📍 Selected Path:",
+            font=('Segoe UI', 16, 'bold'),
+            fg=self.colors['text_primary'],
+            bg=self.colors['bg_secondary']
+        ).pack(anchor=tk.W, padx=15, pady=(10, 5))
+        
+        self.selected_label = tk.Label(
+            selected_frame,
+            textvariable=self.selected_path,
+            font=('Segoe UI', 16),
+            fg=self.colors['text_secondary'],
+            bg=self.colors['bg_card'],
+            relief=tk.FLAT,
+            bd=5,
+            anchor=tk.W
+        )
+        self.selected_label.pack(fill=tk.X, padx=15, pady=(0, 10))
+        self.selected_path.set("No path selected")
+        
+    def create_button_section(self, parent):
+        # Main button container
+        main_button_frame = tk.Frame(parent, bg=self.colors['bg_primary'])
+        main_button_frame.pack(fill=tk.X, pady=(0, 15))
+        
+        # Big Open button (main action)
+        open_frame = tk.Frame(main_button_frame, bg=self.colors['bg_secondary'], relief=tk.RAISED, bd=2)
+        open_frame.pack(fill=tk.X, pady=(0, 15))
+        
+        self.open_btn = tk.Button(
+            open_frame,
+            text="🚀 OPEN SELECTED PATH",
+            font=('Segoe UI', 18, 'bold'),
+            bg=self.colors['accent'],
+            fg=self.colors['text_primary'],
+            command=self.open_selected,
+            relief=tk.FLAT,
+            bd=0,
+            cursor='hand2',
+            height=3,
+            activebackground=self.colors['accent_hover'],
+            activeforeground=self.colors['text_primary']
+        )
+        self.open_btn.pack(fill=tk.BOTH, padx=15, pady=15)
+        
+        # Secondary buttons row
+        secondary_frame = tk.Frame(main_button_frame, bg=self.colors['bg_primary'])
+        secondary_frame.pack(fill=tk.X)
+        
+        # Secondary button style
+        secondary_btn_style = {
+            'font': ('Segoe UI', 12, 'bold'),
+            'relief': tk.FLAT,
+            'bd': 0,
+            'cursor': 'hand2',
+            'height': 2
+        }
+        
+        self.add_btn = tk.Button(
+            secondary_frame,
+            text="➕ Add Custom Path",
+            bg=self.colors['success'],
+            fg=self.colors['text_primary'],
+            command=self.add_path,
+            activebackground=self.colors['success_hover'],
+            activeforeground=self.colors['text_primary'],
+            **secondary_btn_style
+        )
+        self.add_btn.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(0, 5))
+        
+        self.import_btn = tk.Button(
+            secondary_frame,
+            text="📥 Import Folders",
+            bg=self.colors['accent'],
+            fg=self.colors['text_primary'],
+            command=self.import_folders,
+            activebackground=self.colors['accent_hover'],
+            activeforeground=self.colors['text_primary'],
+            **secondary_btn_style
+        )
+        self.import_btn.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=5)
+        
+        self.remove_btn = tk.Button(
+            secondary_frame,
+            text="❌ Remove Path",
+            bg=self.colors['danger'],
+            fg=self.colors['text_primary'],
+            command=self.remove_selected,
+            activebackground=self.colors['danger_hover'],
+            activeforeground=self.colors['text_primary'],
+            **secondary_btn_style
+        )
+        self.remove_btn.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(5, 0))
+        
+    def create_status_bar(self, parent):
+        status_frame = tk.Frame(parent, bg=self.colors['bg_secondary'], height=30)
+        status_frame.pack(fill=tk.X, side=tk.BOTTOM)
+        status_frame.pack_propagate(False)
+        
+        self.status_label = tk.Label(
+            status_frame,
+            text=f"📊 Total paths: {len(self.store)}",
+            font=('Segoe UI', 9),
+            fg=self.colors['text_secondary'],
+            bg=self.colors['bg_secondary']
+        )
+        self.status_label.pack(side=tk.LEFT, padx=10, pady=5)
+        
+        # Timings of the hot paths, when started with --perf-overlay
+        if perf.overlay:
+            self.perf_label = tk.Label(
+                status_frame,
+                text=perf.overlay_text(PERF_OVERLAY_SPANS),
+                font=('Consolas', 8),
+                fg=self.colors['text_secondary'],
+                bg=self.colors['bg_secondary']
+            )
+            self.perf_label.pack(side=tk.RIGHT, padx=10, pady=5)
+            self.root.after(PERF_OVERLAY_MS, self.refresh_perf_overlay)
+            
+    def refresh_perf_overlay(self):
+        self.perf_label.config(text=perf.overlay_text(PERF_OVERLAY_SPANS))
+        self.root.after(PERF_OVERLAY_MS, self.refresh_perf_overlay)
+        
+    def bind_hover_effects(self):
+        def on_enter(e, color):
+            e.widget.config(bg=color)
+        
+        def on_leave(e, color):
+            e.widget.config(bg=color)
+            
+        def on_enter_open(e):
+            e.widget.config(bg=self.colors['accent_hover'])
+            e.widget.config(font=('Segoe UI', 19, 'bold'))  # Slightly bigger on hover
+        
+        def on_leave_open(e):
+            e.widget.config(bg=self.colors['accent'])
+            e.widget.config(font=('Segoe UI', 18, 'bold'))  # Back to normal
+        
+        # Big open button special effects
+        self.open_btn.bind('<Enter>', on_enter_open)
+        self.open_btn.bind('<Leave>', on_leave_open)
+        
+        # Secondary buttons
+        self.add_btn.bind('<Enter>', lambda e: on_enter(e, self.colors['success_hover']))
+        self.add_btn.bind('<Leave>', lambda e: on_leave(e, self.colors['success']))
+        
+        self.import_btn.bind('<Enter>', lambda e: on_enter(e, self.colors['accent_hover']))
+        self.import_btn.bind('<Leave>', lambda e: on_leave(e, self.colors['accent']))
+        
+        self.remove_btn.bind('<Enter>', lambda e: on_enter(e, self.colors['danger_hover']))
+        self.remove_btn.bind('<Leave>', lambda e: on_leave(e, self.colors['danger']))
+        
+    def path_row(self, parent_key, path_info, seen):
+        """Build the target tree node for one path record"""
+        path = path_info.path
+        # A path listed twice still needs a distinct key per row
+        key = ('path', path, seen.get(path, 0))
+        seen[path] = key[2] + 1
+        return (key, parent_key, path_info.name, (path, ''))
+        
+    def snapshot_rows(self, parent_key, indexes):
+        """Target tree nodes for snapshot records, keyed like path_row keys them"""
+        names = map(self.snapshot.names.__getitem__, indexes)
+        paths = map(self.snapshot.paths.__getitem__, indexes)
+        # Snapshot paths are unique, so each is the first row showing it
+        return [(('path', path, 0), parent_key, name, (path, '')) for path, name in zip(paths, names)]
+        
+    def render_rows(self, rows):
+        # Big catalogs only materialize the rows around the viewport
+        if not self.virtual_list.show(rows):
+            self.show_rows(rows)
+            
+    def show_rows(self, rows):
+        """Put rows in the tree; status probes for rows no longer shown are dropped"""
+        self.row_keys = {}
+        if self.status_prober:
+            self.status_prober.cancel_all()
+        shown = []
+        for key, parent_key, text, values in rows:
+            if key[0] == 'path':
+                # Status is filled in later by poll_status
+                path = key[1]
+                self.row_keys.setdefault(path, []).append(key)
+                status = self.status_prober.probe(path) if self.status_prober else self.row_status(path)
+                values = self.row_values(path, status)
+            shown.append((key, parent_key, text, values))
+        if self.show_stats.get():
+            self.folder_stats.request(list(self.row_keys))
+        self.search_scheduler.render(self.render_steps(shown, time.perf_counter()))
+        
+    def row_status(self, path):
+        """Last known status of path, or what the snapshot remembered before probing starts"""
+        if self.status_prober is None:
+            return self.seed_statuses.get(path, STATUS_CHECKING)
+        return self.status_prober.status(path)
+        
+    def row_values(self, path, status):
+        if not self.show_stats.get():
+            return (path, status)
+        return (path, status) + format_totals(self.folder_stats.get(path))
+        
+    def render_steps(self, rows, started):
+        """Apply rows a chunk at a time so typing stays responsive"""
+        for _ in self.tree_sync.apply_steps(rows, RENDER_CHUNK_SIZE):
+            yield
+        # Probes that finished mid-render missed rows inserted after them
+        for path, keys in self.row_keys.items():
+            values = self.row_values(path, self.row_status(path))
+            for key in keys:
+                self.tree_sync.update(key, values=values)
+        # Wall time of the whole chunked render, including the gaps between chunks
+        perf.record('render', time.perf_counter() - started)
+        self.schedule_status_poll()
+        
+    def schedule_status_poll(self):
+        if self.status_poll_id is None and self.status_prober and self.status_prober.busy():
+            self.status_poll_id = self.root.after(STATUS_POLL_MS, self.poll_status)
+            
+    def poll_status(self):
+        """Apply finished status probes to the rows still showing them"""
+        self.status_poll_id = None
+        for path, status in self.status_prober.poll():
+            values = self.row_values(path, status)
+            for key in self.row_keys.get(path, ()):
+                self.tree_sync.update(key, values=values)
+        self.schedule_status_poll()
+        
+    def poll_watcher(self):
+        """Re-check shown paths the watcher saw change; nothing else is probed again"""
+        changed = self.watcher.poll()
+        for path in changed:
+            self.status_prober.invalidate(path)
+            if path in self.row_keys:
+                self.status_prober.probe(path)
+        if changed:
+            self.schedule_status_poll()
+        self.root.after(WATCH_POLL_MS, self.poll_watcher)
+        
+    def poll_sync(self):
+        """Merge paths saved, removed or opened by other windows, the daemon or the command line"""
+        try:
+            changes = self.store.sync()
+        except StorageError:
+            changes = ([], [])  # Try again on the next poll
+        used = self.store.sync_usage()
+        if changes is None or changes[0] or changes[1] or used:
+            removed = changes[1] if changes else []
+            gone = {path_info.path for path_info in removed}
+            if gone & set(self.selected_paths):
+                self.selected_paths = [path for path in self.selected_paths if path not in gone]
+                self.selected_path.set(self.selected_paths[0] if self.selected_paths else "No path selected")
+            self.refresh_catalog()
+        self.root.after(SYNC_POLL_MS, self.poll_sync)
+        
+    def refresh_catalog(self):
+        """Redraw after the catalog changed underneath the current view"""
+        # Re-running the current filter only touches the rows that changed
+        self.filter_paths()
+        self.status_label.config(text=f"📊 Total paths: {len(self.store)}")
+        
+    def toggle_stats(self):
+        """Show or hide the size, files and modified columns"""
+        if self.show_stats.get():
+            self.tree['displaycolumns'] = ('path', 'status') + STATS_COLUMNS
+            if self.folder_stats is None:
+                self.folder_stats = FolderStats()
+            self.folder_stats.request(list(self.row_keys))
+            if self.stats_poll_id is None:
+                self.poll_stats()
+        else:
+            self.tree['displaycolumns'] = ('path', 'status')
+            self.folder_stats.cancel()
+        self.refresh_row_values(self.row_keys)
+        
+    def refresh_row_values(self, paths):
+        for path in paths:
+            values = self.row_values(path, self.row_status(path))
+            for key in self.row_keys.get(path, ()):
+                self.tree_sync.update(key, values=values)
+                
+    def poll_stats(self):
+        """Apply partial and final folder totals while the columns are shown"""
+        self.stats_poll_id = None
+        if not self.show_stats.get():
+            return
+        self.refresh_row_values({path for path, totals in self.folder_stats.poll()})
+        self.stats_poll_id = self.root.after(STATS_POLL_MS, self.poll_stats)
+        
+    @perf.timed('update_listbox')
+    def update_listbox(self):
+        if self.snapshot:
+            rows = []
+            for category, indexes in self.snapshot.groups().items():
+                category_key = ('category', category)
+                rows.append((category_key, None, f"📁 {category}", ('', '')))
+                rows.extend(self.snapshot_rows(category_key, indexes))
+            self.render_rows(rows)
+            self.status_label.config(text=f"📊 Total paths: {len(self.snapshot)}")
+            return
+        
+        # Group paths by category
+        categories = self.store.by_category()
+        
+        # Build the target tree; only the differences reach the Treeview
+        rows = []
+        seen = {}
+        frequent = self.store.frequent()
+        if frequent:
+            frequent_key = ('frequent',)
+            rows.append((frequent_key, None, "⭐ Frequent", ('', '')))
+            for path_info in frequent:
+                rows.append(self.path_row(frequent_key, path_info, seen))
+        for category, paths in categories.items():
+            category_key = ('category', category)
+            rows.append((category_key, None, f"📁 {category}", ('', '')))
+            
+            for path_info in paths:
+                rows.append(self.path_row(category_key, path_info, seen))
+        self.render_rows(rows)
+        
+        # Update status
+        self.status_label.config(text=f"📊 Total paths: {len(self.store)}")
+        
+    @perf.timed('filter_paths')
+    def filter_paths(self, *args):
+        search_term = self.search_var.get().lower()
+        
+        if not search_term:
+            self.update_listbox()
+            return
+        
+        # Filter and display matching paths; a letter or two lists only the first matches
+        if self.snapshot:
+            filtered_paths, complete = self.snapshot.search(search_term, SEARCH_LIMIT)
+        else:
+            filtered_paths, complete = self.store.search_top(search_term)
+        
+        rows = []
+        seen = {}
+        if filtered_paths:
+            search_key = ('search',)
+            title = "🔍 Search Results" if complete else f"🔍 First {SEARCH_LIMIT} Results (keep typing to narrow)"
+            rows.append((search_key, None, title, ('', '')))
+            if self.snapshot:
+                rows.extend(self.snapshot_rows(search_key, filtered_paths))
+            else:
+                for path_info in filtered_paths:
+                    rows.append(self.path_row(search_key, path_info, seen))
+        self.render_rows(rows)
+        
+    def on_tree_select(self, event):
+        keys = self.virtual_list.selection()
+        if keys is None:
+            keys = [self.tree_sync.key_of(item) for item in self.tree.selection()]
+        if not keys:
+            return
+        
+        # Category rows have no path; a path listed twice is opened once
+        paths = []
+        for key in keys:
+            if key and key[0] == 'path' and key[1] not in paths:
+                paths.append(key[1])
+        self.selected_paths = paths
+        # Before finish_startup there is no pane; it shows the selection itself
+        if self.preview is not None:
+            if len(paths) == 1:
+                self.preview.show(paths[0])
+            else:
+                self.preview.reset()
+        if not paths:
+            self.selected_path.set("No path selected")
+        elif len(paths) == 1:
+            self.selected_path.set(paths[0])
+        else:
+            self.selected_path.set(f"{len(paths)} paths selected: {paths[0]}, ...")
+        
+    def still_loading(self):
+        """While only the snapshot is shown, saved paths cannot be changed yet"""
+        if not self.snapshot:
+            return False
+        from tkinter import messagebox
+        messagebox.showinfo("Still Loading", "Saved paths are still loading. Try again in a moment.")
+        return True
+        
+    def add_path(self):
+        from tkinter import filedialog, messagebox
+        
+        if self.still_loading():
+            return
+        folder = filedialog.askdirectory(title="Select Folder to Add")
+        if folder:
+            # Check if path already exists
+            if not self.store.contains(folder):
+                try:
+                    self.store.add(make_record(folder))
+                except StorageError as e:
+                    messagebox.showerror("Error", f"Failed to save paths:\n{str(e)}")
+                    return
+                self.update_listbox()
+                messagebox.showinfo("Success", f"Path added successfully:\n{folder}")
+            else:
+                messagebox.showwarning("Duplicate", "This path already exists in the list.")
+    
+    def import_folders(self):
+        """Add every folder below a chosen root, scanning in the background"""
+        from tkinter import messagebox
+        if self.still_loading():
+            return
+        if self.importer is not None:
+            messagebox.showinfo("Import Running", "A folder import is already in progress.")
+            return
+        from tkinter import filedialog, simpledialog
+        from bulk_import import BulkImporter
+        
+        folder = filedialog.askdirectory(title="Select Folder to Import From")
+        if not folder:
+            return
+        depth = simpledialog.askinteger(
+            "Import Depth", "How many folder levels below it should be added?",
+            initialvalue=2, minvalue=1, maxvalue=10, parent=self.root
+        )
+        if not depth:
+            return
+        
+        self.importer = BulkImporter([folder], max_depth=depth)
+        self.import_added = 0
+        self.import_refreshed = time.monotonic()
+        threading.Thread(target=self.scan_for_import, args=(self.importer,), daemon=True).start()
+        self.poll_import()
+        
+    def scan_for_import(self, importer):
+        # Worker thread: it only scans, the Tk thread writes batches to the store
+        try:
+            for batch in importer.batches():
+                self.import_batches.put(batch)
+        finally:
+            self.import_batches.put(None)
+            
+    def poll_import(self):
+        importer = self.importer
+        finished = False
+        added = False
+        while True:
+            try:
+                batch = self.import_batches.get_nowait()
+            except queue.Empty:
+                break
+            if batch is None:
+                finished = True
+                break
+            if importer.cancelled:
+                continue  # Scanned before the failed save stopped the walk; one error is enough
+            try:
+                new_paths = self.store.add_many(batch)
+            except StorageError as e:
+                importer.cancel()
+                from tkinter import messagebox
+                messagebox.showerror("Error", f"Failed to save paths:\n{str(e)}")
+                continue
+            self.import_added += len(new_paths)
+            added = added or bool(new_paths)
+        
+        if finished or (added and time.monotonic() - self.import_refreshed > IMPORT_REFRESH_S):
+            self.filter_paths()
+            self.import_refreshed = time.monotonic()
+            
+        if finished:
+            self.importer = None
+            if importer.cancelled:
+                self.status_label.config(text=f"⚠️ Import stopped after {self.import_added} new paths")
+            else:
+                self.status_label.config(text=f"📥 Imported {self.import_added} new paths "
+                                              f"from {importer.scanned} folders")
+            return
+        self.status_label.config(text=f"📥 Importing: {importer.scanned} folders scanned, "
+                                      f"{importer.found} found, {self.import_added} added")
+        self.root.after(IMPORT_POLL_MS, self.poll_import)
+        
+    @perf.timed('open_selected')
+    def open_selected(self):
+        from tkinter import messagebox
+        paths = self.selected_paths
+        if not paths:
+            messagebox.showwarning("No Selection", "Please select a path from the list.")
+            # Flash the open button to draw attention
+            self.flash_open_button()
+            return
+        
+        # Visual feedback - button press effect, painted by the event loop
+        self.open_btn.config(bg=self.colors['accent_hover'])
+        self.root.after(100, lambda: self.open_btn.config(bg=self.colors['accent']))
+        
+        # Openers start through the launcher's queue, which also checks the paths exist,
+        # so a dead network share never stalls this thread; poll_launches collects the outcomes
+        if self.open_batch is None:
+            self.open_batch = {'total': 0, 'opened': [], 'failed': [], 'pending': []}
+        batch = self.open_batch
+        batch['total'] += len(paths)
+        batch['pending'].extend(paths)
+        self.get_launcher().launch_many(paths)
+        self.show_open_progress()
+        self.schedule_launch_poll()
+        
+    def get_launcher(self):
+        """The Launcher, created on first use so subprocess is not imported at startup"""
+        if self.launcher is None:
+            from opener import Launcher
+            self.launcher = Launcher()
+        return self.launcher
+        
+    def schedule_launch_poll(self):
+        if self.launch_poll_id is None:
+            self.launch_poll_id = self.root.after(LAUNCH_POLL_MS, self.poll_launches)
+            
+    def poll_launches(self):
+        self.launch_poll_id = None
+        batch = self.open_batch
+        opened = False
+        # Read first: a launch finishing after this already has its outcome queued for the next poll
+        running = self.launcher.running()
+        for path, error, seconds in self.launcher.poll():
+            if batch and path in batch['pending']:
+                batch['pending'].remove(path)
+                if error:
+                    batch['failed'].append((path, error))
+                else:
+                    batch['opened'].append(path)
+                    self.store.record_open(path)
+                    opened = True
+            elif error:
+                # Opened for the daemon, not from this window's selection
+                self.status_label.config(text=f"⚠️ Failed to open: {os.path.basename(path)}")
+            else:
+                self.status_label.config(text=f"📂 Opened: {os.path.basename(path)}")
+        if opened:
+            # The Frequent category and search order follow what was just opened
+            self.filter_paths()
+        if batch:
+            self.show_open_progress()
+        if running:
+            self.schedule_launch_poll()
+            
+    def show_open_progress(self):
+        batch = self.open_batch
+        if batch['pending']:
+            done = batch['total'] - len(batch['pending'])
+            self.status_label.config(text=f"🚀 Opening: {done} of {batch['total']} done")
+            return
+        
+        # Everything finished: one report for the whole batch
+        self.open_batch = None
+        failed = batch['failed']
+        if not failed:
+            if batch['total'] == 1:
+                self.status_label.config(text=f"📂 Opened: {os.path.basename(batch['opened'][0])}")
+            else:
+                self.status_label.config(text=f"📂 Opened {batch['total']} paths")
+            return
+        
+        self.status_label.config(text=f"⚠️ Opened {len(batch['opened'])} of {batch['total']} paths")
+        details = "\n".join(f"{path}\n    {error}" for path, error in failed[:MAX_LISTED_FAILURES])
+        if len(failed) > MAX_LISTED_FAILURES:
+            details += f"\n... and {len(failed) - MAX_LISTED_FAILURES} more"
+        from tkinter import messagebox
+        messagebox.showerror("Error", f"Failed to open {len(failed)} of {batch['total']} paths:\n\n{details}")
+        
+    def flash_open_button(self):
+        """Flash the open button to draw user attention"""
+        original_color = self.open_btn.cget('bg')
+        flash_color = self.colors['danger']
+        
+        def flash_cycle(count=0):
+            if count < 6:  # Flash 3 times
+                color = flash_color if count % 2 == 0 else original_color
+                self.open_btn.config(bg=color)
+                self.root.after(200, lambda: flash_cycle(count + 1))
+            else:
+                self.open_btn.config(bg=original_color)
+    
+    def remove_selected(self):
+        from tkinter import messagebox
+        if not self.selected_paths:
+            messagebox.showwarning("No Selection", "Please select a path to remove.")
+            return
+        if len(self.selected_paths) > 1:
+            messagebox.showwarning("Multiple Selection", "Please select a single path to remove.")
+            return
+        current_path = self.selected_paths[0]
+        if self.still_loading():
+            return
+        
+        # Only custom paths can be removed
+        if self.store.is_removable(current_path):
+            if messagebox.askyesno("Confirm Removal", f"Remove this path?\n{current_path}"):
+                try:
+                    self.store.remove(current_path)
+                except StorageError as e:
+                    messagebox.showerror("Error", f"Failed to save paths:\n{str(e)}")
+                    return
+                self.update_listbox()
+                self.selected_paths = []
+                self.selected_path.set("No path selected")
+                messagebox.showinfo("Success", "Path removed successfully.")
+            return
+        
+        messagebox.showwarning("Cannot Remove", "Only custom paths can be removed.")
+    
+    def start_daemon(self):
+        """Serve daemon requests from this process; closing only hides the window"""
+        from daemon import LauncherDaemon
+        
+        # Made here, before any socket thread can race to create it
+        self.get_launcher()
+        self.daemon = LauncherDaemon(self.store, self.launch_for_daemon,
+                                     show_window=lambda: self.window_requests.put('show'),
+                                     reload=lambda: self.window_requests.put('reload'))
+        if not self.daemon.start():
+            self.daemon = None
+            return False
+        self.root.withdraw()
+        self.root.protocol("WM_DELETE_WINDOW", self.root.withdraw)
+        self.poll_window_requests()
+        return True
+        
+    def launch_for_daemon(self, path):
+        # Called on a socket thread; the outcome is picked up by the Tk thread
+        self.launcher.launch(path)
+        self.window_requests.put('launched')
+        
+    def poll_window_requests(self):
+        # Socket threads must not touch Tk, so daemon requests go through a queue
+        requests = set()
+        while not self.window_requests.empty():
+            requests.add(self.window_requests.get_nowait())
+        if 'launched' in requests:
+            self.schedule_launch_poll()
+        if 'reload' in requests:
+            # Another process rewrote the catalog (an import, say); start over from storage
+            self.load_paths()
+            self.refresh_catalog()
+        if 'show' in requests:
+            self.root.deiconify()
+            self.root.lift()
+            self.root.focus_force()
+        self.root.after(100, self.poll_window_requests)
+        
+    def run(self):
+        # Bind keyboard shortcuts
+        self.root.bind('<Return>', lambda e: self.open_selected())
+        self.root.bind('<Delete>', lambda e: self.remove_selected())
+        self.root.bind('<Control-o>', lambda e: self.add_path())
+        self.root.bind('<Control-i>', lambda e: self.import_folders())
+        
+        # Start the application
+        self.root.after_idle(self.record_first_paint)
+        try:
+            self.root.mainloop()
+        finally:
+            self.save_snapshot()
+            if self.daemon:
+                self.daemon.shutdown()
+            self.store.close()
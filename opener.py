@@ -0,0 +1,238 @@
+import os
+import queue
+import shlex
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from collections import deque
+
+import perf
+
+OPENER_ENV = 'OPEN_PATH_TOOL_OPENER'     # strategy name, or a command such as "code {path}"
+STUB_LOG_ENV = 'OPEN_PATH_TOOL_STUB_LOG'
+STUB_DELAY_ENV = 'OPEN_PATH_TOOL_STUB_DELAY'
+MAX_RUNNING_ENV = 'OPEN_PATH_TOOL_MAX_LAUNCHES'
+RATE_ENV = 'OPEN_PATH_TOOL_LAUNCH_RATE'
+MAX_RUNNING = 4             # openers running at once
+LAUNCHES_PER_SECOND = 5.0
+REAP_INTERVAL_S = 0.05
+CHECK_TIMEOUT_S = 5.0       # how long a path may take to answer whether it exists
+
+# name -> (argv before the path, whether a non-zero exit code means failure).
+# explorer.exe exits with 1 even when it opened the folder.
+STRATEGIES = {
+    'explorer': (['explorer'], False),
+    'xdg-open': (['xdg-open'], True),
+    'open': (['open'], True),
+    'stub': ([sys.executable, os.path.abspath(__file__)], True),
+}
+
+
+def default_strategy():
+    if sys.platform == 'win32':
+        return 'explorer'
+    if sys.platform == 'darwin':
+        return 'open'
+    return 'xdg-open'
+
+
+def opener_command(path, strategy=None):
+    """Return (argv, check_exit_code) for opening path; never goes through a shell"""
+    strategy = strategy or os.environ.get(OPENER_ENV) or default_strategy()
+    if strategy in STRATEGIES:
+        argv, check = STRATEGIES[strategy]
+        return argv + [path], check
+
+    # A custom command line; {path} marks where the path goes, else it is appended
+    argv = shlex.split(strategy, posix=(os.name != 'nt'))
+    if '{path}' in argv:
+        return [path if arg == '{path}' else arg for arg in argv], True
+    return argv + [path], True
+
+
+class Launcher:
+    """Start the platform opener for paths without blocking the caller
+
+    Paths are queued and started by a single worker thread, at most
+    max_running openers at a time and at most rate starts per second, so
+    opening a dozen folders cannot flood the desktop. Each launch is a
+    direct exec of explorer, open or xdg-open (or a configured command),
+    and the same thread reaps the children so none are left as zombies.
+    Whether a path exists is asked on a thread of its own, so a dead
+    network share holds up neither other launches nor reaping; one that
+    has not answered within CHECK_TIMEOUT_S is reported as failed.
+    Each outcome, (path, error or None, seconds), is queued for the
+    caller's thread to poll, or passed to report() on the worker thread
+    when one is given.
+    """
+
+    def __init__(self, strategy=None, report=None, max_running=None, rate=None):
+        self.strategy = strategy
+        self.report = report
+        self.max_running = max(1, max_running or int(os.environ.get(MAX_RUNNING_ENV) or MAX_RUNNING))
+        self.interval = 1.0 / (rate or float(os.environ.get(RATE_ENV) or LAUNCHES_PER_SECOND))
+        self.results = queue.Queue()
+        self.queued = deque()   # (path, queued at)
+        self.starting = 0       # paths being checked or about to start
+        self.checking = []      # (path, queued at, check started) waiting on os.path.exists
+        self.ready = deque()    # (path, queued at) that exist and can start
+        self.children = []      # (process, path, queued at, check_exit_code)
+        self.next_start = 0.0
+        self.lock = threading.Condition()
+        self.worker = None
+
+    def launch(self, path):
+        """Queue path to be opened"""
+        self.launch_many([path])
+
+    def launch_many(self, paths):
+        """Queue several paths; they start as the concurrency cap and rate allow"""
+        now = time.perf_counter()
+        with self.lock:
+            self.queued.extend((path, now) for path in paths)
+            if self.worker is None:
+                self.worker = threading.Thread(target=self._run, name="launcher", daemon=True)
+                self.worker.start()
+            self.lock.notify_all()
+
+    def _run(self):
+        while True:
+            with self.lock:
+                while not self.children and not self.queued and not self.starting:
+                    self.lock.wait()
+                check = None
+                now = time.monotonic()
+                if (self.queued and len(self.children) + self.starting < self.max_running
+                        and now >= self.next_start):
+                    path, queued_at = self.queued.popleft()
+                    check = (path, queued_at, now)
+                    self.checking.append(check)
+                    self.starting += 1
+                    self.next_start = now + self.interval
+                expired = [item for item in self.checking if now - item[2] > CHECK_TIMEOUT_S]
+                for item in expired:
+                    self.checking.remove(item)
+                ready = list(self.ready)
+                self.ready.clear()
+                children = list(self.children)
+
+            if check:
+                threading.Thread(target=self.check_path, args=(check,), name="launcher-check", daemon=True).start()
+            for path, queued_at, started in expired:
+                # Its check thread may hang for good; the slot goes to the next path
+                self.finish_start(path, queued_at, None, "Path did not respond")
+            for path, queued_at in ready:
+                self.finish_start(path, queued_at, self.start_opener(path, queued_at))
+            finished = self.reap(children)
+            if not check and not expired and not ready and not finished:
+                time.sleep(REAP_INTERVAL_S)
+
+    def check_path(self, check):
+        """Check thread: a dead network share can take seconds or forever to answer"""
+        path, queued_at, started = check
+        try:
+            exists = os.path.exists(path)
+        except Exception:
+            exists = False
+        with self.lock:
+            if check not in self.checking:
+                return  # Gave up on it already
+            self.checking.remove(check)
+            if exists:
+                self.ready.append((path, queued_at))
+                self.lock.notify_all()
+                return
+        self.finish_start(path, queued_at, None, "Path does not exist")
+
+    def finish_start(self, path, queued_at, child, error=None):
+        # The outcome goes out before the path stops counting, so wait() never misses it
+        if error:
+            self.outcome(path, error, time.perf_counter() - queued_at)
+        with self.lock:
+            self.starting -= 1
+            if child:
+                self.children.append(child)
+            self.lock.notify_all()
+
+    def start_opener(self, path, queued_at):
+        """Start the opener for path; returns the child, or None after reporting why not"""
+        try:
+            argv, check = opener_command(path, self.strategy)
+            kwargs = {}
+            if os.name != 'nt':
+                # Opened applications must outlive a Ctrl+C in our terminal
+                kwargs['start_new_session'] = True
+            process = subprocess.Popen(argv, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+                                       stderr=subprocess.DEVNULL, close_fds=True, **kwargs)
+        except (OSError, ValueError) as e:
+            self.outcome(path, f"Cannot start opener: {e}", time.perf_counter() - queued_at)
+            return None
+        return (process, path, queued_at, check)
+
+    def reap(self, children):
+        finished = []
+        for child in children:
+            process, path, queued_at, check = child
+            code = process.poll()
+            if code is None:
+                continue
+            finished.append(child)
+            error = f"Opener exited with code {code}" if check and code != 0 else None
+            self.outcome(path, error, time.perf_counter() - queued_at)
+
+        if finished:
+            with self.lock:
+                for child in finished:
+                    self.children.remove(child)
+                self.lock.notify_all()
+        return finished
+
+    def outcome(self, path, error, seconds):
+        perf.record('launch', seconds)
+        if self.report:
+            self.report(path, error, seconds)
+        else:
+            self.results.put((path, error, seconds))
+
+    def running(self):
+        """Number of paths queued or still being opened"""
+        with self.lock:
+            return len(self.queued) + self.starting + len(self.children)
+
+    def poll(self):
+        """Return the (path, error, seconds) outcomes reported since the last poll"""
+        outcomes = []
+        while True:
+            try:
+                outcomes.append(self.results.get_nowait())
+            except queue.Empty:
+                return outcomes
+
+    def wait(self, timeout=None):
+        """Block until every queued path was opened; returns False on timeout"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self.lock:
+            while self.queued or self.starting or self.children:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self.lock.wait(remaining)
+        return True
+
+
+def stub_open(path):
+    """Stand-in opener: log the request, optionally take a while, exit like xdg-open"""
+    log_file = os.environ.get(STUB_LOG_ENV) or os.path.join(tempfile.gettempdir(), "open_path_tool_stub.log")
+    with open(log_file, "a", encoding='utf-8') as f:
+        f.write(f"{time.time():.6f}\t{os.getpid()}\t{path}\n")
+    delay = float(os.environ.get(STUB_DELAY_ENV) or 0)
+    if delay:
+        time.sleep(delay)
+    return 0 if os.path.exists(path) else 2
+
+
+if __name__ == "__main__":
+    # Run as OPEN_PATH_TOOL_OPENER=stub to test launching without a desktop
+    sys.exit(stub_open(sys.argv[1]))
@@ -0,0 +1,100 @@
+import os
+import sys
+
+SEP = os.sep
+DOUBLE_SEP = SEP + SEP
+SEP_DOT = SEP + '.'
+normcase = os.path.normcase
+
+
+def normalize_path(path):
+    """Key two spellings of the same folder alike: C:\\Foo\\ and c:/foo on Windows"""
+    path = normcase(path)
+    # normpath is slow Python code; most stored paths are already normal
+    if path.find(DOUBLE_SEP, 1) >= 0 or SEP_DOT in path or path.endswith(SEP) or path.startswith('.'):
+        path = os.path.normpath(path)
+    return path
+
+
+class PathRecord:
+    """One catalog entry
+
+    __slots__ keep a record at a fraction of the size of the dict it
+    replaces, and categories are interned so a hundred thousand records
+    share a handful of category strings.
+    """
+
+    __slots__ = ('name', 'path', 'category')
+
+    def __init__(self, name, path, category):
+        self.name = name
+        self.path = path
+        self.category = sys.intern(category)
+
+    @classmethod
+    def from_dict(cls, info):
+        return cls(info['name'], info['path'], info.get('category') or 'Other')
+
+    def to_dict(self):
+        return {'name': self.name, 'path': self.path, 'category': self.category}
+
+    def __repr__(self):
+        return f"PathRecord({self.name!r}, {self.path!r}, {self.category!r})"
+
+
+class PathCatalog:
+    """Records indexed by normalized path and by category
+
+    Both indexes are insertion-ordered dicts, so lookup, duplicate checks
+    and removal are O(1) while iteration keeps the order records were added.
+    """
+
+    def __init__(self, records=()):
+        self.records = {}     # normalized path -> record
+        self.categories = {}  # category -> {normalized path -> record}
+        for record in records:
+            self.add(record)
+
+    def __len__(self):
+        return len(self.records)
+
+    def __iter__(self):
+        return iter(self.records.values())
+
+    def __contains__(self, path):
+        return normalize_path(path) in self.records
+
+    def find(self, path):
+        return self.records.get(normalize_path(path))
+
+    def add(self, record):
+        """Add record; returns its normalized path, or None if that is already listed"""
+        key = normalize_path(record.path)
+        if key in self.records:
+            return None
+        if key == record.path:
+            key = record.path  # Share the string instead of keeping an equal copy
+        self.records[key] = record
+        members = self.categories.get(record.category)
+        if members is None:
+            members = self.categories[record.category] = {}
+        members[key] = record
+        return key
+
+    def remove(self, path):
+        """Remove and return the record listed under path, or None"""
+        key = normalize_path(path)
+        record = self.records.pop(key, None)
+        if record is not None:
+            members = self.categories[record.category]
+            del members[key]
+            if not members:
+                del self.categories[record.category]
+        return record
+
+    def in_category(self, category):
+        return list(self.categories.get(category, {}).values())
+
+    def by_category(self):
+        """Group records by category, keeping first-seen category order"""
+        return {category: list(members.values()) for category, members in self.categories.items()}
@@ -0,0 +1,339 @@
+import os
+import threading
+
+import perf
+from path_record import PathCatalog, PathRecord, normalize_path
+from search_index import SearchIndex
+from storage import CUSTOM_CATEGORY, StorageError, open_storage
+from team_catalog import team_catalog_from_env
+from usage_log import UsageLog
+
+FREQUENT_LIMIT = 10  # paths in the Frequent category
+SEARCH_LIMIT = 1000  # matches listed while typing; more than a window shows
+
+
+def get_default_paths():
+    """Return default Windows paths"""
+    user_profile = os.environ.get('USERPROFILE', 'C:\\Users\\Default')
+    default_paths = [
+        {
+            'name': '🖥️ Desktop',
+            'path': os.path.join(user_profile, 'Desktop'),
+            'category': 'User Folders'
+        },
+        {
+            'name': '📄 Documents',
+            'path': os.path.join(user_profile, 'Documents'),
+            'category': 'User Folders'
+        },
+        {
+            'name': '⬇️ Downloads',
+            'path': os.path.join(user_profile, 'Downloads'),
+            'category': 'User Folders'
+        },
+        {
+            'name': '🖼️ Pictures',
+            'path': os.path.join(user_profile, 'Pictures'),
+            'category': 'User Folders'
+        },
+        {
+            'name': '🎵 Music',
+            'path': os.path.join(user_profile, 'Music'),
+            'category': 'User Folders'
+        },
+        {
+            'name': '🎥 Videos',
+            'path': os.path.join(user_profile, 'Videos'),
+            'category': 'User Folders'
+        },
+        {
+            'name': '⚙️ System32',
+            'path': 'C:\\Windows\\System32',
+            'category': 'System Folders'
+        },
+        {
+            'name': '📦 Program Files',
+            'path': 'C:\\Program Files',
+            'category': 'System Folders'
+        },
+        {
+            'name': '📦 Program Files (x86)',
+            'path': 'C:\\Program Files (x86)',
+            'category': 'System Folders'
+        },
+        {
+            'name': '🪟 Windows',
+            'path': 'C:\\Windows',
+            'category': 'System Folders'
+        },
+        {
+            'name': '🗂️ Temp',
+            'path': 'C:\\Windows\\Temp',
+            'category': 'System Folders'
+        },
+        {
+            'name': '🚀 Startup',
+            'path': os.path.join(user_profile, 'AppData\\Roaming\\Microsoft\\Windows\\Start Menu\\Programs\\Startup'),
+            'category': 'Special Folders'
+        },
+        {
+            'name': '🏃 Run',
+            'path': os.path.join(user_profile, 'AppData\\Roaming\\Microsoft\\Windows\\Start Menu\\Programs'),
+            'category': 'Special Folders'
+        }
+    ]
+    return default_paths
+
+
+def display_name(path_info):
+    """Name without its leading icon, for matching typed names"""
+    name = path_info.name
+    icon, _, rest = name.partition(' ')
+    return (rest if rest and not icon.isalnum() else name).lower()
+
+
+def make_record(folder, name=None, category=CUSTOM_CATEGORY):
+    return PathRecord(name or f"📁 {os.path.basename(folder) or folder}", folder, category)
+
+
+class PathStore:
+    """The path catalog without any GUI: defaults, saved paths and search
+
+    Used by the Tk launcher, the command line and the daemon, so nothing
+    here may import tkinter. Changes and searches take the store lock, so
+    the daemon's socket threads can share a store with the Tk thread.
+    """
+
+    def __init__(self, storage=None, usage=None, team=None):
+        self.lock = threading.RLock()
+        self.storage = storage or open_storage()
+        self.usage = usage or UsageLog()
+        self.team = team or team_catalog_from_env()
+        self.catalog = PathCatalog()
+        self.saved = set()   # normalized paths that come from storage and may be removed
+        self.shared = set()  # normalized paths that come from the team catalog
+        self.index = SearchIndex()
+        self.load_error = None
+        self.revision = 0    # bumped by every change made through this store
+
+    def load(self):
+        """Load paths from storage, merge with defaults
+
+        Safe to run on a background thread: the new catalog is built without
+        the lock and swapped in at the end, and built again if this store
+        changed meanwhile.
+        """
+        self.usage.load()
+        while True:
+            revision = self.revision
+            catalog = PathCatalog(PathRecord.from_dict(info) for info in get_default_paths())
+            load_error = None
+            try:
+                saved_paths = self.storage.load()
+            except StorageError as e:
+                # Keep the defaults usable; the caller decides how to report it
+                saved_paths = []
+                load_error = e
+
+            saved = set()
+            for path_info in saved_paths:
+                key = catalog.add(path_info)
+                if key is not None:
+                    saved.add(key)
+            # The team catalog as last fetched, so it is there offline too
+            shared = set()
+            for path_info in self.team.cached() if self.team else ():
+                key = catalog.add(path_info)
+                if key is not None:
+                    shared.add(key)
+
+            index = SearchIndex(catalog)
+            with self.lock:
+                if self.revision != revision:
+                    continue
+                self.install(catalog, saved, index, shared)
+                self.load_error = load_error
+            return self.paths
+
+    def install(self, catalog, saved, index, shared=()):
+        self.catalog = catalog
+        self.saved = saved
+        self.shared = set(shared)
+        self.index = index
+        self.revision += 1
+
+    def snapshot(self):
+        """Every record with whether it was saved, for a startup snapshot"""
+        with self.lock:
+            items = list(self.catalog.records.items())
+            return [record for key, record in items], [key in self.saved for key, record in items]
+
+    @property
+    def paths(self):
+        """A snapshot of every record, in the order they were added"""
+        with self.lock:
+            return list(self.catalog)
+
+    def __len__(self):
+        return len(self.catalog)
+
+    def contains(self, path):
+        return path in self.catalog
+
+    def find(self, path):
+        return self.catalog.find(path)
+
+    def add(self, path_info):
+        """Add and save a record; returns False if its path is already listed"""
+        return bool(self.add_many([path_info]))
+
+    def add_many(self, records):
+        """Add and save new records in one transaction; returns those added"""
+        with self.lock:
+            added = []
+            seen = set()
+            for path_info in records:
+                key = normalize_path(path_info.path)
+                if key not in self.catalog.records and key not in seen:
+                    seen.add(key)
+                    added.append(path_info)
+            if not added:
+                return added
+
+            with perf.span('save'):
+                self.storage.add_many(added)
+            for path_info in added:
+                self.saved.add(self.catalog.add(path_info))
+                self.index.add(path_info)
+            self.revision += 1
+            return added
+
+    def remove(self, path):
+        """Remove and save a custom path; returns the record or None"""
+        with self.lock:
+            key = normalize_path(path)
+            if key not in self.saved:
+                return None
+            path_info = self.catalog.records[key]
+            with perf.span('save'):
+                self.storage.remove(path_info.path)
+            self.catalog.remove(key)
+            self.index.remove(path_info)
+            self.saved.discard(key)
+            self.revision += 1
+            return path_info
+
+    def sync(self):
+        """Merge paths other processes saved or removed, and team catalog changes
+
+        Returns (added, removed) records. Changes are applied one by one, so
+        only they need repainting. Returns None when the storage could not
+        say what changed and everything was reloaded instead.
+        """
+        with self.lock:
+            ops = self.storage.poll_changes()
+            team_ops = self.team.poll() if self.team else []
+            if ops is None:
+                self.load()  # Takes the team catalog as it is now, changes included
+                return None
+            added = []
+            removed = []
+            self.apply(ops, self.saved, added, removed)
+            self.apply(team_ops, self.shared, added, removed)
+            if added or removed:
+                self.revision += 1
+            return added, removed
+
+    def apply(self, ops, owned, added, removed):
+        """Apply changes from one source; it may only remove the paths in owned"""
+        for op, value in ops:
+            if op == 'add':
+                key = self.catalog.add(value)
+                if key is not None:
+                    owned.add(key)
+                    self.index.add(value)
+                    added.append(value)
+            else:
+                key = normalize_path(value)
+                if key in owned:
+                    path_info = self.catalog.remove(key)
+                    self.index.remove(path_info)
+                    owned.discard(key)
+                    removed.append(path_info)
+
+    def start_team_sync(self):
+        """Check the team catalog for changes in the background, if one is configured"""
+        if self.team:
+            self.team.start()
+
+    def is_removable(self, path):
+        return normalize_path(path) in self.saved
+
+    def search(self, query):
+        """Records matching query, the most used first"""
+        with self.lock:
+            return self.rank(self.index.search(query)[0])
+
+    def search_top(self, query, limit=SEARCH_LIMIT):
+        """Like search(), but stop after about limit matches; returns (records, complete)
+
+        Cheap for a query of a letter or two that matches most of the
+        catalog. Used paths past the limit are still included, so the best
+        matches come first even then.
+        """
+        with self.lock:
+            records, complete = self.index.search(query, limit)
+            if not complete and self.usage.scores:
+                listed = {id(path_info) for path_info in records}
+                for path in list(self.usage.scores):
+                    path_info = self.catalog.find(path)
+                    if path_info is not None and id(path_info) not in listed and self.index.contains(path_info, query):
+                        records.append(path_info)
+            return self.rank(records), complete
+
+    def rank(self, records):
+        """Order records by frecency; unused ones keep their order after the rest"""
+        scores = self.usage.scores
+        if not scores:
+            return records
+        scored = [path_info for path_info in records if path_info.path in scores]
+        if not scored:
+            return records
+        scored.sort(key=lambda path_info: scores[path_info.path], reverse=True)
+        return scored + [path_info for path_info in records if path_info.path not in scores]
+
+    def record_open(self, path):
+        """Count an open of path towards its frecency"""
+        self.usage.record(path)
+
+    def sync_usage(self):
+        """Pick up opens other processes recorded; returns the paths whose scores changed"""
+        return self.usage.refresh()
+
+    def frequent(self, limit=FREQUENT_LIMIT):
+        """The most used records still in the catalog, best first"""
+        with self.lock:
+            return [self.catalog.find(path) for path in self.usage.top(limit, keep=self.catalog.__contains__)]
+
+    def resolve(self, query):
+        """Return the records a user most likely means by query"""
+        with self.lock:
+            path_info = self.find(query)
+            if path_info:
+                return [path_info]
+            matches = self.index.search(query)[0]
+        exact = [p for p in matches if display_name(p) == query.lower()]
+        return exact or matches
+
+    def in_category(self, category):
+        with self.lock:
+            return self.catalog.in_category(category)
+
+    def by_category(self):
+        """Group paths by category, keeping first-seen category order"""
+        with self.lock:
+            return self.catalog.by_category()
+
+    def close(self):
+        self.usage.flush()  # Opens still queued for the usage log
+        self.storage.close()
@@ -0,0 +1,250 @@
+import ctypes
+import errno
+import os
+import queue
+import select
+import struct
+import sys
+import threading
+
+POLL_MIN_S = 1.0     # polling interval right after a change
+POLL_MAX_S = 30.0    # interval after a long quiet spell
+
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+WATCH_MASK = IN_CREATE | IN_DELETE | IN_MOVED_FROM | IN_MOVED_TO | IN_DELETE_SELF | IN_MOVE_SELF | IN_ONLYDIR
+EVENT_HEADER = struct.Struct('iIII')
+
+
+class InotifyBackend:
+    """Directory watches through the Linux inotify API, called via ctypes
+
+    on_event(directory, name) runs on the reader thread; name is None when
+    the directory itself went away or the kernel dropped events.
+    """
+
+    def __init__(self, on_event):
+        try:
+            libc = ctypes.CDLL('libc.so.6', use_errno=True)
+        except OSError:
+            # ctypes.util imports subprocess and may run ldconfig, so only when the usual name fails
+            from ctypes.util import find_library
+            libc = ctypes.CDLL(find_library('c'), use_errno=True)
+        self.add_watch = libc.inotify_add_watch
+        self.add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        self.rm_watch = libc.inotify_rm_watch
+        self.rm_watch.argtypes = [ctypes.c_int, ctypes.c_int]
+        self.fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self.on_event = on_event
+        self.lock = threading.Lock()
+        self.watches = {}      # wd -> directory
+        self.directories = {}  # directory -> wd
+        thread = threading.Thread(target=self._read_loop, name="inotify", daemon=True)
+        thread.start()
+
+    def add(self, directory):
+        """Watch directory; returns False if the kernel refused (e.g. out of watches)"""
+        with self.lock:
+            if directory in self.directories:
+                return True
+            wd = self.add_watch(self.fd, os.fsencode(directory), WATCH_MASK)
+            if wd < 0:
+                return False
+            self.watches[wd] = directory
+            self.directories[directory] = wd
+            return True
+
+    def remove(self, directory):
+        with self.lock:
+            wd = self.directories.pop(directory, None)
+            if wd is not None:
+                self.watches.pop(wd, None)
+                self.rm_watch(self.fd, wd)
+
+    def _read_loop(self):
+        while True:
+            select.select([self.fd], [], [])
+            try:
+                data = os.read(self.fd, 64 * 1024)
+            except OSError as e:
+                if e.errno in (errno.EAGAIN, errno.EINTR):
+                    continue
+                raise
+            offset = 0
+            while offset < len(data):
+                wd, mask, cookie, length = EVENT_HEADER.unpack_from(data, offset)
+                offset += EVENT_HEADER.size
+                name = data[offset:offset + length].rstrip(b'\0')
+                offset += length
+                if mask & IN_Q_OVERFLOW:
+                    self.on_event(None, None)
+                    continue
+                with self.lock:
+                    directory = self.watches.get(wd)
+                    if mask & IN_IGNORED and directory is not None:
+                        del self.watches[wd]
+                        self.directories.pop(directory, None)
+                if directory is None:
+                    continue
+                if mask & (IN_DELETE_SELF | IN_MOVE_SELF | IN_IGNORED):
+                    self.on_event(directory, None)
+                else:
+                    self.on_event(directory, os.fsdecode(name))
+
+
+class PollingBackend:
+    """Directory watches by comparing mtimes, backing off while nothing changes"""
+
+    def __init__(self, on_event, poll_min=POLL_MIN_S, poll_max=POLL_MAX_S):
+        self.on_event = on_event
+        self.poll_min = poll_min
+        self.poll_max = poll_max
+        self.interval = poll_min
+        self.lock = threading.Lock()
+        self.directories = {}  # directory -> mtime, None until first checked
+        self.wake = threading.Event()
+        thread = threading.Thread(target=self._poll_loop, name="path-poller", daemon=True)
+        thread.start()
+
+    def add(self, directory):
+        with self.lock:
+            if directory not in self.directories:
+                try:
+                    self.directories[directory] = os.stat(directory).st_mtime_ns
+                except OSError:
+                    self.directories[directory] = None
+        return True
+
+    def remove(self, directory):
+        with self.lock:
+            self.directories.pop(directory, None)
+
+    def _poll_loop(self):
+        while True:
+            self.wake.wait(self.interval)
+            with self.lock:
+                directories = list(self.directories.items())
+            changed = False
+            for directory, mtime in directories:
+                try:
+                    current = os.stat(directory).st_mtime_ns
+                except OSError:
+                    current = None
+                if current != mtime:
+                    changed = True
+                    with self.lock:
+                        if directory in self.directories:
+                            self.directories[directory] = current
+                    self.on_event(directory, None)
+            # Quiet folders are checked less and less often; a change resets the pace
+            self.interval = self.poll_min if changed else min(self.interval * 2, self.poll_max)
+
+
+def nearest_directory(path):
+    """The deepest existing directory above path"""
+    directory = os.path.dirname(os.path.abspath(path))
+    while not os.path.isdir(directory):
+        parent = os.path.dirname(directory)
+        if parent == directory:
+            break
+        directory = parent
+    return directory
+
+
+class PathWatcher:
+    """Report when watched paths may have appeared or disappeared
+
+    Each path is watched through the deepest existing directory above it,
+    with inotify on Linux and mtime polling elsewhere (or when inotify runs
+    out of watches). A change reports the affected paths once through
+    poll() and forgets them; watch() them again after re-checking.
+    """
+
+    def __init__(self, use_inotify=None):
+        self.lock = threading.Lock()
+        self.changes = queue.Queue()
+        self.paths = {}   # path -> directory it is watched through
+        self.dirs = {}    # directory -> set of paths watched through it
+        self.backends = {}  # directory -> backend watching it
+        self.inotify = None
+        if use_inotify is None:
+            use_inotify = sys.platform.startswith('linux')
+        if use_inotify:
+            try:
+                self.inotify = InotifyBackend(self.on_event)
+            except (OSError, AttributeError):
+                self.inotify = None  # No inotify in this libc or kernel
+        self.poller = None
+
+    def watching(self, path):
+        return path in self.paths
+
+    def watch(self, path):
+        """Start reporting changes to path; may touch the disk, so call it off the Tk thread"""
+        directory = nearest_directory(path)
+        with self.lock:
+            if self.paths.get(path) == directory:
+                return
+            self._forget(path)
+            backend = self.backends.get(directory)
+            if backend is None:
+                backend = self._backend_for(directory)
+                self.backends[directory] = backend
+            self.paths[path] = directory
+            self.dirs.setdefault(directory, set()).add(path)
+
+    def _backend_for(self, directory):
+        if self.inotify is not None and self.inotify.add(directory):
+            return self.inotify
+        if self.poller is None:
+            self.poller = PollingBackend(self.on_event)
+        self.poller.add(directory)
+        return self.poller
+
+    def _forget(self, path):
+        directory = self.paths.pop(path, None)
+        if directory is None:
+            return
+        paths = self.dirs.get(directory)
+        if paths is not None:
+            paths.discard(path)
+            if not paths:
+                del self.dirs[directory]
+                self.backends.pop(directory).remove(directory)
+
+    def on_event(self, directory, name):
+        """Called by a backend thread; name None means anything below directory may have changed"""
+        with self.lock:
+            if directory is None:
+                affected = list(self.paths)
+            else:
+                affected = []
+                prefix = directory.rstrip(os.sep) + os.sep
+                for path in self.dirs.get(directory, ()):
+                    first = os.path.abspath(path)[len(prefix):].split(os.sep, 1)[0]
+                    if name is None or first == name:
+                        affected.append(path)
+            for path in affected:
+                self._forget(path)
+        for path in affected:
+            self.changes.put(path)
+
+    def poll(self):
+        """Return the set of paths reported changed since the last poll"""
+        changed = set()
+        while True:
+            try:
+                changed.add(self.changes.get_nowait())
+            except queue.Empty:
+                return changed
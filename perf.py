@@ -0,0 +1,179 @@
+import atexit
+import json
+import os
+import threading
+import time
+from bisect import bisect_left
+from collections import deque
+from contextlib import contextmanager
+from functools import wraps
+
+PERF_ENV = 'OPEN_PATH_TOOL_PERF'            # e.g. "1", "overlay", "profile" or "overlay,profile"
+PERF_FILE_ENV = 'OPEN_PATH_TOOL_PERF_FILE'
+METRICS_FILE = "perf_metrics.json"
+PROFILE_FILE = "perf_profile.prof"
+
+# Histogram bucket upper bounds in milliseconds; the last bucket is unbounded
+BUCKETS_MS = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+RECENT_SAMPLES = 1000  # per span, for percentiles
+
+
+class Histogram:
+    """Counts per latency bucket plus the most recent samples"""
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS_MS) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.last_ms = 0.0
+        self.recent = deque(maxlen=RECENT_SAMPLES)
+
+    def add(self, ms):
+        self.counts[bisect_left(BUCKETS_MS, ms)] += 1
+        self.count += 1
+        self.total_ms += ms
+        self.max_ms = max(self.max_ms, ms)
+        self.last_ms = ms
+        self.recent.append(ms)
+
+    def percentile(self, fraction):
+        if not self.recent:
+            return 0.0
+        ordered = sorted(self.recent)
+        return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+    def summary(self):
+        buckets = {f"<={bound}": n for bound, n in zip(BUCKETS_MS, self.counts)}
+        buckets[f">{BUCKETS_MS[-1]}"] = self.counts[-1]
+        return {
+            'count': self.count,
+            'mean_ms': round(self.total_ms / self.count, 3) if self.count else 0.0,
+            'p50_ms': round(self.percentile(0.50), 3),
+            'p95_ms': round(self.percentile(0.95), 3),
+            'p99_ms': round(self.percentile(0.99), 3),
+            'max_ms': round(self.max_ms, 3),
+            'last_ms': round(self.last_ms, 3),
+            'buckets': buckets,
+        }
+
+
+class Metrics:
+    """Span timings collected from any thread"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.histograms = {}
+
+    def record(self, name, seconds):
+        with self.lock:
+            histogram = self.histograms.get(name)
+            if histogram is None:
+                histogram = self.histograms[name] = Histogram()
+            histogram.add(seconds * 1000)
+
+    def get(self, name):
+        return self.histograms.get(name)
+
+    def snapshot(self):
+        with self.lock:
+            return {name: histogram.summary() for name, histogram in sorted(self.histograms.items())}
+
+    def dump(self, filename):
+        with open(filename, "w", encoding='utf-8') as f:
+            json.dump({'pid': os.getpid(), 'spans': self.snapshot()}, f, indent=2)
+
+
+metrics = Metrics()
+enabled = False
+overlay = False
+profiler = None
+dump_path = None   # Where _dump_at_exit writes, set by the latest enable()
+
+
+@contextmanager
+def _timed_span(name):
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        metrics.record(name, time.perf_counter() - start)
+
+
+@contextmanager
+def _no_span():
+    yield
+
+
+def span(name):
+    """Context manager timing its block as name; free when instrumentation is off"""
+    if not enabled:
+        return _no_span()
+    return _timed_span(name)
+
+
+def timed(name):
+    """Decorator form of span()"""
+    def decorate(fn):
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not enabled:
+                return fn(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                metrics.record(name, time.perf_counter() - start)
+        return wrapper
+    return decorate
+
+
+def record(name, seconds):
+    """Record a duration measured by the caller, e.g. across after() callbacks"""
+    if enabled:
+        metrics.record(name, seconds)
+
+
+def enable(show_overlay=False, profile=False, dump_file=None):
+    """Start collecting spans and dump them to dump_file at exit"""
+    global enabled, overlay, profiler, dump_path
+    enabled = True
+    overlay = overlay or show_overlay
+    if dump_path is None:
+        atexit.register(_dump_at_exit)
+    dump_path = dump_file or os.environ.get(PERF_FILE_ENV) or METRICS_FILE
+
+    if profile and profiler is None:
+        import cProfile
+        profiler = cProfile.Profile()
+        profiler.enable()
+
+
+def enable_from_env():
+    """Enable instrumentation if OPEN_PATH_TOOL_PERF asks for it"""
+    value = os.environ.get(PERF_ENV, '').strip().lower()
+    if not value or value in ('0', 'off', 'false', 'no'):
+        return False
+    modes = {mode.strip() for mode in value.split(',')}
+    enable(show_overlay='overlay' in modes, profile='profile' in modes)
+    return True
+
+
+def _dump_at_exit():
+    if profiler is not None:
+        profiler.disable()
+        profiler.dump_stats(PROFILE_FILE)
+    try:
+        metrics.dump(dump_path)
+    except OSError:
+        pass
+
+
+def overlay_text(names):
+    """One-line summary of the last and p95 time of each span in names"""
+    parts = []
+    for name in names:
+        histogram = metrics.get(name)
+        if histogram and histogram.count:
+            parts.append(f"{name} {histogram.last_ms:.1f}/{histogram.percentile(0.95):.1f}ms")
+    return "⏱ " + " · ".join(parts) if parts else "⏱ no spans yet"
@@ -0,0 +1,104 @@
+import csv
+import json
+import os
+
+from path_record import PathRecord
+from storage import CUSTOM_CATEGORY
+
+FORMATS = ('ndjson', 'csv')
+CSV_FIELDS = ('name', 'path', 'category')
+
+
+def detect_format(filename, default='ndjson'):
+    """Pick a format from the file extension: .csv is CSV, anything else NDJSON"""
+    return 'csv' if filename.lower().endswith('.csv') else default
+
+
+def validate(info):
+    """Turn one imported entry into a PathRecord, or raise ValueError saying what is wrong"""
+    if isinstance(info, str):
+        info = {'path': info}
+    if not isinstance(info, dict):
+        raise ValueError("expected an object with a path")
+    path = info.get('path')
+    if not isinstance(path, str) or not path.strip():
+        raise ValueError("missing path")
+    if '\0' in path or '\n' in path:
+        raise ValueError("path contains a control character")
+    # The same spelling the add command saves, so /x/y/ and /x//y are one path
+    path = os.path.abspath(path)
+    name = info.get('name') or os.path.basename(path.rstrip('/\\')) or path
+    category = info.get('category') or CUSTOM_CATEGORY
+    if not isinstance(name, str) or not isinstance(category, str):
+        raise ValueError("name and category must be text")
+    if '\0' in name or '\n' in name:
+        raise ValueError("name contains a control character")
+    return PathRecord(name, path, category)
+
+
+def read_ndjson(f):
+    """Yield (line number, record or ValueError) for each non-blank line"""
+    for number, line in enumerate(f, 1):
+        if not line.strip():
+            continue
+        try:
+            yield number, validate(json.loads(line))
+        except ValueError as e:
+            yield number, e
+
+
+def read_csv(f):
+    """Yield (line number, record or ValueError) for each row below the header"""
+    reader = csv.DictReader(f)
+    if reader.fieldnames is None or 'path' not in reader.fieldnames:
+        yield 1, ValueError("the header row has no path column")
+        return
+    for row in reader:
+        try:
+            yield reader.line_num, validate(row)
+        except ValueError as e:
+            yield reader.line_num, e
+
+
+def write_ndjson(records, f):
+    count = 0
+    for record in records:
+        f.write(json.dumps(record.to_dict(), ensure_ascii=False))
+        f.write("\n")
+        count += 1
+    return count
+
+
+def write_csv(records, f):
+    writer = csv.writer(f)
+    writer.writerow(CSV_FIELDS)
+    count = 0
+    for record in records:
+        writer.writerow((record.name, record.path, record.category))
+        count += 1
+    return count
+
+
+READERS = {'ndjson': read_ndjson, 'csv': read_csv}
+WRITERS = {'ndjson': write_ndjson, 'csv': write_csv}
+
+
+def read_records(f, fmt):
+    return READERS[fmt](f)
+
+
+def write_records(records, f, fmt):
+    """Write records one at a time; returns how many were written"""
+    return WRITERS[fmt](records, f)
+
+
+def batched(entries, size):
+    """Group (line number, record or error) entries into lists of at most size"""
+    batch = []
+    for entry in entries:
+        batch.append(entry)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
@@ -0,0 +1,148 @@
+from bisect import bisect_right
+
+SEPARATOR = "\x00"  # Joins name and path so no query can match across them
+
+
+class SearchIndex:
+    """Case-insensitive substring search over path records
+
+    Lowercased UTF-8 text is cached once per record and joined into one
+    blob, so a fresh query is a handful of C-level find calls plus a bisect
+    per matching record. A query that extends the previous one only rechecks
+    the previous hits. Results keep the order records were added in.
+
+    One or two characters match a large share of any catalog, and listing
+    every hit costs Python work per hit. A search with a limit stops after
+    that many hits, so its cost is bounded by the limit. A full scan of the
+    blob is left only for rare queries, and it runs at C speed.
+    """
+
+    def __init__(self, records=()):
+        self.records = []          # slot -> record, None once removed
+        self.text = []             # slot -> lowercased UTF-8 "name\0path", b'' once removed
+        self.slots = {}            # id(record) -> slot
+        self.live = 0
+        self.blob = bytearray()    # UTF-8 text of slots [0, indexed), each followed by "\n"
+        self.starts = []           # slot -> offset of its text in blob
+        self.indexed = 0
+        self.last_query = None
+        self.last_hits = None      # every hit for last_query; never a truncated list
+        for record in records:
+            self.add(record)
+
+    def __len__(self):
+        return self.live
+
+    def add(self, record):
+        self.slots[id(record)] = len(self.records)
+        self.records.append(record)
+        # Bytes: names start with an emoji, which would make a str four bytes per character
+        self.text.append(f"{record.name}{SEPARATOR}{record.path}".lower().encode('utf-8'))
+        self.live += 1
+        self.last_query = None
+
+    def remove(self, record):
+        slot = self.slots.pop(id(record), None)
+        if slot is None:
+            return
+        self.records[slot] = None
+        self.text[slot] = b''
+        self.live -= 1
+        self.last_query = None
+        if len(self.records) - self.live > self.live:
+            self.compact()
+
+    def compact(self):
+        """Drop the slots of removed records"""
+        records = [record for record in self.records if record is not None]
+        self.records = []
+        self.text = []
+        self.slots = {}
+        self.live = 0
+        self.blob = bytearray()
+        self.starts = []
+        self.indexed = 0
+        for record in records:
+            self.add(record)
+
+    def refresh_blob(self):
+        """Append the text of records added since the last search"""
+        if self.indexed == len(self.text):
+            return
+        offset = len(self.blob)
+        new_text = self.text[self.indexed:]
+        for text in new_text:
+            self.starts.append(offset)
+            offset += len(text) + 1
+        self.blob += b"\n".join(new_text) + b"\n"
+        self.indexed = len(self.text)
+
+    def scan_blob(self, query, limit):
+        """Slots containing query, in order; stops once there are more than limit"""
+        blob = self.blob
+        starts = self.starts
+        text = self.text
+        find = blob.find
+        end = len(starts)
+        hits = []
+        pos = find(query)
+        while pos != -1:
+            slot = bisect_right(starts, pos) - 1
+            if text[slot]:
+                hits.append(slot)
+                if len(hits) > limit:
+                    break
+            # Resume at the next record; one hit per record is enough
+            pos = find(query, starts[slot + 1]) if slot + 1 < end else -1
+        return hits
+
+    def match(self, query, limit=None):
+        """Return the slots whose text contains query, in order, and whether that is all of them"""
+        text = self.text
+        narrow = self.last_query and query.startswith(self.last_query)
+        if "\n" in query or SEPARATOR in query:
+            return [], True
+
+        query = query.encode('utf-8')
+        if narrow:
+            hits = [slot for slot in self.last_hits if query in text[slot]]
+        elif limit is not None:
+            self.refresh_blob()
+            hits = self.scan_blob(query, limit)
+        else:
+            hits = None
+            if len(query) > 1:
+                self.refresh_blob()
+                hits = self.scan_blob(query, self.live // 16)
+                if len(hits) > self.live // 16:
+                    hits = None
+            if hits is None:
+                # Very common substrings are cheaper to test record by record
+                hits = [slot for slot, slot_text in enumerate(text) if query in slot_text]
+        if limit is not None and len(hits) > limit:
+            return hits[:limit], False
+        return hits, True
+
+    def search(self, query, limit=None):
+        """Return the records whose name or path contains query, and whether that is all of them
+
+        With a limit, at most limit records are returned, the first ones in order.
+        """
+        query = query.lower()
+        if not query:
+            records = [record for record in self.records if record is not None]
+            if limit is not None and len(records) > limit:
+                return records[:limit], False
+            return records, True
+
+        hits, complete = self.match(query, limit)
+        # A truncated list cannot be narrowed: the hits past the limit are missing
+        self.last_query = query if complete else None
+        self.last_hits = hits
+        records = self.records
+        return [records[slot] for slot in hits], complete
+
+    def contains(self, record, query):
+        """Whether record is indexed and its name or path contains query"""
+        slot = self.slots.get(id(record))
+        return slot is not None and query.lower().encode('utf-8') in self.text[slot]
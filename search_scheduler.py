@@ -0,0 +1,61 @@
+class SearchScheduler:
+    """Debounce search input and render results between Tk events
+
+    Every query and every render gets a generation number; callbacks that
+    belong to an older generation are dropped, so fast typing never queues
+    up redundant filtering and a big result set is rendered a chunk per
+    after() callback while the entry box keeps taking keystrokes.
+
+    Queries and renders are counted and timed apart: a render started by
+    scrolling supersedes an earlier render, never a query still waiting
+    out its delay.
+    """
+
+    def __init__(self, widget, search, delay_ms=150):
+        self.widget = widget
+        self.search = search
+        self.delay_ms = delay_ms
+        self.generation = 0          # of the latest query
+        self.after_id = None
+        self.render_generation = 0   # of the latest render
+        self.render_id = None
+
+    def cancel(self):
+        """Drop the pending query and return a fresh generation"""
+        self.generation += 1
+        if self.after_id is not None:
+            self.widget.after_cancel(self.after_id)
+            self.after_id = None
+        return self.generation
+
+    def cancel_render(self):
+        """Drop the rest of the running render and return a fresh render generation"""
+        self.render_generation += 1
+        if self.render_id is not None:
+            self.widget.after_cancel(self.render_id)
+            self.render_id = None
+        return self.render_generation
+
+    def schedule(self):
+        """Run search after delay_ms unless the input changes again first"""
+        generation = self.cancel()
+        self.after_id = self.widget.after(self.delay_ms, self.start, generation)
+
+    def start(self, generation):
+        self.after_id = None
+        if generation == self.generation:
+            self.search()
+
+    def render(self, steps):
+        """Drive a render generator, one chunk now and the rest in callbacks"""
+        self.run_steps(self.cancel_render(), steps)
+
+    def run_steps(self, generation, steps):
+        self.render_id = None
+        if generation != self.render_generation:
+            return
+        try:
+            next(steps)
+        except StopIteration:
+            return
+        self.render_id = self.widget.after(1, self.run_steps, generation, steps)
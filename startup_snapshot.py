@@ -0,0 +1,143 @@
+import array
+import itertools
+import marshal
+import os
+from bisect import bisect_right
+
+SNAPSHOT_FILE = "startup_snapshot.bin"
+SNAPSHOT_VERSION = 1
+SEPARATOR = "\0"  # cannot occur in a path or a name
+
+
+class Snapshot:
+    """The catalog as the last run left it, kept as the columns it was stored in
+
+    The window paints and searches this while the real catalog loads, so
+    nothing here builds a PathRecord, a PathCatalog or a SearchIndex:
+    rows come straight from the name and path lists, and a search is a
+    find over the joined, lowercased columns.
+    """
+
+    def __init__(self, names, paths, categories, category_indexes, status_table, status_indexes):
+        self.names_text = names
+        self.paths_text = paths
+        self.names = names.split(SEPARATOR) if names else []
+        self.paths = paths.split(SEPARATOR) if paths else []
+        self.categories = categories
+        self.category_indexes = array.array('I', category_indexes)
+        self.status_table = status_table
+        self.status_indexes = status_indexes
+        self.columns = None  # ((lowercased text, record starts), ...) built by the first search
+        count = len(self.paths)
+        if not len(self.names) == len(self.category_indexes) == len(self.status_indexes) == count:
+            raise ValueError("Snapshot columns differ in length")
+        if count and (max(self.category_indexes) >= len(categories) or max(status_indexes) > len(status_table)):
+            raise ValueError("Snapshot refers past its tables")
+
+    def __len__(self):
+        return len(self.paths)
+
+    def statuses(self):
+        """path -> status the last run showed"""
+        table = self.status_table
+        return {path: table[index - 1] for path, index in zip(self.paths, self.status_indexes) if index}
+
+    def groups(self):
+        """category -> indexes of its records, categories in first-seen order"""
+        members = [[] for _ in self.categories]
+        for index, category in enumerate(self.category_indexes):
+            members[category].append(index)
+        return dict(zip(self.categories, members))
+
+    def search(self, query, limit):
+        """Indexes of the first records whose name or path contains query, and whether that is all"""
+        query = query.lower()
+        if not query or SEPARATOR in query:
+            return [], not query
+        if self.columns is None:
+            self.columns = [self.lowered(self.names_text, self.names), self.lowered(self.paths_text, self.paths)]
+        hits = set()
+        complete = True
+        for text, starts in self.columns:
+            found = self.scan(text, starts, query, limit)
+            complete = complete and len(found) <= limit
+            hits.update(found)
+        hits = sorted(hits)
+        if len(hits) > limit:
+            return hits[:limit], False
+        return hits, complete
+
+    @staticmethod
+    def lowered(text, column):
+        """The lowercased joined column, with the offset each record starts at"""
+        lower = text.lower()
+        if len(lower) != len(text):
+            column = lower.split(SEPARATOR)  # A few characters lowercase to two
+        starts = [0]
+        starts.extend(itertools.accumulate(len(value) + 1 for value in column[:-1]))
+        return lower, starts
+
+    @staticmethod
+    def scan(text, starts, query, limit):
+        """Indexes of the records containing query, in order; stops once there are more than limit"""
+        find = text.find
+        end = len(starts)
+        hits = []
+        pos = find(query)
+        while pos != -1:
+            index = bisect_right(starts, pos) - 1
+            hits.append(index)
+            if len(hits) > limit:
+                break
+            # Resume at the next record; one hit per record is enough
+            pos = find(query, starts[index + 1]) if index + 1 < end else -1
+        return hits
+
+
+def read_snapshot(filename=SNAPSHOT_FILE):
+    """Return the Snapshot the last run left, or None
+
+    The snapshot is a marshal dump laid out by column: names and paths are
+    each one joined string, and categories and statuses are small tables
+    indexed from byte arrays, so reading 100k records is a few splits
+    rather than 100k tuples to unmarshal. marshal formats may differ
+    between Python versions, so a snapshot written by another version is
+    ignored like a missing one.
+    """
+    try:
+        with open(filename, "rb") as f:
+            data = marshal.load(f)
+        version, marshal_version = data[:2]
+        if version != SNAPSHOT_VERSION or marshal_version != marshal.version:
+            return None
+        # The saved flags are still written, but load() works out what is saved itself
+        names, paths, categories, category_indexes, saved, statuses, status_indexes = data[2:]
+        return Snapshot(names, paths, categories, category_indexes, statuses, status_indexes)
+    except (OSError, EOFError, ValueError, TypeError, IndexError):
+        return None
+
+
+def write_snapshot(records, saved, statuses, filename=SNAPSHOT_FILE):
+    """Store records, whether each came from storage, and their last known statuses"""
+    categories = {}
+    status_table = {}
+    category_indexes = array.array('I')
+    status_indexes = bytearray()
+    for record in records:
+        category_indexes.append(categories.setdefault(record.category, len(categories)))
+        status = statuses.get(record.path)
+        status_indexes.append(status_table.setdefault(status, len(status_table) + 1) if status else 0)
+    data = (
+        SNAPSHOT_VERSION, marshal.version,
+        SEPARATOR.join(record.name for record in records),
+        SEPARATOR.join(record.path for record in records),
+        tuple(categories), category_indexes.tobytes(),
+        bytes(saved), tuple(status_table), bytes(status_indexes),
+    )
+    temp_file = f"{filename}.tmp"
+    try:
+        with open(temp_file, "wb") as f:
+            marshal.dump(data, f)
+        os.replace(temp_file, filename)
+    except OSError:
+        pass  # Only costs the next start its head start
@@ -0,0 +1,167 @@
+import itertools
+import os
+import queue
+import threading
+import time
+
+import perf
+
+STATUS_OK = "✅"
+STATUS_MISSING = "❌"
+STATUS_CHECKING = "⏳"
+STATUS_TIMEOUT = "⚠️"
+MAX_SPARE_WORKERS = 32  # extra workers standing in for ones stuck on dead shares
+
+
+class StatusProber:
+    """Check path existence on a small pool of worker threads
+
+    The Tk main thread only ever queues paths and drains finished results,
+    so a slow or dead network share can never freeze the window.
+
+    With a PathWatcher, every probed path is also watched, and its cached
+    status is trusted until the watcher reports a change: probing it again
+    returns the cache without touching the disk.
+
+    A worker stuck past the timeout is replaced by a spare, so paths queued
+    behind a dead share still get checked; the first worker to finish
+    while there are spares exits. Once MAX_SPARE_WORKERS are out, probes
+    still waiting in the queue time out as well.
+    """
+
+    def __init__(self, workers=8, timeout=2.0, watcher=None):
+        self.timeout = timeout
+        self.watcher = watcher
+        self.generation = 0
+        self.cache = {}        # path -> last known status
+        self.pending = {}      # path -> generation it was queued in
+        self.timed_out = set() # paths whose probe is still stuck in a worker
+        self.running = {}      # path -> monotonic start time
+        self.queued = {}       # path -> monotonic time its probe was queued
+        self.busy_workers = {} # worker number -> monotonic start of its probe
+        self.replaced = set()  # worker numbers a spare has been started for
+        self.spares = 0
+        self.trusted = set()   # paths whose cached status the watcher vouches for
+        self.versions = {}     # path -> number of times it was invalidated
+        self.lock = threading.Lock()
+        self.jobs = queue.Queue()
+        self.results = queue.Queue()
+
+        self.worker_numbers = itertools.count()
+        for _ in range(workers):
+            self.start_worker()
+
+    def start_worker(self):
+        # Daemon threads: a probe stuck on a dead share must not block exit
+        number = next(self.worker_numbers)
+        worker = threading.Thread(target=self._worker, args=(number,), name=f"status-probe-{number}", daemon=True)
+        worker.start()
+
+    def _worker(self, number):
+        while True:
+            generation, path, version = self.jobs.get()
+            with self.lock:
+                self.queued.pop(path, None)
+            if generation != self.generation:
+                continue  # Cancelled before it started
+
+            with self.lock:
+                self.running[path] = self.busy_workers[number] = time.monotonic()
+            try:
+                with perf.span('status_probe'):
+                    if self.watcher:
+                        # Watch first, so a change during the check is not missed
+                        self.watcher.watch(path)
+                    status = STATUS_OK if os.path.exists(path) else STATUS_MISSING
+            except Exception:
+                status = STATUS_MISSING
+            finally:
+                with self.lock:
+                    self.running.pop(path, None)
+                    del self.busy_workers[number]
+                    self.replaced.discard(number)
+                    retire = self.spares > 0
+                    if retire:
+                        self.spares -= 1
+            self.results.put((generation, path, status, version))
+            if retire:
+                return
+
+    def cancel_all(self):
+        """Drop every queued probe; late results are cached but not reported"""
+        self.generation += 1
+        self.pending.clear()
+
+    def probe(self, path):
+        """Queue a probe for path and return the status to show meanwhile"""
+        if path in self.trusted:
+            return self.cache[path]
+        if self.pending.get(path) != self.generation and path not in self.timed_out:
+            self.pending[path] = self.generation
+            with self.lock:
+                self.queued.setdefault(path, time.monotonic())
+            self.jobs.put((self.generation, path, self.versions.get(path, 0)))
+        return self.status(path)
+
+    def seed(self, statuses):
+        """Show statuses remembered from an earlier run until probes confirm them"""
+        for path, status in statuses.items():
+            self.cache.setdefault(path, status)
+
+    def invalidate(self, path):
+        """Forget that path's cached status is current; the next probe checks it again"""
+        self.trusted.discard(path)
+        self.versions[path] = self.versions.get(path, 0) + 1
+        # A probe already queued may have looked before the change
+        self.pending.pop(path, None)
+
+    def status(self, path):
+        """Return the last known status of path without probing it"""
+        if path in self.timed_out:
+            return self.cache.get(path, STATUS_TIMEOUT)
+        return self.cache.get(path, STATUS_CHECKING)
+
+    def busy(self):
+        return bool(self.pending)
+
+    def poll(self):
+        """Return (path, status) updates for the current generation"""
+        updates = []
+
+        while True:
+            try:
+                generation, path, status, version = self.results.get_nowait()
+            except queue.Empty:
+                break
+            self.cache[path] = status
+            was_stuck = path in self.timed_out
+            self.timed_out.discard(path)
+            current = version == self.versions.get(path, 0)
+            if current and self.watcher and self.watcher.watching(path):
+                self.trusted.add(path)
+            if generation == self.generation or was_stuck:
+                updates.append((path, status))
+            if current and self.pending.get(path) == generation:
+                del self.pending[path]
+
+        # Give up on probes that have been running for too long
+        now = time.monotonic()
+        with self.lock:
+            running = list(self.running.items())
+            stuck = [number for number, started in self.busy_workers.items()
+                     if now - started > self.timeout and number not in self.replaced]
+            stuck = stuck[:MAX_SPARE_WORKERS - self.spares]
+            self.replaced.update(stuck)
+            self.spares += len(stuck)
+            if self.spares >= MAX_SPARE_WORKERS:
+                # Every worker may be stuck; probes still queued would wait forever
+                running.extend(self.queued.items())
+        for _ in stuck:
+            self.start_worker()
+        for path, started in running:
+            if now - started > self.timeout and path in self.pending and path not in self.timed_out:
+                self.timed_out.add(path)
+                del self.pending[path]
+                updates.append((path, STATUS_TIMEOUT))
+
+        return updates
@@ -0,0 +1,466 @@
+import json
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+
+from path_record import PathRecord
+
+SAVE_FILE = "saved_paths.json"
+DB_FILE = "saved_paths.db"
+CUSTOM_CATEGORY = 'Custom Paths'
+CHANGE_LOG_KEEP = 10000  # change rows kept for other processes to catch up from
+PAGE_SIZE = 1000  # rows per query when streaming records out
+
+
+class StorageError(Exception):
+    pass
+
+
+def coerce_record(path_info):
+    """Turn a saved entry into a PathRecord; plain strings are the old format"""
+    if isinstance(path_info, str):
+        return PathRecord(os.path.basename(path_info) or path_info, path_info, CUSTOM_CATEGORY)
+    if isinstance(path_info, dict) and path_info.get('path'):
+        return PathRecord(
+            path_info.get('name') or path_info['path'],
+            path_info['path'],
+            path_info.get('category') or CUSTOM_CATEGORY
+        )
+    return None
+
+
+def read_json_file(filename):
+    """Return the records stored in a saved_paths.json document"""
+    with open(filename, "r", encoding='utf-8') as f:
+        saved_data = json.load(f)
+    records = []
+    for path_info in saved_data.get('custom_paths', []):
+        record = coerce_record(path_info)
+        if record:
+            records.append(record)
+    return records
+
+
+@contextmanager
+def file_lock(filename):
+    """Hold an exclusive lock on filename.lock, shared by every process using filename"""
+    with open(f"{filename}.lock", "a+b") as f:
+        if os.name == 'nt':
+            import msvcrt
+            f.seek(0)
+            while True:
+                try:
+                    msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    continue  # LK_LOCK gives up after ten seconds; keep waiting
+            try:
+                yield
+            finally:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            import fcntl
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+def apply_ops(records, ops):
+    """Apply ('add', record) and ('remove', path) changes to a list of records"""
+    by_path = {record.path: record for record in records}
+    for op, value in ops:
+        if op == 'add':
+            by_path.setdefault(value.path, value)
+        else:
+            by_path.pop(value, None)
+    return list(by_path.values())
+
+
+def diff_records(old, new):
+    """Changes that turn the records in old (path -> record) into the list new"""
+    new_paths = {record.path: record for record in new}
+    ops = [('remove', path) for path in old if path not in new_paths]
+    for path, record in new_paths.items():
+        known = old.get(path)
+        if known is None:
+            ops.append(('add', record))
+        elif (known.name, known.category) != (record.name, record.category):
+            ops.append(('remove', path))
+            ops.append(('add', record))
+    return ops
+
+
+class JsonStorage:
+    """The original saved_paths.json document
+
+    Every change still rewrites the whole file, but through a temporary
+    file and os.replace, so a crash can never leave a half-written store.
+    Writes hold a lock file and replay this process's changes on top of
+    whatever is on disk, so two windows saving at once cannot drop each
+    other's paths, and poll_changes() reports what other processes saved.
+    """
+
+    def __init__(self, filename=SAVE_FILE):
+        self.filename = filename
+        self.records = []     # as last read from or written to disk
+        self.reported = {}    # path -> record, as the caller last heard
+        self.ops = []         # changes not written yet
+        self.pending = []     # other processes' changes found while writing, for poll_changes
+        self.signature = None
+        self.depth = 0
+        self.loaded = False
+
+    def stat_signature(self):
+        try:
+            st = os.stat(self.filename)
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+
+    def read(self):
+        """Read the file; the caller holds the lock"""
+        self.signature = self.stat_signature()
+        if self.signature is None:
+            return []
+        return read_json_file(self.filename)
+
+    def load(self):
+        try:
+            with file_lock(self.filename):
+                records = self.read()
+        except (ValueError, AttributeError) as e:
+            # Keep the damaged file instead of overwriting it on the next save
+            self.records = []
+            self.reported = {}
+            os.replace(self.filename, f"{self.filename}.corrupt")
+            raise StorageError(f"{self.filename} is corrupt and was moved to {self.filename}.corrupt: {e}")
+        except OSError as e:
+            raise StorageError(str(e))
+        self.records = records
+        self.reported = {record.path: record for record in records}
+        self.pending = []
+        self.loaded = True
+        return list(records)
+
+    def iter_records(self, category=None):
+        """Yield saved records; the JSON document itself has to be read whole"""
+        try:
+            with file_lock(self.filename):
+                records = read_json_file(self.filename) if os.path.exists(self.filename) else []
+        except (OSError, ValueError, AttributeError) as e:
+            raise StorageError(f"Cannot read {self.filename}: {e}")
+        for record in records:
+            if category is None or record.category == category:
+                yield record
+
+    def add_many(self, records):
+        """Add records not saved yet in one write; returns how many were new"""
+        if not self.loaded:
+            self.load()
+        added = 0
+        with self.transaction():
+            for record in records:
+                if record.path not in self.reported:
+                    self.add(record)
+                    added += 1
+        return added
+
+    def add(self, record):
+        self.ops.append(('add', record))
+        self.reported[record.path] = record
+        self.changed()
+
+    def remove(self, path):
+        self.ops.append(('remove', path))
+        self.reported.pop(path, None)
+        self.changed()
+
+    @contextmanager
+    def transaction(self):
+        """Batch changes into a single rewrite"""
+        self.depth += 1
+        try:
+            yield self
+        finally:
+            self.depth -= 1
+            if self.depth == 0 and self.ops:
+                self.write()
+
+    def changed(self):
+        if self.depth == 0:
+            self.write()
+
+    def write(self):
+        temp_file = f"{self.filename}.tmp"
+        try:
+            with file_lock(self.filename):
+                records = self.records
+                merged = False
+                if self.stat_signature() != self.signature:
+                    # Someone else saved since we last looked: build on their version
+                    try:
+                        records = self.read()
+                        merged = True
+                    except (ValueError, AttributeError):
+                        pass
+                records = apply_ops(records, self.ops)
+                if merged:
+                    # The signature is about to be ours, so poll_changes would not see theirs
+                    self.pending.extend(diff_records(self.reported, records))
+                    self.reported = {record.path: record for record in records}
+                with open(temp_file, "w", encoding='utf-8') as f:
+                    json.dump({'custom_paths': [record.to_dict() for record in records]}, f,
+                              indent=2, ensure_ascii=False)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(temp_file, self.filename)
+                self.signature = self.stat_signature()
+        except OSError as e:
+            raise StorageError(str(e))
+        self.records = records
+        self.ops = []
+
+    def poll_changes(self):
+        """Return the changes other processes saved since the last call, in order"""
+        ops, self.pending = self.pending, []
+        if self.ops or self.stat_signature() == self.signature:
+            return ops
+        try:
+            with file_lock(self.filename):
+                records = self.read()
+        except (OSError, ValueError, AttributeError):
+            return ops  # Mid-write or damaged; look again next time
+        self.records = records
+        ops.extend(diff_records(self.reported, records))
+        self.reported = {record.path: record for record in records}
+        return ops
+
+    def close(self):
+        pass
+
+
+class SqliteStorage:
+    """Custom paths in a SQLite database in WAL mode
+
+    Adding or removing a path is a single-row statement committed on its
+    own, and transaction() groups bulk changes into one atomic commit.
+    An existing saved_paths.json is imported the first time the database
+    is opened.
+
+    Triggers append every insert and delete to a change log, so other
+    processes can pick up exactly what changed: poll_changes() checks
+    PRAGMA data_version, which moves only when another connection commits,
+    and reads the log from where it left off.
+    """
+
+    def __init__(self, filename=DB_FILE, legacy_file=SAVE_FILE):
+        self.filename = filename
+        self.lock = threading.RLock()
+        self.depth = 0
+        self.last_seq = 0
+        self.data_version = None
+        self.migration_error = None  # raised by the next load()
+        try:
+            self.conn = sqlite3.connect(filename, isolation_level=None, check_same_thread=False)
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute("PRAGMA synchronous=NORMAL")
+            self.conn.executescript("""
+                CREATE TABLE IF NOT EXISTS custom_paths (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    path TEXT NOT NULL UNIQUE,
+                    name TEXT NOT NULL,
+                    category TEXT NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS meta (
+                    key TEXT PRIMARY KEY,
+                    value TEXT
+                );
+                CREATE TABLE IF NOT EXISTS changes (
+                    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                    op TEXT NOT NULL,
+                    path TEXT NOT NULL,
+                    name TEXT,
+                    category TEXT
+                );
+                CREATE TRIGGER IF NOT EXISTS custom_paths_added AFTER INSERT ON custom_paths BEGIN
+                    INSERT INTO changes (op, path, name, category) VALUES ('add', NEW.path, NEW.name, NEW.category);
+                END;
+                CREATE TRIGGER IF NOT EXISTS custom_paths_removed AFTER DELETE ON custom_paths BEGIN
+                    INSERT INTO changes (op, path) VALUES ('remove', OLD.path);
+                END;
+            """)
+        except sqlite3.Error as e:
+            raise StorageError(f"Cannot open {filename}: {e}")
+        if legacy_file:
+            self.migrate_json(legacy_file)
+
+    def migrate_json(self, legacy_file):
+        """Import saved_paths.json once; a corrupt file is moved aside and reported by load()"""
+        if self.get_meta('json_migrated') or not os.path.exists(legacy_file):
+            return
+        try:
+            with file_lock(legacy_file):
+                records = read_json_file(legacy_file)
+        except (ValueError, AttributeError) as e:
+            # Like JsonStorage: keep the damaged file, but never import it again
+            corrupt_file = f"{legacy_file}.corrupt"
+            try:
+                os.replace(legacy_file, corrupt_file)
+            except OSError as move_error:
+                self.migration_error = StorageError(f"{legacy_file} is corrupt and could not be moved: {move_error}")
+                return
+            self.migration_error = StorageError(f"{legacy_file} is corrupt and was moved to {corrupt_file}: {e}")
+            return
+        except OSError as e:
+            self.migration_error = StorageError(f"Cannot import {legacy_file}: {e}")
+            return  # Tried again on the next start
+        with self.transaction():
+            for record in records:
+                self.add(record)
+            self.set_meta('json_migrated', legacy_file)
+
+    def get_meta(self, key):
+        with self.lock:
+            row = self.conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def set_meta(self, key, value):
+        self.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
+
+    def execute(self, sql, params=()):
+        try:
+            with self.lock:
+                return self.conn.execute(sql, params)
+        except sqlite3.Error as e:
+            raise StorageError(str(e))
+
+    def load(self):
+        if self.migration_error:
+            error, self.migration_error = self.migration_error, None
+            raise error
+        with self.lock:
+            try:
+                # Old change rows are only needed by processes that are far behind
+                self.conn.execute("DELETE FROM changes WHERE seq <= (SELECT MAX(seq) FROM changes) - ?",
+                                  (CHANGE_LOG_KEEP,))
+                # Read the rows and the log position from one snapshot
+                self.conn.execute("BEGIN")
+                try:
+                    rows = self.conn.execute("SELECT name, path, category FROM custom_paths ORDER BY id").fetchall()
+                    self.last_seq = self.conn.execute("SELECT COALESCE(MAX(seq), 0) FROM changes").fetchone()[0]
+                finally:
+                    self.conn.execute("COMMIT")
+                self.data_version = self.conn.execute("PRAGMA data_version").fetchone()[0]
+            except sqlite3.Error as e:
+                raise StorageError(str(e))
+        return [PathRecord(name, path, category) for name, path, category in rows]
+
+    def poll_changes(self):
+        """Return the changes saved since load or the last call, in order; None if too far behind"""
+        with self.lock:
+            if self.depth:
+                return []
+            try:
+                version = self.conn.execute("PRAGMA data_version").fetchone()[0]
+                if version == self.data_version:
+                    return []
+                self.data_version = version
+                newest = self.conn.execute("SELECT COALESCE(MAX(seq), 0) FROM changes").fetchone()[0]
+                if newest - self.last_seq > CHANGE_LOG_KEEP:
+                    return None  # A bulk import; reloading beats replaying it row by row
+                rows = self.conn.execute(
+                    "SELECT seq, op, path, name, category FROM changes WHERE seq > ? ORDER BY seq",
+                    (self.last_seq,)
+                ).fetchall()
+            except sqlite3.Error:
+                return []
+        if not rows:
+            return []
+        if rows[0][0] > self.last_seq + 1 and self.last_seq:
+            return None  # The log was trimmed past our position
+        self.last_seq = rows[-1][0]
+        return [('add', PathRecord(name, path, category)) if op == 'add' else ('remove', path)
+                for seq, op, path, name, category in rows]
+
+    def add(self, record):
+        self.execute(
+            "INSERT OR IGNORE INTO custom_paths (path, name, category) VALUES (?, ?, ?)",
+            (record.path, record.name, record.category)
+        )
+
+    def add_many(self, records):
+        """Insert records in one transaction, skipping saved paths; returns how many were new"""
+        with self.transaction():
+            try:
+                with self.lock:
+                    cursor = self.conn.executemany(
+                        "INSERT OR IGNORE INTO custom_paths (path, name, category) VALUES (?, ?, ?)",
+                        ((record.path, record.name, record.category) for record in records)
+                    )
+            except sqlite3.Error as e:
+                raise StorageError(str(e))
+        # rowcount leaves out the change log rows the trigger adds
+        return cursor.rowcount
+
+    def iter_records(self, category=None, page_size=PAGE_SIZE):
+        """Yield saved records a page at a time, never holding more than one page"""
+        where = "AND category = ?" if category is not None else ""
+        last_id = 0
+        while True:
+            params = (last_id, category, page_size) if category is not None else (last_id, page_size)
+            try:
+                with self.lock:
+                    rows = self.conn.execute(
+                        f"SELECT id, name, path, category FROM custom_paths WHERE id > ? {where} ORDER BY id LIMIT ?",
+                        params
+                    ).fetchall()
+            except sqlite3.Error as e:
+                raise StorageError(str(e))
+            if not rows:
+                return
+            for row_id, name, path, category_name in rows:
+                yield PathRecord(name, path, category_name)
+            last_id = rows[-1][0]
+
+    def remove(self, path):
+        self.execute("DELETE FROM custom_paths WHERE path = ?", (path,))
+
+    @contextmanager
+    def transaction(self):
+        """Commit everything inside the block atomically, or nothing"""
+        with self.lock:
+            self.depth += 1
+            if self.depth == 1:
+                self.execute("BEGIN IMMEDIATE")
+            try:
+                yield self
+            except BaseException:
+                self.depth -= 1
+                if self.depth == 0:
+                    self.execute("ROLLBACK")
+                raise
+            self.depth -= 1
+            if self.depth == 0:
+                self.execute("COMMIT")
+
+    def close(self):
+        with self.lock:
+            self.conn.close()
+
+
+STORAGE_BACKENDS = {
+    'sqlite': SqliteStorage,
+    'json': JsonStorage,
+}
+
+
+def open_storage(kind=None):
+    """Open the configured backend; OPEN_PATH_TOOL_STORAGE picks sqlite or json"""
+    kind = kind or os.environ.get('OPEN_PATH_TOOL_STORAGE', 'sqlite')
+    if kind not in STORAGE_BACKENDS:
+        raise StorageError(f"Unknown storage backend: {kind}")
+    return STORAGE_BACKENDS[kind]()
@@ -0,0 +1,245 @@
+import json
+import os
+import queue
+import threading
+import time
+import urllib.parse
+
+from path_record import PathRecord
+from storage import diff_records
+
+TEAM_CATALOG_ENV = 'OPEN_PATH_TOOL_TEAM_CATALOG'   # http(s) URL or path of a shared catalog
+TEAM_POLL_ENV = 'OPEN_PATH_TOOL_TEAM_POLL'
+TEAM_CACHE_FILE = "team_catalog_cache.json"
+TEAM_CATEGORY = 'Team Paths'
+TEAM_POLL_S = 300.0       # between checks for a newer shared catalog
+FETCH_TIMEOUT_S = 10.0
+
+
+def team_record(path_info):
+    """Turn a shared entry into a PathRecord; entries without a category go under Team Paths
+
+    Raises ValueError for anything but an object with a path, so a bad
+    document is rejected whole instead of half applied.
+    """
+    if not isinstance(path_info, dict):
+        raise ValueError("A shared path is not a JSON object")
+    path = path_info.get('path')
+    name = path_info.get('name') or path
+    category = path_info.get('category') or TEAM_CATEGORY
+    if not isinstance(path, str) or not path:
+        raise ValueError("A shared path has no path")
+    if not isinstance(name, str) or not isinstance(category, str):
+        raise ValueError(f"The name and category of {path} must be text")
+    return PathRecord(name, path, category)
+
+
+def parse_records(entries):
+    if not isinstance(entries, list):
+        raise ValueError("custom_paths is not a list")
+    return [team_record(path_info) for path_info in entries]
+
+
+def parse_changes(changes):
+    """Turn a delta's changes into ('add', record) and ('remove', path) operations"""
+    if not isinstance(changes, list):
+        raise ValueError("changes is not a list")
+    ops = []
+    for change in changes:
+        op = change.get('op') if isinstance(change, dict) else None
+        if op == 'add':
+            ops.append(('add', team_record(change)))
+        elif op == 'remove' and isinstance(change.get('path'), str) and change['path']:
+            ops.append(('remove', change['path']))
+        else:
+            raise ValueError(f"Not a change: {change!r}")
+    return ops
+
+
+class TeamCatalog:
+    """A catalog shared by a team, served over HTTP or from a mounted file
+
+    The shared document has the same layout as saved_paths.json and may
+    carry a "version". Over HTTP, each check is a conditional GET with
+    If-None-Match and If-Modified-Since, so an unchanged catalog costs a
+    304 and no download. When a version is known the request adds
+    ?since=<version>. A server that keeps history can then answer with
+    only the changes:
+
+        {"version": "v8", "since": "v7", "changes": [
+            {"op": "add", "name": "...", "path": "...", "category": "..."},
+            {"op": "remove", "path": "..."}]}
+
+    A plain file server ignores the parameter and sends the whole document.
+    A whole document is diffed against the cached copy. A mounted file is
+    only re-read when its mtime or size changes. Either way poll() hands
+    out just the additions and removals. The last copy is cached on disk,
+    so the catalog is still there offline.
+
+    team_catalog_server.py serves a stand-in that keeps history, for
+    trying this without a real server:
+
+        python team_catalog_server.py catalog.json [port]
+    """
+
+    def __init__(self, source, cache_file=TEAM_CACHE_FILE, interval=None):
+        self.source = source
+        self.is_url = urllib.parse.urlsplit(source).scheme in ('http', 'https')
+        self.cache_file = cache_file
+        self.interval = interval or float(os.environ.get(TEAM_POLL_ENV) or TEAM_POLL_S)
+        self.lock = threading.Lock()
+        self.records = {}     # path -> record, as last fetched
+        self.etag = None
+        self.last_modified = None
+        self.version = None
+        self.signature = None  # (mtime, size) of a mounted file
+        self.error = None      # why the last check failed, if it did
+        self.changes = queue.Queue()
+        self.worker = None
+        self.load_cache()
+
+    def load_cache(self):
+        try:
+            with open(self.cache_file, "r", encoding='utf-8') as f:
+                cache = json.load(f)
+            if not isinstance(cache, dict) or cache.get('source') != self.source:
+                return  # Cached from another catalog; start over
+            records = parse_records(cache.get('custom_paths'))
+        except (OSError, ValueError):
+            return
+        self.records = {record.path: record for record in records}
+        self.etag = cache.get('etag')
+        self.last_modified = cache.get('last_modified')
+        self.version = cache.get('version')
+        signature = cache.get('signature')
+        self.signature = tuple(signature) if signature else None
+
+    def save_cache(self):
+        cache = {
+            'source': self.source,
+            'etag': self.etag,
+            'last_modified': self.last_modified,
+            'version': self.version,
+            'signature': self.signature,
+            'custom_paths': [record.to_dict() for record in self.records.values()],
+        }
+        temp_file = f"{self.cache_file}.tmp"
+        try:
+            with open(temp_file, "w", encoding='utf-8') as f:
+                json.dump(cache, f, ensure_ascii=False)
+            os.replace(temp_file, self.cache_file)
+        except OSError:
+            pass  # Works online all the same
+
+    def cached(self):
+        """The shared records as last fetched, without touching the network"""
+        with self.lock:
+            return list(self.records.values())
+
+    def start(self):
+        """Check for changes now and then every interval, on a background thread"""
+        if self.worker is None:
+            self.worker = threading.Thread(target=self._run, name="team-catalog", daemon=True)
+            self.worker.start()
+
+    def _run(self):
+        while True:
+            try:
+                self.check()
+            except Exception as e:
+                # Whatever a server sends, syncing goes on at the next interval
+                self.error = str(e)
+            time.sleep(self.interval)
+
+    def check(self):
+        """Fetch changes once; returns True if the catalog changed"""
+        from http.client import HTTPException
+        try:
+            ops = self.fetch_url() if self.is_url else self.read_file()
+        except (OSError, ValueError, HTTPException) as e:
+            # Offline or a bad document: keep serving the cached copy
+            self.error = str(e)
+            return False
+        self.error = None
+        if not ops:
+            return False
+        with self.lock:
+            for op, value in ops:
+                if op == 'add':
+                    self.records[value.path] = value
+                else:
+                    self.records.pop(value, None)
+        self.save_cache()
+        self.changes.put(ops)
+        return True
+
+    def read_file(self):
+        st = os.stat(self.source)
+        signature = (st.st_mtime_ns, st.st_size)
+        if signature == self.signature:
+            return []
+        with open(self.source, "r", encoding='utf-8') as f:
+            document = json.load(f)
+        self.signature = signature
+        return self.apply_document(document)
+
+    def fetch_url(self, use_delta=True):
+        # Only a URL catalog pays for the HTTP stack, and only on the worker thread
+        import urllib.error
+        import urllib.request
+        url = self.source
+        if use_delta and self.version is not None:
+            separator = '&' if urllib.parse.urlsplit(url).query else '?'
+            url = f"{url}{separator}{urllib.parse.urlencode({'since': self.version})}"
+        request = urllib.request.Request(url, headers={'Accept': 'application/json'})
+        if self.etag:
+            request.add_header('If-None-Match', self.etag)
+        if self.last_modified:
+            request.add_header('If-Modified-Since', self.last_modified)
+        try:
+            with urllib.request.urlopen(request, timeout=FETCH_TIMEOUT_S) as response:
+                document = json.loads(response.read().decode('utf-8'))
+                etag = response.headers.get('ETag')
+                last_modified = response.headers.get('Last-Modified')
+        except urllib.error.HTTPError as e:
+            if e.code == 304:
+                return []
+            raise
+
+        if not isinstance(document, dict):
+            raise ValueError("The shared catalog is not a JSON object")
+        if 'changes' in document:
+            if document.get('since') != self.version:
+                # A delta from some other version is no use; ask for everything
+                self.version = self.etag = self.last_modified = None
+                return self.fetch_url(use_delta=False)
+            ops = parse_changes(document['changes'])
+        else:
+            ops = self.apply_document(document)
+        self.etag = etag
+        self.last_modified = last_modified
+        self.version = document.get('version')
+        return ops
+
+    def apply_document(self, document):
+        """Changes between the cached records and a whole shared document"""
+        if not isinstance(document, dict):
+            raise ValueError("The shared catalog is not a JSON object")
+        with self.lock:
+            known = dict(self.records)
+        return diff_records(known, parse_records(document.get('custom_paths')))
+
+    def poll(self):
+        """Return the changes fetched since the last poll, in order"""
+        ops = []
+        while True:
+            try:
+                ops.extend(self.changes.get_nowait())
+            except queue.Empty:
+                return ops
+
+
+def team_catalog_from_env():
+    """The TeamCatalog OPEN_PATH_TOOL_TEAM_CATALOG points at, or None"""
+    source = os.environ.get(TEAM_CATALOG_ENV)
+    return TeamCatalog(source) if source else None
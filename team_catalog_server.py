@@ -0,0 +1,84 @@
+import email.utils
+import json
+import os
+import sys
+import threading
+import urllib.parse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from storage import diff_records
+from team_catalog import parse_records
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """Serve server.filename with ETags, Last-Modified and ?since= deltas"""
+
+    def do_GET(self):
+        version, records, mtime = self.server.current()
+        etag = f'"{version}"'
+        last_modified = email.utils.formatdate(mtime, usegmt=True)
+        if self.headers.get('If-None-Match') == etag:
+            return self.reply(304, etag, last_modified)
+        if_modified_since = self.headers.get('If-Modified-Since')
+        if if_modified_since and not self.headers.get('If-None-Match'):
+            try:
+                if email.utils.parsedate_to_datetime(if_modified_since).timestamp() >= int(mtime):
+                    return self.reply(304, etag, last_modified)
+            except (TypeError, ValueError):
+                pass
+        since = urllib.parse.parse_qs(urllib.parse.urlsplit(self.path).query).get('since', [None])[0]
+        old = self.server.history.get(since)
+        if old is not None and since != version:
+            changes = []
+            for op, value in diff_records(old, list(records.values())):
+                changes.append(dict(value.to_dict(), op='add') if op == 'add' else {'op': 'remove', 'path': value})
+            document = {'version': version, 'since': since, 'changes': changes}
+        else:
+            document = {'version': version, 'custom_paths': [record.to_dict() for record in records.values()]}
+        self.reply(200, etag, last_modified, json.dumps(document, ensure_ascii=False).encode('utf-8'))
+
+    def reply(self, code, etag, last_modified, body=b''):
+        self.send_response(code)
+        self.send_header('ETag', etag)
+        self.send_header('Last-Modified', last_modified)
+        if body:
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class StandInServer(ThreadingHTTPServer):
+    """A shared catalog server for trying sync without a real one
+
+    Every time the file changes it becomes a new version, and earlier
+    versions are kept so clients can be sent just the changes since theirs.
+    """
+
+    def __init__(self, filename, address):
+        super().__init__(address, StandInHandler)
+        self.filename = filename
+        self.lock = threading.Lock()
+        self.history = {}   # version -> path -> record
+        self.signature = None
+        self.version = None
+        self.mtime = 0
+
+    def current(self):
+        with self.lock:
+            st = os.stat(self.filename)
+            if (st.st_mtime_ns, st.st_size) != self.signature:
+                with open(self.filename, "r", encoding='utf-8') as f:
+                    records = parse_records(json.load(f).get('custom_paths'))
+                self.signature = (st.st_mtime_ns, st.st_size)
+                self.version = f"v{len(self.history) + 1}"
+                self.history[self.version] = {record.path: record for record in records}
+                self.mtime = st.st_mtime
+            return self.version, self.history[self.version], self.mtime
+
+
+if __name__ == "__main__":
+    # python team_catalog_server.py catalog.json [port]: serve a stand-in shared catalog
+    server = StandInServer(sys.argv[1], ('127.0.0.1', int(sys.argv[2]) if len(sys.argv) > 2 else 8765))
+    print(f"Serving {sys.argv[1]} at http://127.0.0.1:{server.server_address[1]}/", flush=True)
+    server.serve_forever()
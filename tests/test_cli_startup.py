@@ -0,0 +1,54 @@
+"""Cold start of the command line, which must never pay for Tk
+
+    python -m unittest discover tests
+"""
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+TOOL = os.path.join(ROOT, 'open_path_tool.py')
+STARTUP_BUDGET_S = 0.5  # wall time of `list` in a fresh interpreter, best of RUNS
+RUNS = 3
+
+
+class CliStartupTest(unittest.TestCase):
+
+    def setUp(self):
+        # An empty catalog of its own, and no daemon to answer in its place
+        self.directory = tempfile.mkdtemp(prefix='cli-startup-')
+        self.env = dict(os.environ, OPEN_PATH_TOOL_SOCKET=os.path.join(self.directory, 'none.sock'))
+        self.env.pop('OPEN_PATH_TOOL_TEAM_CATALOG', None)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def run_tool(self, *args):
+        return subprocess.run([sys.executable, TOOL, '--no-daemon'] + list(args), cwd=self.directory,
+                              env=self.env, capture_output=True, text=True, check=True)
+
+    def test_list_within_budget(self):
+        self.run_tool('list')  # Leaves the store files behind, as any later start finds them
+        timings = []
+        for _ in range(RUNS):
+            start = time.perf_counter()
+            self.run_tool('list')
+            timings.append(time.perf_counter() - start)
+        self.assertLess(min(timings), STARTUP_BUDGET_S,
+                        f"`list` took {min(timings) * 1000:.0f} ms, over the {STARTUP_BUDGET_S * 1000:.0f} ms budget")
+
+    def test_list_never_imports_tkinter(self):
+        code = (f"import sys; sys.path.insert(0, {ROOT!r}); import open_path_tool; "
+                f"open_path_tool.main(['--no-daemon', 'list']); "
+                f"print(sorted(name for name in sys.modules if name.split('.')[0] == 'tkinter'), file=sys.stderr)")
+        result = subprocess.run([sys.executable, '-c', code], cwd=self.directory, env=self.env,
+                                capture_output=True, text=True, check=True)
+        self.assertEqual(result.stderr.strip().splitlines()[-1], '[]')
+
+
+if __name__ == '__main__':
+    unittest.main()
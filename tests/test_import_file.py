@@ -0,0 +1,92 @@
+"""import-file: what counts as added, already listed and invalid
+
+    python -m unittest discover tests
+"""
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+TOOL = os.path.join(ROOT, 'open_path_tool.py')
+
+
+class ImportFileTest(unittest.TestCase):
+    storage = 'sqlite'
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp(prefix='import-file-')
+        self.home = os.path.join(self.directory, 'home')
+        self.env = dict(os.environ, USERPROFILE=self.home, OPEN_PATH_TOOL_STORAGE=self.storage,
+                        OPEN_PATH_TOOL_SOCKET=os.path.join(self.directory, 'none.sock'))
+        self.env.pop('OPEN_PATH_TOOL_TEAM_CATALOG', None)
+        self.saved = os.path.join(self.directory, 'saved')
+        self.run_tool('add', self.saved)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def run_tool(self, *args):
+        return subprocess.run([sys.executable, TOOL, '--no-daemon'] + list(args), cwd=self.directory,
+                              env=self.env, capture_output=True, text=True, check=True)
+
+    def write(self, name, text):
+        filename = os.path.join(self.directory, name)
+        with open(filename, "w", encoding='utf-8', newline='') as f:
+            f.write(text)
+        return filename
+
+    def listed(self):
+        return [line.split('\t')[2] for line in self.run_tool('list').stdout.splitlines()]
+
+    def check_import(self, filename):
+        result = self.run_tool('import-file', filename)
+        self.assertIn("Imported 2 new paths (4 already listed, 2 invalid)", result.stdout)
+        listed = self.listed()
+        new = [os.path.join(self.directory, 'a'), os.path.join(self.directory, 'b')]
+        for path in new:
+            self.assertEqual(listed.count(path), 1)
+        # A default and a saved path, each listed once and under their first spelling
+        self.assertEqual(listed.count(os.path.join(self.home, 'Desktop')), 1)
+        self.assertEqual(listed.count(self.saved), 1)
+        self.assertEqual(len(listed), 16)
+        # Every row imported can be removed again
+        for path in new:
+            self.run_tool('remove', path)
+
+    def test_ndjson(self):
+        lines = [
+            {'path': os.path.join(self.directory, 'a')},
+            {'path': os.path.join(self.home, 'Desktop')},        # a default
+            {'path': self.saved + os.sep},                        # saved, spelled differently
+            {'path': os.path.join(self.directory, 'a')},          # an earlier line
+            {'name': 'B', 'path': os.path.join(self.directory, 'b'), 'category': 'Work'},
+            {'path': os.path.join(self.directory, '.', 'b')},    # b again
+            {'name': 'no path'},
+        ]
+        text = "".join(json.dumps(line) + "\n" for line in lines) + "not json\n\n"
+        self.check_import(self.write('paths.ndjson', text))
+
+    def test_csv(self):
+        rows = [
+            f",{os.path.join(self.directory, 'a')},",
+            f",{os.path.join(self.home, 'Desktop')},",
+            f",{self.saved + os.sep},",
+            f",{os.path.join(self.directory, 'a')},",
+            f"B,{os.path.join(self.directory, 'b')},Work",
+            f",{os.path.join(self.directory, '.', 'b')},",
+            "no path,,",
+            '"bad\nname",/x,',
+        ]
+        self.check_import(self.write('paths.csv', "name,path,category\n" + "\n".join(rows) + "\n"))
+
+
+class JsonImportFileTest(ImportFileTest):
+    storage = 'json'
+
+
+if __name__ == '__main__':
+    unittest.main()
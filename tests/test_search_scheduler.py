@@ -0,0 +1,85 @@
+"""SearchScheduler keeps typed queries and chunked renders apart
+
+    python -m unittest discover tests
+"""
+import itertools
+import os
+import sys
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from search_scheduler import SearchScheduler  # noqa: E402
+
+
+class FakeWidget:
+    """after() and after_cancel() on a clock the test advances"""
+
+    def __init__(self):
+        self.now = 0
+        self.ids = itertools.count(1)
+        self.pending = {}   # id -> (due, callback, args)
+
+    def after(self, ms, callback, *args):
+        after_id = next(self.ids)
+        self.pending[after_id] = (self.now + ms, callback, args)
+        return after_id
+
+    def after_cancel(self, after_id):
+        self.pending.pop(after_id, None)
+
+    def advance(self, ms):
+        """Run callbacks in the order they fall due, each at its own time"""
+        end = self.now + ms
+        while True:
+            due = sorted((due, after_id) for after_id, (due, callback, args) in self.pending.items()
+                         if due <= end)
+            if not due:
+                self.now = end
+                return
+            self.now, after_id = due[0]
+            callback, args = self.pending.pop(after_id)[1:]
+            callback(*args)
+
+
+def steps(log, name, chunks):
+    for chunk in range(chunks):
+        log.append((name, chunk))
+        yield
+
+
+class SearchSchedulerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.widget = FakeWidget()
+        self.searches = []
+        self.scheduler = SearchScheduler(self.widget, lambda: self.searches.append(self.widget.now), 150)
+
+    def test_typing_runs_one_search_after_the_delay(self):
+        for _ in range(3):
+            self.scheduler.schedule()
+            self.widget.advance(100)
+        self.widget.advance(100)
+        self.assertEqual(self.searches, [350])
+
+    def test_render_keeps_a_pending_query(self):
+        # Scrolling right after a keystroke re-renders the rows already shown
+        self.scheduler.schedule()
+        self.widget.advance(50)
+        log = []
+        self.scheduler.render(steps(log, 'scroll', 2))
+        self.widget.advance(200)
+        self.assertEqual(self.searches, [150])
+        self.assertEqual(log, [('scroll', 0), ('scroll', 1)])
+
+    def test_render_supersedes_an_earlier_render(self):
+        log = []
+        self.scheduler.render(steps(log, 'old', 3))
+        self.scheduler.render(steps(log, 'new', 2))
+        self.widget.advance(10)
+        self.assertEqual(log, [('old', 0), ('new', 0), ('new', 1)])
+
+
+if __name__ == '__main__':
+    unittest.main()
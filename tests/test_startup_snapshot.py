@@ -0,0 +1,63 @@
+"""The startup snapshot the window paints and searches before the catalog loads
+
+    python -m unittest discover tests
+"""
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from path_record import PathRecord  # noqa: E402
+from search_index import SearchIndex  # noqa: E402
+from startup_snapshot import read_snapshot, write_snapshot  # noqa: E402
+
+RECORDS = [
+    PathRecord('🖥️ Desktop', 'C:\\Users\\Ana\\Desktop', 'User Folders'),
+    PathRecord('📁 Work', 'D:\\Work', 'Custom'),
+    PathRecord('📁 İstanbul trip', 'D:\\Photos\\İstanbul', 'Custom'),
+    PathRecord('📄 Documents', 'C:\\Users\\Ana\\Documents', 'User Folders'),
+    PathRecord('📁 Archive', 'E:\\Archive\\work', 'Backups'),
+]
+
+
+class SnapshotTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp(prefix='snapshot-')
+        self.filename = os.path.join(self.directory, 'startup_snapshot.bin')
+        write_snapshot(RECORDS, [False, True, True, False, True], {'D:\\Work': "✅"}, self.filename)
+        self.snapshot = read_snapshot(self.filename)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def test_columns(self):
+        self.assertEqual(len(self.snapshot), len(RECORDS))
+        self.assertEqual(self.snapshot.names, [record.name for record in RECORDS])
+        self.assertEqual(self.snapshot.paths, [record.path for record in RECORDS])
+        self.assertEqual(self.snapshot.statuses(), {'D:\\Work': "✅"})
+        self.assertEqual(self.snapshot.groups(), {'User Folders': [0, 3], 'Custom': [1, 2], 'Backups': [4]})
+
+    def test_search_matches_the_search_index(self):
+        index = SearchIndex(RECORDS)
+        for query in ('work', 'W', 'ana', 'istanbul', 'i̇stanbul', 'photos\\i', 'e:\\', 'nothing', 'a'):
+            for limit in (1, 2, 1000):
+                records, complete = index.search(query, limit)
+                indexes, snapshot_complete = self.snapshot.search(query, limit)
+                self.assertEqual([self.snapshot.paths[i] for i in indexes], [record.path for record in records],
+                                 f"{query!r} limit {limit}")
+                self.assertEqual(snapshot_complete, complete, f"{query!r} limit {limit}")
+
+    def test_damaged_snapshot_is_ignored(self):
+        with open(self.filename, "r+b") as f:
+            f.truncate(os.path.getsize(self.filename) // 2)
+        self.assertIsNone(read_snapshot(self.filename))
+        self.assertIsNone(read_snapshot(os.path.join(self.directory, 'missing.bin')))
+
+
+if __name__ == '__main__':
+    unittest.main()
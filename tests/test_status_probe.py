@@ -0,0 +1,81 @@
+"""StatusProber against a share that never answers
+
+    python -m unittest discover tests
+"""
+import os
+import sys
+import threading
+import time
+import unittest
+from unittest import mock
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import status_probe  # noqa: E402
+from status_probe import STATUS_OK, STATUS_TIMEOUT, StatusProber  # noqa: E402
+
+TIMEOUT_S = 0.2
+WAIT_S = 5.0
+
+
+class StatusProberTest(unittest.TestCase):
+
+    def setUp(self):
+        self.dead_share = threading.Event()  # set to let the hung checks return
+        real_exists = os.path.exists
+
+        def exists(path):
+            if path.startswith('/dead/'):
+                self.dead_share.wait()
+                return False
+            return real_exists(path)
+
+        patcher = mock.patch.object(status_probe.os.path, 'exists', exists)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self.dead_share.set)
+
+    def poll_until(self, prober, paths):
+        """Statuses polled until every one of paths has a final status"""
+        statuses = {}
+        deadline = time.monotonic() + WAIT_S
+        while time.monotonic() < deadline and not set(paths) <= set(statuses):
+            statuses.update(prober.poll())
+            time.sleep(0.02)
+        return statuses
+
+    def test_probes_behind_stuck_workers_still_run(self):
+        prober = StatusProber(workers=2, timeout=TIMEOUT_S)
+        dead = [f"/dead/{n}" for n in range(4)]
+        for path in dead + [ROOT]:
+            prober.probe(path)
+        statuses = self.poll_until(prober, dead + [ROOT])
+        self.assertEqual(statuses.get(ROOT), STATUS_OK)
+        self.assertEqual({statuses.get(path) for path in dead}, {STATUS_TIMEOUT})
+
+    def test_spares_retire_once_the_share_answers(self):
+        prober = StatusProber(workers=2, timeout=TIMEOUT_S)
+        for n in range(2):
+            prober.probe(f"/dead/{n}")
+        self.poll_until(prober, ['/dead/0', '/dead/1'])
+        self.assertEqual(prober.spares, 2)
+        self.dead_share.set()
+        deadline = time.monotonic() + WAIT_S
+        while prober.spares and time.monotonic() < deadline:
+            prober.poll()
+            time.sleep(0.02)
+        self.assertEqual(prober.spares, 0)
+
+    def test_queued_probes_time_out_once_spares_run_out(self):
+        with mock.patch.object(status_probe, 'MAX_SPARE_WORKERS', 1):
+            prober = StatusProber(workers=1, timeout=TIMEOUT_S)
+            dead = [f"/dead/{n}" for n in range(4)]
+            for path in dead:
+                prober.probe(path)
+            statuses = self.poll_until(prober, dead)
+        self.assertEqual({statuses.get(path) for path in dead}, {STATUS_TIMEOUT})
+
+
+if __name__ == '__main__':
+    unittest.main()
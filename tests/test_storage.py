@@ -0,0 +1,124 @@
+"""Saved paths: migration from saved_paths.json, old formats and crash-safe commits
+
+    python -m unittest discover tests
+"""
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import storage  # noqa: E402
+from path_record import PathRecord  # noqa: E402
+from path_store import PathStore  # noqa: E402
+from storage import CUSTOM_CATEGORY, JsonStorage, SqliteStorage, StorageError  # noqa: E402
+from usage_log import UsageLog  # noqa: E402
+
+
+def paths(records):
+    return [record.path for record in records]
+
+
+class StorageTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp(prefix='storage-')
+        self.json_file = os.path.join(self.directory, 'saved_paths.json')
+        self.db_file = os.path.join(self.directory, 'saved_paths.db')
+
+    def tearDown(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def write_json(self, text):
+        with open(self.json_file, "w", encoding='utf-8') as f:
+            f.write(text)
+
+    def open_sqlite(self):
+        store = SqliteStorage(self.db_file, legacy_file=self.json_file)
+        self.addCleanup(store.close)
+        return store
+
+    def test_migration_imports_once(self):
+        self.write_json(json.dumps({'custom_paths': [
+            {'name': 'Work', 'path': '/work', 'category': 'Projects'},
+            '/old/style',
+        ]}))
+        store = self.open_sqlite()
+        records = store.load()
+        self.assertEqual(paths(records), ['/work', '/old/style'])
+        self.assertEqual(records[1].name, 'style')
+        self.assertEqual(records[1].category, CUSTOM_CATEGORY)
+        # A path removed after the migration does not come back from the old file
+        store.remove('/work')
+        store.close()
+        self.assertEqual(paths(self.open_sqlite().load()), ['/old/style'])
+
+    def test_corrupt_legacy_file_is_reported_and_moved_aside(self):
+        self.write_json('{"custom_paths": [')
+        store = self.open_sqlite()
+        with self.assertRaises(StorageError) as raised:
+            store.load()
+        self.assertIn('corrupt', str(raised.exception))
+        self.assertFalse(os.path.exists(self.json_file))
+        self.assertTrue(os.path.exists(f"{self.json_file}.corrupt"))
+        # Reported once; saving works and the next start is quiet
+        self.assertEqual(store.load(), [])
+        store.add(PathRecord('New', '/new', CUSTOM_CATEGORY))
+        store.close()
+        self.assertEqual(paths(self.open_sqlite().load()), ['/new'])
+
+    def test_corrupt_legacy_file_reaches_load_error(self):
+        self.write_json('not json')
+        usage = UsageLog(os.path.join(self.directory, 'usage.txt'), os.path.join(self.directory, 'scores.json'))
+        path_store = PathStore(self.open_sqlite(), usage=usage)
+        path_store.load()
+        self.assertIsInstance(path_store.load_error, StorageError)
+        self.assertTrue(len(path_store) > 0)  # The defaults are still there
+
+    def test_json_old_string_list(self):
+        self.write_json(json.dumps({'custom_paths': ['/a', '/b/']}))
+        records = JsonStorage(self.json_file).load()
+        self.assertEqual(paths(records), ['/a', '/b/'])
+        self.assertEqual([record.name for record in records], ['a', '/b/'])
+
+    def test_json_corrupt_file_is_moved_aside(self):
+        self.write_json('{')
+        with self.assertRaises(StorageError):
+            JsonStorage(self.json_file).load()
+        self.assertTrue(os.path.exists(f"{self.json_file}.corrupt"))
+
+    def test_json_failed_write_keeps_the_old_file(self):
+        json_storage = JsonStorage(self.json_file)
+        json_storage.load()
+        json_storage.add(PathRecord('A', '/a', CUSTOM_CATEGORY))
+        with open(self.json_file, "rb") as f:
+            before = f.read()
+        # A crash between writing the temporary file and renaming it over the store
+        with mock.patch.object(storage.os, 'replace', side_effect=OSError("disk full")):
+            with self.assertRaises(StorageError):
+                json_storage.add(PathRecord('B', '/b', CUSTOM_CATEGORY))
+        with open(self.json_file, "rb") as f:
+            self.assertEqual(f.read(), before)
+        self.assertEqual(paths(JsonStorage(self.json_file).load()), ['/a'])
+
+    def test_sqlite_transaction_is_all_or_nothing(self):
+        store = self.open_sqlite()
+        store.load()
+        with self.assertRaises(RuntimeError):
+            with store.transaction():
+                store.add(PathRecord('A', '/a', CUSTOM_CATEGORY))
+                store.add(PathRecord('B', '/b', CUSTOM_CATEGORY))
+                raise RuntimeError("crashed mid-import")
+        self.assertEqual(store.load(), [])
+        store.add_many([PathRecord('A', '/a', CUSTOM_CATEGORY), PathRecord('B', '/b', CUSTOM_CATEGORY)])
+        store.close()
+        self.assertEqual(paths(self.open_sqlite().load()), ['/a', '/b'])
+
+
+if __name__ == '__main__':
+    unittest.main()
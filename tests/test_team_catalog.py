@@ -0,0 +1,139 @@
+"""TeamCatalog against the stand-in server in team_catalog_server.py
+
+    python -m unittest discover tests
+"""
+import json
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from team_catalog import TEAM_CATEGORY, TeamCatalog, parse_changes, parse_records  # noqa: E402
+from team_catalog_server import StandInHandler, StandInServer  # noqa: E402
+
+
+class RecordingHandler(StandInHandler):
+    """Keeps (status, request path, document) of every reply instead of logging it"""
+
+    def reply(self, code, etag, last_modified, body=b''):
+        self.server.replies.append((code, self.path, json.loads(body) if body else None))
+        super().reply(code, etag, last_modified, body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TeamCatalogServerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp(prefix='team-catalog-')
+        self.filename = os.path.join(self.directory, 'catalog.json')
+        self.cache_file = os.path.join(self.directory, 'cache.json')
+        self.write_catalog(['/team/a', '/team/b'])
+        self.server = StandInServer(self.filename, ('127.0.0.1', 0))
+        self.server.RequestHandlerClass = RecordingHandler
+        self.server.replies = []
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}/catalog"
+        self.catalog = TeamCatalog(self.url, cache_file=self.cache_file)
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def write_catalog(self, paths):
+        with open(self.filename, "w", encoding='utf-8') as f:
+            json.dump({'custom_paths': [{'name': os.path.basename(path), 'path': path} for path in paths]}, f)
+
+    def last_reply(self):
+        return self.server.replies[-1]
+
+    def cached_paths(self, catalog=None):
+        return sorted(record.path for record in (catalog or self.catalog).cached())
+
+    def test_sync(self):
+        # First check: the whole document
+        self.assertTrue(self.catalog.check())
+        code, path, document = self.last_reply()
+        self.assertEqual(code, 200)
+        self.assertIn('custom_paths', document)
+        ops = self.catalog.poll()
+        self.assertEqual(sorted((op, record.path) for op, record in ops), [('add', '/team/a'), ('add', '/team/b')])
+        self.assertEqual({record.category for op, record in ops}, {TEAM_CATEGORY})
+
+        # Nothing changed: a 304 and no changes
+        self.assertFalse(self.catalog.check())
+        self.assertEqual(self.last_reply()[0], 304)
+        self.assertEqual(self.catalog.poll(), [])
+
+        # An edit: only the changes since the version the client has
+        self.write_catalog(['/team/a', '/team/c'])
+        self.assertTrue(self.catalog.check())
+        code, path, document = self.last_reply()
+        self.assertEqual(code, 200)
+        self.assertIn('since=v1', path)
+        self.assertEqual(document['since'], 'v1')
+        self.assertNotIn('custom_paths', document)
+        ops = [(op, value if op == 'remove' else value.path) for op, value in self.catalog.poll()]
+        self.assertEqual(sorted(ops), [('add', '/team/c'), ('remove', '/team/b')])
+        self.assertEqual(self.cached_paths(), ['/team/a', '/team/c'])
+
+        # A version the server never had: the whole document again
+        self.write_catalog(['/team/c', '/team/d'])
+        self.catalog.version = 'v99'
+        self.catalog.etag = self.catalog.last_modified = None
+        self.assertTrue(self.catalog.check())
+        code, path, document = self.last_reply()
+        self.assertEqual(code, 200)
+        self.assertIn('custom_paths', document)
+        self.assertEqual(self.catalog.version, 'v3')
+        self.assertEqual(self.cached_paths(), ['/team/c', '/team/d'])
+
+        # Offline: the next start still has the last copy
+        self.server.shutdown()
+        self.server.server_close()
+        offline = TeamCatalog(self.url, cache_file=self.cache_file)
+        self.assertEqual(self.cached_paths(offline), ['/team/c', '/team/d'])
+        self.assertFalse(offline.check())
+        self.assertIsNotNone(offline.error)
+        self.assertEqual(offline.poll(), [])
+
+
+class TeamCatalogDocumentTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp(prefix='team-catalog-')
+        self.filename = os.path.join(self.directory, 'catalog.json')
+
+    def tearDown(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def test_bad_changes_are_rejected(self):
+        for changes in ([1], None, [{'op': 'add'}], [{'op': 'remove'}], [{'op': 'rename', 'path': '/x'}],
+                        [{'op': 'add', 'path': '/x', 'name': 3}]):
+            with self.assertRaises(ValueError):
+                parse_changes(changes)
+        for entries in ({'path': '/x'}, [None], ['/x'], [{'path': 7}]):
+            with self.assertRaises(ValueError):
+                parse_records(entries)
+
+    def test_bad_document_keeps_the_cached_copy(self):
+        catalog = TeamCatalog(self.filename, cache_file=os.path.join(self.directory, 'cache.json'))
+        with open(self.filename, "w", encoding='utf-8') as f:
+            json.dump({'custom_paths': [{'path': '/team/a'}]}, f)
+        self.assertTrue(catalog.check())
+        with open(self.filename, "w", encoding='utf-8') as f:
+            json.dump({'custom_paths': [{'path': '/team/a'}, 1]}, f)
+        self.assertFalse(catalog.check())
+        self.assertIsNotNone(catalog.error)
+        self.assertEqual([record.path for record in catalog.cached()], ['/team/a'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,150 @@
+"""Treeview operations TreeReconciler spends per refresh
+
+    python -m unittest discover tests
+"""
+import itertools
+import os
+import sys
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from tree_diff import TreeReconciler  # noqa: E402
+
+
+class FakeTree:
+    """The part of ttk.Treeview TreeReconciler uses, kept as plain lists"""
+
+    def __init__(self):
+        self.ids = itertools.count(1)
+        self.children = {'': []}
+        self.parents = {}
+        self.rows = {}     # item -> (text, values)
+
+    def insert(self, parent, index, text='', values=(), open=False):
+        item = f"I{next(self.ids)}"
+        self.children[parent].insert(index, item)
+        self.children[item] = []
+        self.parents[item] = parent
+        self.rows[item] = (text, tuple(values))
+        return item
+
+    def move(self, item, parent, index):
+        self.children[self.parents[item]].remove(item)
+        self.children[parent].insert(index, item)
+        self.parents[item] = parent
+
+    def item(self, item, text, values):
+        self.rows[item] = (text, tuple(values))
+
+    def delete(self, *items):
+        for item in items:
+            if item not in self.rows:
+                continue  # Went with a parent deleted earlier in the call
+            for child in list(self.children[item]):
+                self.delete(child)
+            self.children[self.parents.pop(item)].remove(item)
+            del self.children[item]
+            del self.rows[item]
+
+    def shown(self, parent=''):
+        """(text, values, children) for every row, in display order"""
+        return [(self.rows[item][0], self.rows[item][1], self.shown(item)) for item in self.children[parent]]
+
+
+def categories(layout):
+    """Target nodes for {category: [(name, path), ...]}, like update_listbox builds"""
+    target = []
+    for category, paths in layout.items():
+        target.append((('category', category), None, category, ()))
+        for name, path in paths:
+            target.append((('path', path), ('category', category), name, (path, '')))
+    return target
+
+
+class TreeReconcilerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tree = FakeTree()
+        self.sync = TreeReconciler(self.tree)
+        self.layout = {
+            'Windows': [('Desktop', 'C:\\Desktop'), ('Documents', 'C:\\Documents')],
+            'Custom': [('Work', 'D:\\Work'), ('Games', 'D:\\Games')],
+        }
+        self.sync.apply(categories(self.layout))
+
+    def assert_shown(self, layout):
+        expected = [(category, (), [(name, (path, ''), []) for name, path in paths])
+                    for category, paths in layout.items()]
+        self.assertEqual(self.tree.shown(), expected)
+
+    def test_first_refresh_inserts_every_row(self):
+        self.assertEqual(self.sync.stats, {'insert': 6})
+        self.assert_shown(self.layout)
+
+    def test_unchanged_refresh_costs_nothing(self):
+        self.sync.apply(categories(self.layout))
+        self.assertEqual(sum(self.sync.stats.values()), 0)
+        self.assert_shown(self.layout)
+
+    def test_insert(self):
+        self.layout['Custom'].insert(1, ('Music', 'D:\\Music'))
+        self.sync.apply(categories(self.layout))
+        self.assertEqual(self.sync.stats, {'insert': 1})
+        self.assert_shown(self.layout)
+
+    def test_delete(self):
+        del self.layout['Windows'][0]
+        self.sync.apply(categories(self.layout))
+        self.assertEqual(self.sync.stats, {'delete': 1})
+        self.assert_shown(self.layout)
+
+    def test_deleting_a_category_takes_its_rows_in_one_call(self):
+        del self.layout['Custom']
+        self.sync.apply(categories(self.layout))
+        # Deleting the category row takes both rows under it along
+        self.assertEqual(self.sync.stats, {'delete': 1})
+        self.assert_shown(self.layout)
+
+    def test_move(self):
+        self.layout['Custom'].reverse()
+        self.sync.apply(categories(self.layout))
+        self.assertEqual(self.sync.stats, {'move': 1})
+        self.assert_shown(self.layout)
+
+    def test_move_to_another_parent(self):
+        self.layout['Windows'].append(self.layout['Custom'].pop(0))
+        self.sync.apply(categories(self.layout))
+        self.assertEqual(self.sync.stats, {'move': 1})
+        self.assert_shown(self.layout)
+
+    def test_update(self):
+        self.layout['Custom'][0] = ('Office', 'D:\\Work')
+        self.sync.apply(categories(self.layout))
+        self.assertEqual(self.sync.stats, {'update': 1})
+        self.assert_shown(self.layout)
+
+    def test_search_results_replace_the_categories(self):
+        # A search shows matches under one heading; rows keep their items and move
+        layout = {'Search': [('Documents', 'C:\\Documents'), ('Games', 'D:\\Games')]}
+        self.sync.apply(categories(layout))
+        self.assertEqual(self.sync.stats, {'insert': 1, 'move': 2, 'delete': 4})
+        self.assert_shown(layout)
+
+        self.sync.apply(categories(self.layout))
+        self.assertEqual(self.sync.stats, {'insert': 4, 'move': 2, 'delete': 1})
+        self.assert_shown(self.layout)
+
+    def test_chunked_apply_yields_between_chunks(self):
+        layout = {'Many': [(f"p{n}", f"C:\\p{n}") for n in range(10)]}
+        tree = FakeTree()
+        sync = TreeReconciler(tree)
+        steps = list(sync.apply_steps(categories(layout), chunk=4))
+        self.assertEqual(len(steps), 2)
+        self.assertEqual(sync.stats, {'insert': 11})
+        self.assertEqual(len(tree.shown()[0][2]), 10)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,106 @@
+"""Frecency scores: decay, compaction and sharing the log between processes
+
+    python -m unittest discover tests
+"""
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from usage_log import UsageLog  # noqa: E402
+
+HALF_LIFE_S = 3600.0
+
+
+class UsageLogTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp(prefix='usage-log-')
+        self.log_file = os.path.join(self.directory, 'usage_log.txt')
+        self.scores_file = os.path.join(self.directory, 'usage_scores.json')
+
+    def tearDown(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def open_log(self, compact_every=100):
+        usage = UsageLog(self.log_file, self.scores_file, half_life=HALF_LIFE_S, compact_every=compact_every)
+        usage.load()
+        return usage
+
+    def record_elsewhere(self, *paths, compact_every=100):
+        """Record opens from another process, the way a second window or the CLI does"""
+        code = (f"import sys; sys.path.insert(0, {ROOT!r}); from usage_log import UsageLog; "
+                f"usage = UsageLog({self.log_file!r}, {self.scores_file!r}, half_life={HALF_LIFE_S!r}, "
+                f"compact_every={compact_every!r}); usage.load(); "
+                f"[usage.record(path) for path in {list(paths)!r}]; usage.flush()")
+        subprocess.run([sys.executable, '-c', code], check=True)
+
+    def test_older_opens_count_less(self):
+        usage = self.open_log()
+        now = time.time()
+        usage.record('/old', when=now - HALF_LIFE_S)
+        usage.record('/new', when=now)
+        self.assertAlmostEqual(usage.scores['/old'] / usage.scores['/new'], 0.5)
+        # Two opens three half-lives ago still lose to one open a half-life ago
+        usage.record('/older', when=now - 3 * HALF_LIFE_S)
+        usage.record('/older', when=now - 3 * HALF_LIFE_S)
+        self.assertEqual(usage.top(3), ['/new', '/old', '/older'])
+        self.assertEqual(usage.top(3, keep=lambda path: path != '/new'), ['/old', '/older'])
+
+    def test_flush_writes_the_log_and_a_reload_replays_it(self):
+        usage = self.open_log()
+        usage.record('/a')
+        usage.record('/a')
+        usage.record('/b')
+        usage.flush()
+        with open(self.log_file, encoding='utf-8') as f:
+            self.assertEqual(len(f.readlines()), 3)
+        reloaded = self.open_log()
+        self.assertEqual(reloaded.top(2), ['/a', '/b'])
+        self.assertAlmostEqual(reloaded.scores['/a'], usage.scores['/a'], places=3)
+
+    def test_compaction_folds_the_log_into_the_scores_file(self):
+        usage = self.open_log(compact_every=3)
+        now = time.time()
+        usage.record('/forgotten', when=now - 20 * HALF_LIFE_S)  # Below MIN_SCORE once rebased
+        usage.record('/a', when=now)
+        usage.record('/b', when=now - HALF_LIFE_S)
+        usage.flush()
+        self.assertEqual(os.path.getsize(self.log_file), 0)
+        self.assertTrue(os.path.exists(self.scores_file))
+        self.assertNotIn('/forgotten', usage.scores)
+        reloaded = self.open_log(compact_every=3)
+        self.assertEqual(set(reloaded.scores), {'/a', '/b'})
+        self.assertAlmostEqual(reloaded.scores['/b'] / reloaded.scores['/a'], 0.5, places=3)
+
+    def test_refresh_picks_up_other_processes(self):
+        usage = self.open_log()
+        usage.record('/mine')
+        usage.flush()
+        self.record_elsewhere('/theirs', '/theirs')
+        self.assertEqual(usage.refresh(), {'/theirs'})
+        self.assertEqual(usage.top(2), ['/theirs', '/mine'])
+        self.assertEqual(usage.refresh(), set())
+
+        # Their compaction replaces the scores file; nothing is counted twice
+        before = dict(usage.scores)
+        self.record_elsewhere('/theirs', compact_every=1)
+        changed = usage.refresh()
+        self.assertIn('/theirs', changed)
+        self.assertAlmostEqual(usage.scores['/mine'], before['/mine'], places=3)
+        self.assertAlmostEqual(usage.scores['/theirs'] / before['/theirs'], 1.5, places=2)
+
+    def test_flush_with_nothing_recorded_touches_no_files(self):
+        usage = self.open_log()
+        usage.flush()
+        self.assertEqual(os.listdir(self.directory), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
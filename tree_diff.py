@@ -0,0 +1,143 @@
+from collections import Counter
+
+
+class TreeReconciler:
+    """Bring a ttk.Treeview to a target state with as few operations as possible
+
+    Every node has a caller-chosen key and keeps the same Treeview item for
+    as long as the key stays in the target, so a refresh only costs the
+    inserts, deletes, moves and value updates that actually changed.
+    """
+
+    def __init__(self, tree):
+        self.tree = tree
+        self.items = {}             # key -> item id
+        self.nodes = {}             # item id -> [key, parent item, text, values]
+        self.children = {'': []}    # item id -> ordered child item ids
+        self.stats = Counter()      # Treeview operations done by the last apply()
+
+    def __contains__(self, key):
+        return key in self.items
+
+    def item(self, key):
+        return self.items.get(key)
+
+    def key_of(self, item):
+        node = self.nodes.get(item)
+        return node[0] if node else None
+
+    def apply(self, target):
+        """Reconcile the tree with target
+
+        target is a sequence of (key, parent_key, text, values) in display
+        order, parents before their children; parent_key is None for
+        top-level nodes.
+        """
+        for _ in self.apply_steps(target):
+            pass
+
+    def apply_steps(self, target, chunk=None):
+        """Like apply(), but yield after every chunk Treeview operations
+
+        The model matches the tree at every yield, so a caller may drop the
+        generator halfway and start over with a new target.
+        """
+        self.stats = Counter()
+        target = list(target)
+        wanted = {node[0] for node in target}
+
+        # Drop stale subtrees first so they don't shift sibling positions.
+        # Stale parents that still hold wanted children are emptied below
+        # and deleted afterwards.
+        doomed = []
+        deferred = []
+        for key in [key for key in self.items if key not in wanted]:
+            item = self.items.get(key)
+            if item is None:
+                continue  # Already gone with its parent
+            if self._has_wanted(item, wanted):
+                deferred.append(item)
+            else:
+                doomed.append(item)
+                self._forget(item)
+        self._delete(doomed)
+
+        # Place each node right after its previous sibling in the target
+        placed = Counter()
+        budget = chunk
+        for key, parent_key, text, values in target:
+            if chunk and sum(self.stats.values()) >= budget:
+                budget += chunk
+                yield
+            parent = self.items[parent_key] if parent_key is not None else ''
+            index = placed[parent]
+            placed[parent] += 1
+            values = tuple(values)
+
+            item = self.items.get(key)
+            if item is None:
+                item = self.tree.insert(parent, index, text=text, values=values, open=True)
+                self.stats['insert'] += 1
+                self.items[key] = item
+                self.nodes[item] = [key, parent, text, values]
+                self.children[item] = []
+                self.children.setdefault(parent, []).insert(index, item)
+                continue
+
+            node = self.nodes[item]
+            siblings = self.children[parent]
+            if node[1] != parent or index >= len(siblings) or siblings[index] != item:
+                self.children[node[1]].remove(item)
+                self.tree.move(item, parent, index)
+                self.stats['move'] += 1
+                node[1] = parent
+                siblings.insert(index, item)
+
+            if node[2] != text or node[3] != values:
+                self.tree.item(item, text=text, values=values)
+                self.stats['update'] += 1
+                node[2] = text
+                node[3] = values
+
+        for item in deferred:
+            self._forget(item)
+        self._delete(deferred)
+
+    def update(self, key, text=None, values=None):
+        """Change a single node in place; returns False if key is not shown"""
+        item = self.items.get(key)
+        if item is None:
+            return False
+        node = self.nodes[item]
+        text = node[2] if text is None else text
+        values = node[3] if values is None else tuple(values)
+        if node[2] != text or node[3] != values:
+            self.tree.item(item, text=text, values=values)
+            node[2] = text
+            node[3] = values
+        return True
+
+    def _has_wanted(self, item, wanted):
+        for child in self.children.get(item, ()):
+            node = self.nodes.get(child)
+            if node and (node[0] in wanted or self._has_wanted(child, wanted)):
+                return True
+        return False
+
+    def _forget(self, item):
+        """Drop item and its subtree from the model, not from the tree"""
+        for child in self.children.pop(item, ()):
+            if child in self.nodes:
+                self._forget(child)
+        key = self.nodes.pop(item)[0]
+        del self.items[key]
+
+    def _delete(self, items):
+        """Delete already forgotten items from the tree in one call"""
+        if not items:
+            return
+        self.tree.delete(*items)
+        self.stats['delete'] += len(items)
+        for parent, children in self.children.items():
+            if any(child not in self.nodes for child in children):
+                self.children[parent] = [child for child in children if child in self.nodes]
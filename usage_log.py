@@ -0,0 +1,201 @@
+import heapq
+import json
+import os
+import threading
+import time
+
+from storage import file_lock
+
+USAGE_LOG = "usage_log.txt"
+USAGE_SCORES = "usage_scores.json"
+HALF_LIFE_S = 14 * 24 * 3600  # an open counts half as much after two weeks
+COMPACT_EVERY = 500           # log lines before they are folded into the scores file
+MIN_SCORE = 0.01              # scores below this are forgotten at compaction
+
+
+class UsageLog:
+    """Frecency scores of opened paths, kept in an append-only log
+
+    Each open appends one "time<TAB>path" line to the log, which is all a
+    launch costs. Every COMPACT_EVERY lines the log is folded into the
+    scores file and emptied. Scores decay exponentially with HALF_LIFE_S.
+    All of them are measured against one reference time, so they stay
+    comparable without being recomputed as time passes. Ranking is a dict
+    lookup per path; the log is never re-read per keystroke.
+
+    Several processes may share the files. Appends and compaction hold
+    the log's lock file, so compaction cannot drop another process's
+    line, and refresh() picks up what others appended.
+
+    record() only updates the scores in memory. A writer thread appends
+    the lines and compacts, so an open never waits on the lock file or
+    the disk. Call flush() before exiting to write what is still queued.
+    """
+
+    def __init__(self, log_file=USAGE_LOG, scores_file=USAGE_SCORES, half_life=HALF_LIFE_S,
+                 compact_every=COMPACT_EVERY):
+        self.log_file = log_file
+        self.scores_file = scores_file
+        self.half_life = half_life
+        self.compact_every = compact_every
+        self.lock = threading.RLock()
+        self.scores = {}      # path -> score at the reference time
+        self.reference = time.time()
+        self.offset = 0       # bytes of the log already applied
+        self.lines = 0        # log lines applied since the last compaction
+        self.scores_signature = None
+        self.pending = []     # (time, path) of opens counted but not written yet
+        self.wake = threading.Event()
+        self.writer = None
+
+    def weight(self, when):
+        """What one open at when adds, measured at the reference time"""
+        return 2.0 ** ((when - self.reference) / self.half_life)
+
+    def load(self):
+        """Read the scores file and replay the log on top of it"""
+        with self.lock:
+            self.read_all()
+            if self.lines >= self.compact_every:
+                self.start_writer()
+
+    def read_all(self):
+        self.scores = {}
+        self.reference = time.time()
+        self.offset = 0
+        self.lines = 0
+        self.scores_signature = file_signature(self.scores_file)
+        try:
+            with open(self.scores_file, "r", encoding='utf-8') as f:
+                data = json.load(f)
+            self.reference = float(data['reference'])
+            self.scores = {path: float(score) for path, score in data['scores'].items()}
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            pass  # No usage yet, or a damaged file: start counting afresh
+        self.read_log()
+        # Opens not written yet are in neither file
+        for when, path in self.pending:
+            self.scores[path] = self.scores.get(path, 0.0) + self.weight(when)
+
+    def read_log(self):
+        """Apply lines appended since the last read; returns the paths they touched"""
+        try:
+            with open(self.log_file, "rb") as f:
+                f.seek(self.offset)
+                data = f.read()
+        except OSError:
+            return set()
+        # A line still being written is picked up next time
+        end = data.rfind(b"\n") + 1
+        self.offset += end
+        touched = set()
+        for line in data[:end].decode('utf-8', 'replace').splitlines():
+            when, _, path = line.partition("\t")
+            try:
+                score = self.weight(float(when))
+            except ValueError:
+                continue
+            if path:
+                self.scores[path] = self.scores.get(path, 0.0) + score
+                touched.add(path)
+                self.lines += 1
+        return touched
+
+    def refresh(self):
+        """Pick up opens recorded by other processes; returns the paths whose scores changed"""
+        with self.lock:
+            if file_signature(self.scores_file) != self.scores_signature:
+                # Another process compacted; its scores file has everything
+                old = self.scores
+                self.read_all()
+                return {path for path in set(old) | set(self.scores) if old.get(path) != self.scores.get(path)}
+            return self.read_log()
+
+    def record(self, path, when=None):
+        """Count one open of path now; the writer thread saves it"""
+        when = time.time() if when is None else when
+        with self.lock:
+            self.scores[path] = self.scores.get(path, 0.0) + self.weight(when)
+            self.pending.append((when, path))
+            self.start_writer()
+
+    def start_writer(self):
+        if self.writer is None:
+            self.writer = threading.Thread(target=self._write_loop, name="usage-log", daemon=True)
+            self.writer.start()
+        self.wake.set()
+
+    def _write_loop(self):
+        while True:
+            self.wake.wait()
+            self.wake.clear()
+            self.flush()
+
+    def flush(self):
+        """Append the opens recorded so far to the log, compacting when due"""
+        with self.lock:
+            if not self.pending and self.lines < self.compact_every:
+                return  # Nothing to write: leave the lock file uncreated, e.g. for `list`
+        # The lock file first: waiting for another process must not hold up record()
+        try:
+            with file_lock(self.log_file):
+                with self.lock:
+                    if self.pending:
+                        self.refresh()  # Step over other processes' lines first
+                        data = "".join(f"{when:.3f}\t{path}\n" for when, path in self.pending).encode('utf-8')
+                        with open(self.log_file, "ab") as f:
+                            f.write(data)
+                        self.offset += len(data)
+                        self.lines += len(self.pending)
+                        self.pending = []
+                    due = self.lines >= self.compact_every
+        except OSError:
+            with self.lock:
+                self.pending = []  # Usage is a nicety; never fail an open over it
+            return
+        if due:
+            self.compact()
+
+    def compact(self):
+        """Fold the log into the scores file, rebased to now, and empty the log"""
+        try:
+            with file_lock(self.log_file):
+                with self.lock:
+                    self.refresh()
+                    now = time.time()
+                    factor = 2.0 ** ((self.reference - now) / self.half_life)
+                    scores = {}
+                    for path, score in self.scores.items():
+                        if score * factor >= MIN_SCORE:
+                            scores[path] = score * factor
+                    temp_file = f"{self.scores_file}.tmp"
+                    with open(temp_file, "w", encoding='utf-8') as f:
+                        json.dump({'reference': now, 'scores': scores}, f, ensure_ascii=False)
+                    # Empty the log first: a reader that refresh()es without the lock
+                    # may then briefly miss opens, but can never count them twice
+                    open(self.log_file, "wb").close()
+                    os.replace(temp_file, self.scores_file)
+                    self.scores = scores
+                    self.reference = now
+                    self.offset = 0
+                    self.lines = 0
+                    self.pending = []  # Counted in the scores file now
+                    self.scores_signature = file_signature(self.scores_file)
+        except OSError:
+            return  # Try again after the next batch of opens
+
+    def top(self, limit, keep=None):
+        """The limit highest scoring paths for which keep(path) holds, best first"""
+        with self.lock:
+            items = list(self.scores.items())
+        if keep is not None:
+            items = [item for item in items if keep(item[0])]
+        return [path for path, score in heapq.nlargest(limit, items, key=lambda item: item[1])]
+
+
+def file_signature(filename):
+    try:
+        st = os.stat(filename)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
@@ -0,0 +1,210 @@
+from tkinter import ttk
+
+DEFAULT_ROW_HEIGHT = 20
+SHIFT_MASK = 0x0001
+CONTROL_MASK = 0x0004
+
+
+class VirtualList:
+    """Show only the rows around the viewport of a ttk.Treeview
+
+    Takes the same (key, parent_key, text, values) rows as TreeReconciler,
+    flattens them and hands a window of page + overscan rows to
+    materialize(). The scrollbar, mouse wheel and arrow keys move the
+    window instead of scrolling real Treeview items, so the number of
+    widget items stays flat however large the catalog gets.
+    """
+
+    def __init__(self, tree, scrollbar, reconciler, materialize, threshold=5000, overscan=10):
+        self.tree = tree
+        self.scrollbar = scrollbar
+        self.reconciler = reconciler
+        self.materialize = materialize
+        self.threshold = threshold
+        self.overscan = overscan
+        self.active = False
+
+        self.rows = []
+        self.containers = set()  # keys of rows that have children
+        self.collapsed = set()   # container keys folded by the user
+        self.visible = []        # indexes into rows, collapsed children skipped
+        self.position = {}       # key -> index into visible
+        self.top = 0
+        self.page = 1
+        self.selected_keys = set()
+        self.cursor = None       # key the arrow keys move from
+        self.replacing = False   # a plain click is about to replace the selection
+
+        style = ttk.Style()
+        self.row_height = int(style.lookup(tree.cget('style'), 'rowheight') or DEFAULT_ROW_HEIGHT)
+
+        tree.bind('<<TreeviewSelect>>', self.on_select, add='+')
+        tree.bind('<Configure>', self.on_configure, add='+')
+        tree.bind('<Button-1>', self.on_click, add='+')
+        tree.bind('<MouseWheel>', self.on_wheel, add='+')
+        tree.bind('<Button-4>', self.on_wheel, add='+')
+        tree.bind('<Button-5>', self.on_wheel, add='+')
+        for key in ('<Up>', '<Down>', '<Prior>', '<Next>', '<Home>', '<End>'):
+            tree.bind(key, self.on_key, add='+')
+
+    def show(self, rows):
+        """Take over rendering of rows; returns False if they are few enough to show directly"""
+        rows = list(rows)
+        if len(rows) < self.threshold:
+            if self.active:
+                self.deactivate()
+            return False
+
+        if not self.active:
+            self.activate()
+        self.rows = rows
+        self.containers = {row[1] for row in rows if row[1] is not None}
+        self.rebuild_visible()
+        self.render()
+        return True
+
+    def activate(self):
+        self.active = True
+        self.scrollbar.configure(command=self.yview)
+        self.tree.configure(yscrollcommand='')
+
+    def deactivate(self):
+        self.active = False
+        self.rows = []
+        self.visible = []
+        self.position = {}
+        self.scrollbar.configure(command=self.tree.yview)
+        self.tree.configure(yscrollcommand=self.scrollbar.set)
+
+    def rebuild_visible(self):
+        hidden = set()
+        self.visible = []
+        for index, (key, parent_key, text, values) in enumerate(self.rows):
+            if parent_key is not None and (parent_key in self.collapsed or parent_key in hidden):
+                hidden.add(key)
+                continue
+            self.visible.append(index)
+        self.position = {self.rows[index][0]: i for i, index in enumerate(self.visible)}
+
+    def flat_row(self, index):
+        key, parent_key, text, values = self.rows[index]
+        if key in self.containers:
+            text = f"{'▸' if key in self.collapsed else '▾'} {text}"
+        elif parent_key is not None:
+            text = f"    {text}"
+        return (key, None, text, values)
+
+    def render(self):
+        total = len(self.visible)
+        self.top = max(0, min(self.top, total - self.page))
+        window = self.visible[self.top:self.top + self.page + self.overscan]
+        self.materialize([self.flat_row(index) for index in window])
+        self.tree.yview_moveto(0)
+
+        # Keep selected rows selected while they are materialized
+        items = [self.reconciler.item(key) for key in self.selected_keys]
+        items = tuple(item for item in items if item is not None)
+        current = self.tree.selection()
+        if set(items) != set(current):
+            self.tree.selection_set(items)
+
+        if total:
+            self.scrollbar.set(self.top / total, min(1.0, (self.top + self.page) / total))
+        else:
+            self.scrollbar.set(0.0, 1.0)
+
+    def scroll_to(self, top):
+        top = max(0, min(top, len(self.visible) - self.page))
+        if top != self.top:
+            self.top = top
+            self.render()
+
+    def yview(self, *args):
+        """Scrollbar command"""
+        if not args:
+            return
+        if args[0] == 'moveto':
+            self.scroll_to(int(float(args[1]) * len(self.visible)))
+        elif args[0] == 'scroll':
+            step = int(args[1]) * (self.page if args[2] == 'pages' else 1)
+            self.scroll_to(self.top + step)
+
+    def toggle(self, key):
+        if key in self.collapsed:
+            self.collapsed.discard(key)
+        else:
+            self.collapsed.add(key)
+        self.rebuild_visible()
+        self.render()
+
+    def selection(self):
+        """Selected keys in row order, or None when the tree shows every row itself"""
+        if not self.active:
+            return None
+        return [row[0] for row in self.rows if row[0] in self.selected_keys]
+
+    def on_select(self, event):
+        if not self.active:
+            return
+        selected = {self.reconciler.key_of(item) for item in self.tree.selection()}
+        selected.discard(None)
+        if not self.replacing:
+            # The tree only knows materialized rows; keep selected rows scrolled away
+            selected |= {key for key in self.selected_keys if self.reconciler.item(key) is None}
+        self.replacing = False
+        self.selected_keys = selected
+        if len(selected) == 1:
+            self.cursor = next(iter(selected))
+
+    def on_configure(self, event):
+        page = max(1, event.height // self.row_height - 1)  # Minus the heading row
+        if page != self.page:
+            self.page = page
+            if self.active:
+                self.render()
+
+    def on_click(self, event):
+        if not self.active:
+            return None
+        extend = bool(event.state & (SHIFT_MASK | CONTROL_MASK))
+        key = self.reconciler.key_of(self.tree.identify_row(event.y))
+        if key in self.containers and not extend:
+            self.toggle(key)
+            return "break"
+        if key is not None:
+            self.cursor = key
+            self.replacing = not extend
+        return None
+
+    def on_wheel(self, event):
+        if not self.active:
+            return None
+        if event.num == 4:
+            step = -3
+        elif event.num == 5:
+            step = 3
+        else:
+            step = -3 if event.delta > 0 else 3
+        self.scroll_to(self.top + step)
+        return "break"
+
+    def on_key(self, event):
+        if not self.active or not self.visible:
+            return None
+        index = self.position.get(self.cursor, self.top)
+        steps = {'Up': -1, 'Down': 1, 'Prior': -self.page, 'Next': self.page}
+        if event.keysym == 'Home':
+            index = 0
+        elif event.keysym == 'End':
+            index = len(self.visible) - 1
+        else:
+            index = max(0, min(index + steps[event.keysym], len(self.visible) - 1))
+
+        self.cursor = self.rows[self.visible[index]][0]
+        self.selected_keys = {self.cursor}
+        if index < self.top:
+            self.top = index
+        elif index >= self.top + self.page:
+            self.top = index - self.page + 1
+        self.render()
+        return "break"